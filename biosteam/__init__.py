@@ -52,6 +52,7 @@ from thermosteam import *
 import thermosteam.units_of_measure # Import the units_of_measure module to override the units_of_measure decorator.
 from ._heat_utility import UtilityAgent, HeatUtility
 from ._power_utility import PowerUtility
+from ._flash_scheduler import FlashScheduler, flash_scheduler
 from . import plots
 from .utils import *
 from ._unit import Unit
@@ -81,6 +82,7 @@ from . import _settings
 
 __all__ = (
     'Unit', 'PowerUtility', 'UtilityAgent', 'HeatUtility', 'Facility',
+    'FlashScheduler', 'flash_scheduler',
     'utils', 'units', 'facilities', 'wastewater', 'evaluation', 'Chemical', 'Chemicals', 'Stream',
     'MultiStream', 'settings', 'exceptions', 'report', 'units_of_measure',
     'process_tools', 'preferences', *_system.__all__, *_flowsheet.__all__, 
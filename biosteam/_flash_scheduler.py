@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020-2023, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+__all__ = ('FlashScheduler', 'flash_scheduler')
+
+class FlashScheduler:
+    """
+    Create a FlashScheduler object that defers vapor-liquid equilibrium
+    calculations of outlet streams which are not used by any other unit
+    (i.e., streams without a sink) until a synchronization point. Within
+    recycle loops, synchronization points are at convergence, so each
+    deferred stream is flashed once per converged loop instead of once
+    per iteration.
+
+    Flash requests are only deferred while the scheduler is enabled and
+    a system is solving a recycle loop. Otherwise, flash
+    calculations are solved immediately (the reference behavior).
+
+    """
+    __slots__ = ('enabled', 'depth', 'requests', 'deferred', 'solved')
+
+    def __init__(self):
+        #: [bool] Whether to defer flash requests.
+        self.enabled = False
+
+        #: [int] Number of nested recycle loops being solved.
+        self.depth = 0
+
+        #: [dict[Stream, Callable]] Pending flash requests by stream.
+        self.requests = {}
+
+        #: [int] Total number of deferred flash requests.
+        self.deferred = 0
+
+        #: [int] Total number of flash requests solved at synchronization points.
+        self.solved = 0
+
+    @property
+    def saved(self):
+        """[int] Number of flash calculations avoided by deferring requests."""
+        return self.deferred - self.solved - len(self.requests)
+
+    def can_defer(self, stream):
+        """Return whether the flash of a stream can be deferred."""
+        return self.enabled and self.depth > 0 and stream.sink is None
+
+    def defer(self, stream, flash):
+        """
+        Defer the flash of a stream until the next synchronization point.
+        Any pending request of the same stream is replaced.
+
+        Parameters
+        ----------
+        stream : Stream
+            Stream to flash.
+        flash : Callable[[], None]
+            Solves the flash.
+
+        """
+        self.requests[stream] = flash
+        self.deferred += 1
+
+    def synchronize(self):
+        """Solve all pending flash requests."""
+        requests = self.requests
+        while requests:
+            self.requests = {}
+            for flash in requests.values(): flash()
+            self.solved += len(requests)
+            requests = self.requests
+
+    def reset(self):
+        """Reset counters."""
+        self.deferred = self.solved = 0
+
+    def __enter__(self):
+        self.depth += 1
+        return self
+
+    def __exit__(self, type, exception, traceback):
+        self.depth -= 1
+        if exception is not None or not self.depth: self.synchronize()
+
+    def __repr__(self):
+        return f"{type(self).__name__}(enabled={self.enabled}, pending={len(self.requests)}, saved={self.saved})"
+
+
+#: [FlashScheduler] Scheduler used by heat exchangers.
+flash_scheduler = FlashScheduler()
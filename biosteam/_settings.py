@@ -125,6 +125,36 @@ def skip_simulation_of_units_with_empty_inlets(self):
 def skip_simulation_of_units_with_empty_inlets(self, skip):
     bst.Unit._skip_simulation_when_inlets_are_empty = skip
 
+@property
+def design_only_auxiliaries(self):
+    """Whether to size and cost auxiliary units (e.g., pumps and heat 
+    exchangers of reactors) from their design inputs without simulating 
+    their mass and energy balances."""
+    return bst.Unit._design_only_auxiliaries
+@design_only_auxiliaries.setter
+def design_only_auxiliaries(self, design_only):
+    bst.Unit._design_only_auxiliaries = design_only
+
+@property
+def validate_design_only_auxiliaries(self):
+    """Whether to check design-only results of auxiliary units against 
+    full simulation of auxiliary units (an error is raised if they differ)."""
+    return bst.Unit._validate_design_only_auxiliaries
+@validate_design_only_auxiliaries.setter
+def validate_design_only_auxiliaries(self, validate):
+    bst.Unit._validate_design_only_auxiliaries = validate
+
+@property
+def defer_utility_flashes(self):
+    """Whether to defer rigorous flash calculations of utility heat exchanger 
+    outlets without sinks until recycle loops converge (see 
+    :class:`~biosteam.FlashScheduler`). If False, flash calculations are 
+    solved immediately."""
+    return bst.flash_scheduler.enabled
+@defer_utility_flashes.setter
+def defer_utility_flashes(self, defer):
+    bst.flash_scheduler.enabled = defer
+
 @property
 def allocation_properties(self):
     """Defined allocation property and basis pairs for LCA."""
@@ -195,6 +225,9 @@ Settings.electricity_price = electricity_price
 Settings.skip_simulation_of_units_with_empty_inlets = skip_simulation_of_units_with_empty_inlets
 Settings.register_fee = Settings.register_credit = Settings.register_utility = register_utility
 Settings.allocation_properties = allocation_properties
+Settings.design_only_auxiliaries = design_only_auxiliaries
+Settings.validate_design_only_auxiliaries = validate_design_only_auxiliaries
+Settings.defer_utility_flashes = defer_utility_flashes
 Settings.define_allocation_property = define_allocation_property
 
 # %% Register stream utilities
@@ -17,7 +17,8 @@ from .digraph import (digraph_from_units,
                       digraph_from_system,
                       minimal_digraph,
                       surface_digraph,
-                      finalize_digraph)
+                      finalize_digraph,
+                      save_digraph)
 from thermosteam import AbstractStream, Stream, MultiStream, Chemical, PhenomenaGraph
 from thermosteam.base import SparseArray
 from . import HeatUtility, PowerUtility
@@ -27,6 +28,7 @@ from .exceptions import try_method_with_object_stamp, Converged, UnitInheritance
 from thermosteam import Network, mark_disjunction, unmark_disjunction
 from ._facility import Facility
 from ._unit import Unit
+from ._flash_scheduler import flash_scheduler
 from thermosteam.network import repr_ins_and_outs
 from . import utils
 from .utils import (
@@ -43,10 +45,13 @@ import numpy as np
 import pandas as pd
 from numpy.linalg import solve
 from scipy.integrate import solve_ivp
+from scipy.sparse import csc_matrix
+from numba import njit
 from . import report
 from thermosteam.network import temporary_units_dump, TemporaryUnit
 import os
 import openpyxl
+from threading import Thread
 import thermosteam as tmo
 if TYPE_CHECKING: 
     from ._tea import TEA
@@ -621,6 +626,232 @@ def _method_profile(self, f):
     g._original = f
     return g
 
+# %% Dynamic simulation tools
+
+_kernel_cache = {}
+
+def jit_kernel(f):
+    """Return a jitted kernel, reusing compiled kernels that share code."""
+    if hasattr(f, 'py_func'): return f
+    if f.__closure__ or f.__defaults__: return njit(f)
+    code = f.__code__
+    if code in _kernel_cache: return _kernel_cache[code]
+    _kernel_cache[code] = jitted = njit(f)
+    return jitted
+
+def group_columns(sparsity):
+    """
+    Return an array of group numbers for the columns of a sparsity pattern
+    such that no two columns in the same group share a nonzero row. Columns 
+    are grouped by greedy graph coloring so that all columns in a group can 
+    be perturbed at once when estimating a Jacobian by finite differences.
+    """
+    sparsity = csc_matrix(sparsity)
+    n_rows, n_cols = sparsity.shape
+    indptr = sparsity.indptr
+    indices = sparsity.indices
+    groups = np.empty(n_cols, dtype=int)
+    occupied = []
+    for j in range(n_cols):
+        rows = indices[indptr[j]:indptr[j + 1]]
+        for group, mask in enumerate(occupied):
+            if not mask[rows].any():
+                mask[rows] = True
+                groups[j] = group
+                break
+        else:
+            mask = np.zeros(n_rows, dtype=bool)
+            mask[rows] = True
+            groups[j] = len(occupied)
+            occupied.append(mask)
+    return groups
+
+class SteadyStateEvent:
+    """
+    Terminal event for `solve_ivp` that is triggered once the maximum 
+    relative derivative of the state, max(|dy| / (|y| + atol)), remains
+    below `rtol` for a time `window`. The time at which the system settled
+    is only updated as integration moves forward, so that the event function
+    is consistent when the solver locates the event within a step.
+    """
+    __slots__ = ('fun', 'rtol', 'atol', 'window', 't_settled', 't_last')
+    terminal = True
+    direction = -1
+    
+    def __init__(self, fun, rtol=1e-6, atol=1e-9, window=0.):
+        self.fun = fun
+        self.rtol = rtol
+        self.atol = atol
+        self.window = window
+        self.t_settled = None
+        self.t_last = -np.inf
+        
+    def __call__(self, t, y):
+        dy = self.fun(t, y)
+        residual = np.abs(dy / (np.abs(y) + self.atol)).max()
+        settled = residual <= self.rtol
+        if t >= self.t_last:
+            self.t_last = t
+            if not settled: 
+                self.t_settled = None
+            elif self.t_settled is None: 
+                self.t_settled = t
+        if not settled: 
+            return self.window + np.log(residual / self.rtol)
+        elif self.t_settled is None:
+            return self.window
+        else:
+            return self.t_settled + self.window - t
+
+
+class StateEvent:
+    """
+    Event for `solve_ivp` on the state of a unit operation (or the whole 
+    system if no unit operation is given). An event occurs when 
+    `function(t, state)` crosses zero.
+    """
+    __slots__ = ('function', 'unit', 'terminal', 'direction', 'index')
+    
+    def __init__(self, function, unit=None, terminal=True, direction=0):
+        self.function = function
+        self.unit = unit
+        self.terminal = terminal
+        self.direction = direction
+        self.index = slice(None)
+        
+    def _load_index(self, state_idx):
+        unit = self.unit
+        self.index = slice(None) if unit is None else slice(*state_idx[unit._ID])
+        
+    def __call__(self, t, y):
+        return self.function(t, y[self.index])
+    
+    def __repr__(self):
+        name = getattr(self.function, '__name__', 'event')
+        if self.unit is None: return f"<{type(self).__name__}: {name}>"
+        return f"<{type(self).__name__}: {name}({self.unit})>"
+
+
+# %% Report tools
+
+class _FlowsheetRendering(Thread):
+    # Renders a graphviz flowsheet diagram to file, optionally in the background.
+    
+    def __init__(self, digraph, file, format):
+        super().__init__(daemon=True)
+        self.digraph = digraph
+        self.file = file
+        self.format = format
+        self.completed = False
+        
+    def run(self):
+        try:
+            save_digraph(self.digraph, self.file, self.format)
+        except:
+            pass
+        else:
+            self.completed = True
+
+
+# %% Cached aggregate results
+
+class SystemResults:
+    """
+    Create a SystemResults object that caches aggregate results of a system
+    (i.e., capital costs, utilities, and priced streams). Results are 
+    computed once and reused until the system is converged again or any 
+    unit operation is redesigned. Prices and flow rates are not cached; 
+    material costs and sales are evaluated at current prices and flow rates.
+    
+    """
+    __slots__ = (
+        'summary_count',
+        'purchase_costs',
+        'installed_costs',
+        'utility_costs',
+        'heat_utilities',
+        'power_utility',
+        'inlet_cost_streams',
+        'outlet_revenue_streams',
+        'unit_inlet_cost_streams',
+        'unit_outlet_revenue_streams',
+        'feeds',
+        'products',
+    )
+    
+    def __init__(self, system):
+        self.summary_count = Unit._summary_count
+        cost_units = system.cost_units
+        self.purchase_costs = np.array([i.purchase_cost for i in cost_units], dtype=float)
+        self.installed_costs = np.array([i.installed_cost for i in cost_units], dtype=float)
+        self.utility_costs = np.array([i.utility_cost for i in cost_units], dtype=float)
+        self.heat_utilities = tuple(HeatUtility.sum_by_agent(get_heat_utilities(cost_units)))
+        self.power_utility = PowerUtility.sum(get_power_utilities(cost_units))
+        self.inlet_cost_streams = inlet_cost_streams = []
+        self.outlet_revenue_streams = outlet_revenue_streams = []
+        for unit in system.units:
+            ins = unit._ins._streams
+            outs = unit._outs._streams
+            for name, index in (unit._inlet_utility_indices | unit._inlet_cost_indices).items():
+                inlet_cost_streams.append((name, ins[index]))
+            for name, index in (unit._outlet_utility_indices | unit._outlet_revenue_indices).items():
+                outlet_revenue_streams.append((name, outs[index]))
+        self.unit_inlet_cost_streams = unit_inlet_cost_streams = []
+        self.unit_outlet_revenue_streams = unit_outlet_revenue_streams = []
+        for unit in cost_units:
+            ins = unit._ins._streams
+            outs = unit._outs._streams
+            for name, index in unit._inlet_cost_indices.items():
+                unit_inlet_cost_streams.append((name, ins[index]))
+            for name, index in unit._outlet_revenue_indices.items():
+                unit_outlet_revenue_streams.append((name, outs[index]))
+        self.feeds = system.feeds
+        self.products = system.products
+    
+    def isvalid(self):
+        return self.summary_count == Unit._summary_count
+    
+    @staticmethod
+    def _flows_by_name(streams):
+        flows = {}
+        for name, stream in streams:
+            flow = stream.F_mass
+            if flow:
+                if name in flows:
+                    flows[name] += flow
+                else:
+                    flows[name] = flow
+        return flows
+    
+    @property
+    def inlet_cost_flows(self):
+        """Mass flow rates of inlets with fees/credits/utilities by name [kg/hr]."""
+        return self._flows_by_name(self.inlet_cost_streams)
+    
+    @property
+    def outlet_revenue_flows(self):
+        """Mass flow rates of outlets with fees/credits/utilities by name [kg/hr]."""
+        return self._flows_by_name(self.outlet_revenue_streams)
+    
+    @property
+    def material_cost(self):
+        """Material cost at current prices and flow rates [USD/hr]."""
+        prices = bst.stream_prices
+        return float(
+            sum([i.price * i.F_mass for i in self.feeds])
+            + sum([stream.F_mass * prices[name] for name, stream in self.unit_inlet_cost_streams])
+        )
+    
+    @property
+    def sales(self):
+        """Sales at current prices and flow rates [USD/hr]."""
+        prices = bst.stream_prices
+        return float(
+            sum([i.price * i.F_mass for i in self.products])
+            + sum([stream.F_mass * prices[name] for name, stream in self.unit_outlet_revenue_streams])
+        )
+    
+
 # %% Converging recycle systems
 
 class MockSystem:
@@ -824,6 +1055,7 @@ class System:
         '_streams',
         '_feeds',
         '_products',
+        '_results',
         '_facility_recycle',
         '_inlet_names',
         '_outlet_names',
@@ -855,6 +1087,8 @@ class System:
         '_state_header',
         '_DAE',
         '_scope',
+        '_dynamic_events',
+        '_jacobian_structure',
         'dynsim_kwargs',
     )
 
@@ -1142,6 +1376,9 @@ class System:
         self._state_idx = None
         self._state_header = None
         self._DAE = None
+        self._dynamic_events = []
+        self._jacobian_structure = None
+        self._results = None
         self.dynsim_kwargs = {}
         self.tracked_recycles = {}
         self._last_error = np.inf
@@ -1376,6 +1613,7 @@ class System:
         for i in ('_subsystems', '_units', '_unit_path', '_cost_units',
                   '_streams', '_feeds', '_products'):
             if hasattr(self, i): delattr(self, i)
+        self._results = None
         self._path_cache.clear()
         self._temporary_connections_log.clear()
         self._prioritized_units.clear()
@@ -2354,6 +2592,10 @@ class System:
         if not_converged and self._iter >= self.maxiter:
             if self.strict_convergence: raise RuntimeError(f'{repr(self)} could not converge' + self._error_info())
             else: not_converged = False
+        if not not_converged and flash_scheduler.depth == 1:
+            # Synchronization point: solve deferred flash requests once the 
+            # outermost recycle loop converges
+            flash_scheduler.synchronize()
         return self._get_recycle_data(), not_converged
         
     def _iter_run(self, data):
@@ -2798,13 +3040,14 @@ class System:
         solver, conditional, kwargs = self.available_methods[self._method]
         data = self._get_recycle_data()
         f = self._iter_run_conditional if conditional else self._iter_run
-        try: solver(f, data, **kwargs)
-        except (IndexError, ValueError) as error:
-            data = self._get_recycle_data()
+        with flash_scheduler:
             try: solver(f, data, **kwargs)
+            except (IndexError, ValueError) as error:
+                data = self._get_recycle_data()
+                try: solver(f, data, **kwargs)
+                except Converged: pass
+                except: raise error
             except Converged: pass
-            except: raise error
-        except Converged: pass
 
     def get_recycle_data(self):
         """
@@ -2834,6 +3077,7 @@ class System:
         To run full simulation algorithm, see :func:`~biosteam.System.simulate`.
         
         """
+        self._results = None
         if recycle_data is not None: recycle_data.reset()
         if self._recycle:
             for i in self.path:
@@ -2956,6 +3200,52 @@ class System:
         else:
             warn(f'{self.__repr__()} must have at least one dynamic unit to '
                  f'set up a dynamic tracker.')
+    
+    def add_event(self, 
+            function: Optional[Callable]=None, 
+            unit: Optional[Unit]=None,
+            terminal: Optional[bool]=True,
+            direction: Optional[float]=0,
+        ):
+        """
+        Add an event to be located during dynamic simulation.
+
+        Parameters
+        ----------
+        function : 
+            Event function, `function(t, state)`, which crosses zero when the 
+            event occurs. The state is that of the unit operation, if given,
+            and that of the system otherwise.
+        unit :
+            Unit operation with ODEs that the event depends on.
+        terminal :
+            Whether to stop integration when the event occurs. Defaults to True.
+        direction :
+            Direction of zero crossing; events only occur when crossing zero 
+            from below if positive or from above if negative. Defaults to 0 
+            (any direction).
+
+        Examples
+        --------
+        Stop integration when the liquid level of a tank exceeds 0.9:
+        
+        >>> @sys.add_event(unit=T1, direction=1) # doctest: +SKIP
+        ... def high_level(t, QC):
+        ...     return T1.level(QC) - 0.9
+
+        Notes
+        -----
+        This method also works as a decorator. Times at which events occur 
+        are stored in the `t_events` attribute of the solution 
+        (`System.scope.sol`).
+
+        """
+        if not function: return lambda function: self.add_event(function, unit, terminal, direction)
+        if not callable(function): raise ValueError('event function must be callable')
+        if unit is not None and not unit.hasode:
+            raise ValueError(f'{unit} does not have ODEs')
+        self._dynamic_events.append(StateEvent(function, unit, terminal, direction))
+        return function
         
     @property
     def scope(self) -> utils.SystemScope:
@@ -3028,7 +3318,6 @@ class System:
         _update_state = self._update_state
         _dstate_attr2arr = self._dstate_attr2arr
         funcs = [u.ODE if u.hasode else u.AE for u in units]
-        track = self.scope
         dk = self.dynsim_kwargs
         if dk.get('print_t'): # print integration time for debugging
             def dydt(t, y):
@@ -3041,7 +3330,6 @@ class System:
                     else:
                         QC_ins, dQC_ins = unit._ins_QC, unit._ins_dQC
                         func(t, QC_ins, dQC_ins)   # updates both state and dstate
-                track(t)
                 return _dstate_attr2arr(y)
         else:
             def dydt(t, y):
@@ -3053,10 +3341,255 @@ class System:
                     else:
                         QC_ins, dQC_ins = unit._ins_QC, unit._ins_dQC
                         func(t, QC_ins, dQC_ins)   # updates both state and dstate
-                track(t)
                 return _dstate_attr2arr(y)
         self._DAE = dydt            
 
+    def _upstream_dynamic_units(self):
+        """
+        Return a dictionary of unit operations with ODEs and the set of unit 
+        operations with ODEs that feed their inlets, either directly or through
+        unit operations with algebraic equations.
+        """
+        units = set(self.units)
+        upstream_units = {}
+        for unit in self.units:
+            if not unit.hasode: continue
+            upstream_units[unit] = upstream = set()
+            visited = set()
+            inlets = list(unit.ins)
+            while inlets:
+                source = inlets.pop().source
+                if source is None or source not in units or source in visited: continue
+                visited.add(source)
+                if source.hasode:
+                    upstream.add(source)
+                else:
+                    inlets.extend(source.ins)
+        return upstream_units
+    
+    def _state_dependencies(self, upstream_units=None):
+        """
+        Return a dictionary of unit operations with ODEs and the set of unit 
+        operations whose states structurally affect their derivatives. 
+        
+        Notes
+        -----
+        The derivatives of a unit operation depend on its own state and the
+        state of inlet streams. Unit operations with ODEs that also depend on 
+        the derivatives of inlet streams should have a 
+        `_ODE_uses_inlet_derivatives` attribute set to True, in which case
+        the dependencies of upstream unit operations are also included.
+        
+        """
+        if upstream_units is None: upstream_units = self._upstream_dynamic_units()
+        dependencies = {unit: {unit, *upstream} for unit, upstream in upstream_units.items()}
+        coupled = [i for i in dependencies if getattr(i, '_ODE_uses_inlet_derivatives', False)]
+        changed = bool(coupled)
+        while changed:
+            changed = False
+            for unit in coupled:
+                deps = dependencies[unit]
+                n = len(deps)
+                for upstream in upstream_units[unit]: deps.update(dependencies[upstream])
+                if len(deps) != n: changed = True
+        return dependencies
+    
+    def _get_jacobian_sparsity(self, dependencies=None):
+        """
+        Return the structural sparsity pattern of the system Jacobian as given
+        by the stream connectivity between unit operations and the state slices
+        of each unit operation.
+        """
+        if dependencies is None: dependencies = self._state_dependencies()
+        idx = self._state_idx
+        n = len(self._state)
+        rows = []
+        cols = []
+        for unit, deps in dependencies.items():
+            start, stop = idx[unit._ID]
+            row_index = np.arange(start, stop)
+            for other in deps:
+                col_index = np.arange(*idx[other._ID])
+                rows.append(np.repeat(row_index, col_index.size))
+                cols.append(np.tile(col_index, row_index.size))
+        if rows:
+            rows = np.concatenate(rows)
+            cols = np.concatenate(cols)
+        data = np.ones(len(rows), dtype=bool)
+        return csc_matrix((data, (rows, cols)), shape=(n, n))
+    
+    def _get_jacobian_structure(self):
+        """
+        Return the upstream unit operations with ODEs, the state 
+        dependencies, the structural sparsity pattern of the system Jacobian,
+        and the column groups for finite differences. The structure is cached
+        and reused (e.g., across simulations of an ensemble) until the state 
+        layout or stream connections change.
+        """
+        layout = tuple(self._state_idx.items())
+        cache = self._jacobian_structure
+        if cache is not None:
+            cached_layout, connections, structure = cache
+            if cached_layout == layout and connections is self._connections: 
+                return structure
+        upstream_units = self._upstream_dynamic_units()
+        dependencies = self._state_dependencies(upstream_units)
+        sparsity = self._get_jacobian_sparsity(dependencies)
+        structure = (upstream_units, dependencies, sparsity, group_columns(sparsity))
+        self._jacobian_structure = (layout, self._connections, structure)
+        return structure
+    
+    def _compile_jacobian(self, DAE=None):
+        """
+        Return a function that evaluates the system Jacobian as a sparse 
+        matrix or None if no unit operation has an analytic Jacobian. 
+        
+        Unit operations may define a `_compile_jacobian` method that sets a
+        `_jacobian` function with the same signature as their ODE (i.e., 
+        f(t, QC_ins, QC, dQC_ins)) and returns the partial derivatives of the 
+        unit's derivatives with respect to its own state. Local Jacobians are 
+        assembled into the system Jacobian and all other structural nonzeros 
+        are estimated by graph-colored finite differences.
+        
+        """
+        upstream_units, dependencies, sparsity, _ = self._get_jacobian_structure()
+        idx = self._state_idx
+        analytic = []
+        for unit in dependencies:
+            # Local Jacobians are incomplete if the unit's state recycles back to its inlets
+            if not hasattr(unit, '_compile_jacobian') or unit in upstream_units[unit]: continue
+            unit._compile_jacobian()
+            analytic.append((unit, *idx[unit._ID]))
+        if not analytic: return None
+        # Columns are grouped by the off-block pattern only; the analytic
+        # contribution of perturbed columns is subtracted from each difference
+        sparsity = sparsity.tolil()
+        for unit, start, stop in analytic: sparsity[start:stop, start:stop] = False
+        sparsity = csc_matrix(sparsity)
+        sparsity.eliminate_zeros()
+        indptr = sparsity.indptr
+        indices = sparsity.indices
+        nonempty = np.flatnonzero(np.diff(indptr))
+        groups = group_columns(sparsity[:, nonempty])
+        columns = [nonempty[groups == i] for i in range(groups.max(initial=-1) + 1)]
+        shape = sparsity.shape
+        rows = []
+        cols = []
+        for unit, start, stop in analytic:
+            index = np.arange(start, stop)
+            rows.append(np.repeat(index, index.size))
+            cols.append(np.tile(index, index.size))
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+        python_DAE = self.DAE
+        if DAE is None: DAE = python_DAE
+        step = np.finfo(float).eps ** 0.5
+        
+        def jacobian(t, y):
+            f0 = DAE(t, y)
+            # Local Jacobians require inlet and unit states as attributes
+            if DAE is not python_DAE: python_DAE(t, y) 
+            local = np.concatenate([
+                np.asarray(unit._jacobian(t, unit._ins_QC, unit._state, unit._ins_dQC), dtype=float).ravel()
+                for unit, start, stop in analytic
+            ])
+            J_local = csc_matrix((local, (rows, cols)), shape=shape)
+            data = np.zeros(indices.size)
+            h = step * np.maximum(1., np.abs(y))
+            for group in columns:
+                dy = np.zeros_like(y)
+                dy[group] = h[group]
+                df = DAE(t, y + dy) - f0 - J_local @ dy
+                for j in group:
+                    start = indptr[j]
+                    stop = indptr[j + 1]
+                    data[start:stop] = df[indices[start:stop]] / h[j]
+            if columns: DAE(t, y) # Reset states
+            J = csc_matrix((data, indices, indptr), shape=shape)
+            return J + J_local
+        
+        return jacobian
+    
+    def _compile_kernel_DAE(self):
+        """
+        Return the system-wide differential algebraic equations as one 
+        compiled function or None if any unit operation does not define a 
+        `_compile_kernel` method (or sets it to None) or stream states differ 
+        in size.
+        
+        Notes
+        -----
+        The `_compile_kernel` method of a unit operation should return a 
+        tuple of (state_kernel, rhs_kernel, parameters), where:
+        
+        * state_kernel(QC, X, outs, parameters) updates the states of 
+          outlets given the state of the unit (or None for unit operations 
+          without ODEs).
+        * rhs_kernel(t, QC, dQC, X, dX, ins, outs, parameters) updates the
+          derivatives of the unit's state (for unit operations with ODEs) and
+          the states and derivatives of outlets given those of inlets.
+        * parameters is a 1d array of parameters passed to both kernels.
+        
+        Kernels must be jittable by numba. `X` and `dX` are 2d arrays 
+        with the states and derivatives of all streams (rows indexed by `ins` 
+        and `outs`) and `QC` and `dQC` are slices of the state and derivative 
+        vectors of the system. The states of feeds are fixed at their initial 
+        values.
+        
+        """
+        nr = self._n_rotate
+        units = self.units[nr:] + self.units[:nr]
+        if not all([getattr(i, '_compile_kernel', None) for i in units]): return None
+        streams = []
+        index = {}
+        for unit in units:
+            for stream in (*unit._ins, *unit._outs):
+                if stream in index: continue
+                index[stream] = len(streams)
+                streams.append(stream)
+        if len(set([len(i.state) for i in streams])) != 1: return None
+        X = np.array([i.state for i in streams], dtype=float)
+        dX = np.array([i.dstate for i in streams], dtype=float)
+        idx = self._state_idx
+        kernels = {}
+        ins = []
+        outs = []
+        parameters = []
+        state_lines = []
+        rhs_lines = []
+        for i, unit in enumerate(units):
+            state_kernel, rhs_kernel, unit_parameters = unit._compile_kernel()
+            ins.append(np.array([index[j] for j in unit._ins], dtype=np.int64))
+            outs.append(np.array([index[j] for j in unit._outs], dtype=np.int64))
+            parameters.append(np.asarray(unit_parameters, dtype=float).reshape(-1))
+            kernels[f'rhs_{i}'] = jit_kernel(rhs_kernel)
+            if unit.hasode:
+                start, stop = idx[unit._ID]
+                kernels[f'state_{i}'] = jit_kernel(state_kernel)
+                state_lines.append(f"    state_{i}(y[{start}:{stop}], X, O[{i}], P[{i}])")
+            else:
+                start = stop = 0
+            rhs_lines.append(
+                f"    rhs_{i}(t, y[{start}:{stop}], dy[{start}:{stop}], X, dX, I[{i}], O[{i}], P[{i}])"
+            )
+        source = '\n'.join(['def system_rhs(t, y, dy, X, dX, I, O, P):', *state_lines, *rhs_lines])
+        key = (source, *kernels.values())
+        if key in _kernel_cache:
+            system_rhs = _kernel_cache[key]
+        else:
+            exec(source, kernels)
+            _kernel_cache[key] = system_rhs = njit(kernels['system_rhs'])
+        ins = tuple(ins)
+        outs = tuple(outs)
+        parameters = tuple(parameters)
+        
+        def dydt(t, y):
+            dy = np.zeros_like(y)
+            system_rhs(t, y, dy, X, dX, ins, outs, parameters)
+            return dy
+        
+        return dydt
+    
     @property
     def DAE(self):
         """System-wide differential algebraic equations."""
@@ -3065,6 +3598,31 @@ class System:
             except AttributeError: return None
         return self._DAE
 
+    def _track_solution(self, sol, t_eval=None):
+        """
+        Record tracked data at accepted integration steps (or at `t_eval` 
+        using the dense output of the solver) and leave the system at the 
+        final state. Tracking is not done within the DAE, so no data is 
+        recorded for rejected steps or finite difference Jacobian evaluations.
+        """
+        ts = sol.t
+        if not ts.size: return
+        DAE = self.DAE
+        scope = self.scope
+        if scope.subjects:
+            if t_eval is not None and sol.sol is not None:
+                t_eval = np.asarray(t_eval, dtype=float)
+                t_eval = t_eval[(t_eval >= ts[0]) & (t_eval <= ts[-1])]
+                ys = sol.sol(t_eval)
+                ts = t_eval
+            else:
+                ys = sol.y
+            for t, y in zip(ts, ys.T):
+                DAE(t, y)
+                scope(t)
+            if ts.size and ts[-1] == sol.t[-1]: return
+        DAE(sol.t[-1], sol.y[:, -1])
+    
     def _write_state(self):
         for ws in [i for i in self.streams if i not in self.feeds]:
             ws._state2flows()
@@ -3192,7 +3750,10 @@ class System:
                     Interval of integration (t0, tf).
                     The solver starts with t=t0 and integrates until it reaches t=tf.
                 t_eval : iterable(float)
-                    The time points where status will be saved.
+                    The time points where status will be saved. Tracked 
+                    data is recorded at these time points using the dense 
+                    output of the solver. Otherwise, tracked data is 
+                    recorded at accepted integration steps.
                 state_reset_hook: str|Callable
                     Hook function to reset the cache state between simulations
                     for dynamic systems).
@@ -3208,14 +3769,52 @@ class System:
                 print_t : bool
                     Whether to print integration time in the console,
                     usually used for debugging.
+                compiled : bool
+                    Whether to integrate with one compiled function for the
+                    system-wide right-hand side, which requires all unit 
+                    operations to define a `_compile_kernel` method (see 
+                    :meth:`System._compile_kernel_DAE`). Defaults to False.
+                steady_state : bool
+                    Whether to stop integration once the system reaches 
+                    steady state, when the maximum relative derivative 
+                    of the state, max(|dy| / (|y| + atol)), remains below 
+                    `steady_state_rtol` for a time of `steady_state_window`.
+                    Defaults to False.
+                steady_state_rtol : float
+                    Relative tolerance for steady state. Defaults to 1e-6.
+                steady_state_atol : float
+                    Absolute tolerance for steady state. Defaults to 1e-9.
+                steady_state_window : float
+                    Time the system must remain within tolerance to be at 
+                    steady state. Defaults to 0.
+                converge_steady_state : bool
+                    Whether to converge the steady-state system after 
+                    integration using the final dynamic state as the
+                    initial guess. Defaults to False.
+                structural_sparsity : bool
+                    Whether to pass the structural sparsity pattern of the 
+                    Jacobian (as given by the stream connectivity) and any 
+                    analytic Jacobians of unit operations to implicit 
+                    solvers (i.e., 'BDF' and 'Radau'). The pattern assumes 
+                    that the ODEs of a unit operation only depend on its 
+                    own state and the states of its inlet streams, unless
+                    its `_ODE_uses_inlet_derivatives` attribute is True. 
+                    Only use this option if all unit operations meet this
+                    assumption (e.g., no coupling outside of streams), as 
+                    an incorrect pattern results in incorrect Jacobians. 
+                    Ignored if `jac` or `jac_sparsity` are given. Defaults 
+                    to False.
                 solve_ivp_kwargs
                     All remaining keyword arguments will be passed to ``solve_ivp``.
+                    Events are located along with those added through 
+                    :meth:`System.add_event`.
         
         See Also
         --------
         `scipy.integrate.solve_ivp <https://docs.scipy.org/doc/scipy/reference/generated/scipy.integrate.solve_ivp.html>`_
         
         """
+        self._results = None
         dk = self.dynsim_kwargs
         dk.update(dynsim_kwargs)
         dk_cp = dk.copy()
@@ -3225,6 +3824,13 @@ class System:
         sample_id = dk_cp.pop('sample_id', '')
         print_msg = dk_cp.pop('print_msg', False)
         print_t = dk_cp.pop('print_t', False)
+        structural_sparsity = dk_cp.pop('structural_sparsity', False)
+        compiled = dk_cp.pop('compiled', False)
+        steady_state = dk_cp.pop('steady_state', False)
+        steady_state_rtol = dk_cp.pop('steady_state_rtol', 1e-6)
+        steady_state_atol = dk_cp.pop('steady_state_atol', 1e-9)
+        steady_state_window = dk_cp.pop('steady_state_window', 0.)
+        converge_steady_state = dk_cp.pop('converge_steady_state', False)
         dk_cp.pop('y0', None) # will be updated later
         # Reset state, if needed
         if state_reset_hook:
@@ -3242,12 +3848,43 @@ class System:
         dk['y0'] = y0
         # Integrate
         self.dynsim_kwargs['print_t'] = print_t # self.dynsim_kwargs might be reset by `state_reset_hook`
-        self.scope.sol = sol = solve_ivp(fun=self.DAE, y0=y0, **dk_cp)
+        fun = None
+        if compiled: 
+            fun = self._compile_kernel_DAE()
+            if fun is None: 
+                warn('not all unit operations define a compiled kernel; '
+                     'system DAE is not compiled', RuntimeWarning, stacklevel=2)
+        if fun is None: fun = self.DAE
+        method = dk_cp.get('method', 'RK45')
+        if (structural_sparsity and idx
+            and getattr(method, '__name__', method) in ('BDF', 'Radau')
+            and 'jac' not in dk_cp and 'jac_sparsity' not in dk_cp):
+            jacobian = self._compile_jacobian(fun)
+            if jacobian is None:
+                dk_cp['jac_sparsity'] = self._get_jacobian_structure()[2]
+            else:
+                dk_cp['jac'] = jacobian
+        events = dk_cp.pop('events', None)
+        if events is None: events = []
+        elif callable(events): events = [events]
+        else: events = list(events)
+        for event in self._dynamic_events: event._load_index(idx)
+        events.extend(self._dynamic_events)
+        if steady_state:
+            events.append(
+                SteadyStateEvent(fun, steady_state_rtol, steady_state_atol, steady_state_window)
+            )
+        if events: dk_cp['events'] = events
+        if t_eval is not None and self.scope.subjects: dk_cp.setdefault('dense_output', True)
+        # The DAE updates the system state in place, so the solver is given a copy
+        self.scope.sol = sol = solve_ivp(fun=fun, y0=y0.copy(), **dk_cp)
+        self._track_solution(sol, t_eval)
         if print_msg:
             if sol.status == 0:
                 print('Simulation completed.')
             else: print(sol.message)
-        self._write_state()          
+        self._write_state()
+        if converge_steady_state: self.converge()
         # Write states to file
         if export_state_to:
             try: file, ext = export_state_to.rsplit('.', 1)
@@ -3301,43 +3938,42 @@ class System:
 
     # Convenience methods
 
+    def get_results(self) -> SystemResults:
+        """
+        Return cached aggregate results of the system. Results are 
+        recomputed only after the system is converged again or any unit 
+        operation is redesigned.
+        
+        """
+        results = self._results
+        if results is None or not results.isvalid():
+            self._results = results = SystemResults(self)
+        return results
+
     @property
     def heat_utilities(self) -> tuple[HeatUtility, ...]:
-        """The sum of all heat utilities in the system by agent."""
-        return HeatUtility.sum_by_agent(get_heat_utilities(self.cost_units))
+        """The sum of all heat utilities in the system by agent. Results are
+        cached until the system is redesigned; copy heat utilities before
+        modifying them."""
+        return self.get_results().heat_utilities
 
     @property
     def power_utility(self) -> PowerUtility:
-        """Sum of all power utilities in the system."""
-        return PowerUtility.sum(get_power_utilities(self.cost_units))
+        """Sum of all power utilities in the system. Results are cached until
+        the system is redesigned; copy the power utility before modifying it."""
+        return self.get_results().power_utility
 
     def get_inlet_cost_flows(self):
         """
         Return a dictionary with flow rates for inlet streams with fees/credits/utilities.
         """
-        dct = {}
-        for unit in self.units:
-            for name, flow in unit.get_inlet_cost_flows().items():
-                if flow:
-                    if name in dct:
-                        dct[name] += flow
-                    else:
-                        dct[name] = flow
-        return dct
+        return self.get_results().inlet_cost_flows
 
     def get_outlet_revenue_flows(self):
         """
         Return a dictionary with flow rates for outlet streams with fees/credits/utilities.
         """
-        dct = {}
-        for unit in self.units:
-            for name, flow in unit.get_outlet_revenue_flows().items():
-                if flow:
-                    if name in dct:
-                        dct[name] += flow
-                    else:
-                        dct[name] = flow
-        return dct
+        return self.get_results().outlet_revenue_flows
 
     def get_inlet_flow(self, units: str, key: Optional[Sequence[str]|str]=None):
         """
@@ -3665,33 +4301,28 @@ class System:
     @property
     def sales(self) -> float:
         """Annual sales revenue [USD/yr]."""
-        return self.operating_hours * (
-            sum([s.cost for s in self.products if s.price]) 
-            + sum([i._outlet_revenue for i in self.cost_units])
-        )
+        return self.operating_hours * self.get_results().sales
     @property
     def material_cost(self) -> float:
         """Annual material cost [USD/yr]."""
-        return self.operating_hours * (
-            sum([s.cost for s in self.feeds if s.price])
-            + sum([i._inlet_cost for i in self.cost_units])
-        )
+        return self.operating_hours * self.get_results().material_cost
     @property
     def utility_cost(self) -> float:
         """Total utility cost [USD/yr]."""
-        return sum([u.utility_cost for u in self.cost_units]) * self.operating_hours
+        return float(self.get_results().utility_costs.sum()) * self.operating_hours
     @property
     def purchase_cost(self) -> float:
         """Total purchase cost [USD]."""
-        return sum([u.purchase_cost for u in self.cost_units])
+        return float(self.get_results().purchase_costs.sum())
     @property
     def installed_equipment_cost(self) -> float:
         """Total installed cost [USD]."""
         lang_factor = self.lang_factor
+        results = self.get_results()
         if lang_factor:
-            return sum([u.purchase_cost for u in self.cost_units]) * lang_factor
+            return float(results.purchase_costs.sum()) * lang_factor
         else:
-            return sum([u.installed_cost for u in self.cost_units])
+            return float(results.installed_costs.sum())
     installed_cost = installed_equipment_cost
     def get_electricity_consumption(self):
         """Return the total electricity consumption [kWhr/yr]."""
@@ -3833,6 +4464,8 @@ class System:
             dpi: Optional[str]='900', 
             sheets=None,
             stage=False,
+            diagram: Optional[bool|str]=True,
+            engine: Optional[str]=None,
             **stream_properties
         ): 
         """
@@ -3844,6 +4477,13 @@ class System:
             File name to save report
         dpi : 
             Resolution of the flowsheet. Defaults to '300'
+        diagram :
+            Whether to include the flowsheet diagram. If 'async', the 
+            diagram is rendered by graphviz in the background while the 
+            remaining sheets are written. Defaults to True.
+        engine :
+            Excel writer engine (e.g. 'xlsxwriter' or 'openpyxl'). Defaults to
+            the pandas default.
         **stream_properties : str
             Additional stream properties and units as key-value pairs (e.g. T='degC', flow='gpm', H='kW', etc..)
             
@@ -3858,47 +4498,36 @@ class System:
                 'Reactions',
                 # 'Specifications'
             }
-        writer = pd.ExcelWriter(file)
+        writer = pd.ExcelWriter(file, engine=engine)
         units = sorted(self.units, key=lambda x: x.line)
         cost_units = [i for i in units if i._design or i._cost]
-        if 'Flowsheet' in sheets:
+        diagram_completed = False
+        if 'Flowsheet' in sheets and diagram:
             try:
                 with bst.preferences.temporary() as p:
                     p.reset()
                     p.light_mode()
                     kind = 'stage' if stage else 'thorough'
-                    self.diagram(kind, file='flowsheet', dpi=str(dpi), format='png')
+                    digraph = self.diagram(kind, display=False, dpi=str(dpi), format='png')
             except:
-                diagram_completed = False
+                digraph = None
                 warn(RuntimeWarning('failed to generate diagram through graphviz'), stacklevel=2)
             else:
-                import PIL.Image
-                try:
-                    # Assume openpyxl is used
-                    worksheet = writer.book.create_sheet('Flowsheet')
-                    flowsheet = openpyxl.drawing.image.Image('flowsheet.png')
-                    worksheet.add_image(flowsheet, anchor='A1')
-                except PIL.Image.DecompressionBombError:
-                    PIL.Image.MAX_IMAGE_PIXELS = int(1e9)
-                    flowsheet = openpyxl.drawing.image.Image('flowsheet.png')
-                    worksheet.add_image(flowsheet, anchor='A1')
-                except:
-                    # Assume xlsx writer is used
-                    try:
-                        worksheet = writer.book.add_worksheet('Flowsheet')
-                    except:
-                        warn("problem in saving flowsheet; please submit issue to BioSTEAM with"
-                             "your current version of openpyxl and xlsx writer", RuntimeWarning)
-                    worksheet.insert_image('A1', 'flowsheet.png')
-                diagram_completed = True
+                rendering = _FlowsheetRendering(digraph, 'flowsheet', 'png')
+                if diagram == 'async':
+                    rendering.start()
+                else:
+                    rendering.run()
+        else:
+            digraph = None
         
         if 'Itemized costs' in sheets:
             tea = self.TEA
             if tea:
                 tea = self.TEA
                 cost = report.cost_table(tea)
-                cost.to_excel(writer, 'Itemized costs')
-                tea.get_cashflow_table().to_excel(writer, 'Cash flow')
+                cost.to_excel(writer, sheet_name='Itemized costs')
+                tea.get_cashflow_table().to_excel(writer, sheet_name='Cash flow')
             else:
                 warn(f'Cannot find TEA object in {repr(self)}. Ignoring TEA sheets.',
                      RuntimeWarning, stacklevel=2)
@@ -3950,6 +4579,31 @@ class System:
                 specifications, writer, 
                 'Specifications'
             )
+        if digraph is not None:
+            if rendering.is_alive(): rendering.join()
+            if rendering.completed:
+                diagram_completed = True
+                import PIL.Image
+                try:
+                    # Assume openpyxl is used
+                    worksheet = writer.book.create_sheet('Flowsheet', 0)
+                    flowsheet = openpyxl.drawing.image.Image('flowsheet.png')
+                    worksheet.add_image(flowsheet, anchor='A1')
+                except PIL.Image.DecompressionBombError:
+                    PIL.Image.MAX_IMAGE_PIXELS = int(1e9)
+                    flowsheet = openpyxl.drawing.image.Image('flowsheet.png')
+                    worksheet.add_image(flowsheet, anchor='A1')
+                except:
+                    # Assume xlsx writer is used
+                    try:
+                        worksheet = writer.book.add_worksheet('Flowsheet')
+                    except:
+                        warn("problem in saving flowsheet; please submit issue to BioSTEAM with"
+                             "your current version of openpyxl and xlsx writer", RuntimeWarning)
+                    else:
+                        worksheet.insert_image('A1', 'flowsheet.png')
+            else:
+                warn(RuntimeWarning('failed to generate diagram through graphviz'), stacklevel=2)
         writer.close()
         if diagram_completed: os.remove("flowsheet.png")
 
@@ -4189,7 +4843,8 @@ class OperationMode:
             {name: {stream: getattr(stream, name) for stream in streams}
              for name in stream_properties},
             operating_hours * sum([i.utility_cost for i in cost_units]),
-            feeds, products, system.heat_utilities, system.power_utility
+            feeds, products, [i.copy() for i in system.heat_utilities], 
+            system.power_utility.copy()
         )
 
     def __repr__(self):
@@ -13,6 +13,7 @@ import pandas as pd
 import numpy as np
 import flexsolve as flx
 from copy import copy as copy_
+from functools import wraps
 from numba import njit
 from math import ceil
 from warnings import warn
@@ -22,7 +23,7 @@ from ._unit import Unit
 from numpy.typing import NDArray
 if TYPE_CHECKING: from ._system import System
 
-__all__ = ('TEA',)
+__all__ = ('TEA', 'TEAEvaluationContext')
 
 
 cashflow_columns = ('Depreciable capital [MM$]',
@@ -214,6 +215,95 @@ def taxable_and_nontaxable_cashflows(
         nontaxable_cashflow = D - C_FC - C_WC
     return taxable_cashflow, nontaxable_cashflow
 
+@njit(cache=True)
+def linear_taxable_earnings_with_forwarded_losses(taxable_cashflow, sales_coefficients, sales):
+    """
+    Return the intercept and slope of taxable earnings (with forwarded losses)
+    with respect to additional annual sales, as well as the lower and upper 
+    bounds of sales at which this linear segment is valid.
+    
+    """
+    N = taxable_cashflow.size
+    intercept = np.zeros(N)
+    slope = np.zeros(N)
+    lb = -np.inf
+    ub = np.inf
+    a = b = 0. # Taxable earnings including forwarded losses (a + b * sales)
+    for i in range(N):
+        a += taxable_cashflow[i]
+        b += sales_coefficients[i]
+        x = a + b * sales
+        loss = x < 0.
+        if b != 0.:
+            breakpoint = -a / b
+            if loss == (b > 0.):
+                if breakpoint < ub: ub = breakpoint
+            elif breakpoint > lb: 
+                lb = breakpoint
+        if not loss: # Otherwise, losses are forwarded to the next year
+            intercept[i] = a
+            slope[i] = b
+            a = b = 0.
+    return intercept, slope, lb, ub
+
+@njit(cache=True)
+def next_breakeven_sales_guess(sales, NPV, root, lb, ub, bracket):
+    """
+    Return the next guess of breakeven sales given the NPV at the current 
+    sales, the root of the active linear segment, the bounds of the segment, 
+    and the bracket of the breakeven point (which is updated in place). 
+    Guesses outside the bracket are replaced by the next segment towards
+    the breakeven point. Return nan if the next segment is also outside 
+    the bracket (i.e., the breakeven point is at the breakpoint).
+    
+    """
+    if NPV < 0.:
+        bracket[0] = sales
+        if not root < bracket[1]: root = ub + 1e-12 * (abs(ub) + 1.)
+    else:
+        bracket[1] = sales
+        if not root > bracket[0]: root = lb - 1e-12 * (abs(lb) + 1.)
+    if bracket[0] < root < bracket[1]:
+        return root
+    else:
+        return np.nan
+
+@njit(cache=True)
+def solve_breakeven_sales(
+        taxable_cashflow, 
+        nontaxable_cashflow,
+        sales_coefficients,
+        discount_factors,
+        income_tax,
+        sales,
+        maxiter,
+    ):
+    """
+    Return the additional annual sales at which the NPV is zero assuming
+    taxes are proportional to taxable earnings (with forwarded losses). The 
+    NPV is piecewise linear with respect to sales, so the root is solved 
+    exactly by jumping to the root of the active linear segment until it 
+    lies within the segment. Return nan if no root is found.
+    
+    """
+    N = taxable_cashflow.size
+    bracket = np.array([-np.inf, np.inf])
+    for iter in range(maxiter):
+        intercept, slope, lb, ub = linear_taxable_earnings_with_forwarded_losses(
+            taxable_cashflow, sales_coefficients, sales
+        )
+        A = B = 0.
+        for i in range(N):
+            A += (nontaxable_cashflow[i] + taxable_cashflow[i] - income_tax * intercept[i]) / discount_factors[i]
+            B += (sales_coefficients[i] - income_tax * slope[i]) / discount_factors[i]
+        if B <= 0.: return np.nan
+        root = -A / B
+        if lb <= root <= ub: return root
+        NPV = A + B * sales
+        sales = next_breakeven_sales_guess(sales, NPV, root, lb, ub, bracket)
+        if np.isnan(sales): return ub if NPV < 0. else lb # Root at breakpoint
+    return np.nan
+
 def NPV_with_sales(
         sales, 
         taxable_cashflow, 
@@ -235,6 +325,64 @@ def NPV_with_sales(
     cashflow = nontaxable_cashflow + taxable_cashflow + incentives - tax
     return (cashflow/discount_factors).sum()
 
+# %% Evaluation context
+
+class TEAEvaluationContext:
+    """
+    Create a TEAEvaluationContext object that, while active, allows TEA 
+    objects to compute shared intermediates (e.g., TDC, FCI, FOC, and the 
+    cash flow decomposition) once and reuse them across all TEA indicators.
+    
+    Cached intermediates are invalidated when any unit operation is 
+    redesigned (e.g., the system is simulated), when a TEA parameter (i.e., 
+    a public attribute) is set, and when the outermost context exits. Material costs and sales 
+    are not cached, so stream price changes are reflected immediately.
+    
+    Examples
+    --------
+    Evaluate several indicators of a TEA object, `tea`, with 
+    shared intermediates:
+    
+    >>> with bst.TEA.evaluation_context: # doctest: +SKIP
+    ...     values = [tea.NPV, tea.TCI, tea.solve_price(product)]
+    
+    """
+    __slots__ = ('depth', 'ID')
+    
+    def __init__(self):
+        #: [int] Number of nested contexts entered.
+        self.depth = 0
+        
+        #: [int] Identifier of the current (or last) outermost context.
+        self.ID = 0
+    
+    def __enter__(self):
+        if not self.depth: self.ID += 1
+        self.depth += 1
+        return self
+    
+    def __exit__(self, type, exception, traceback):
+        self.depth -= 1
+        if not self.depth: self.ID += 1 # Invalidate cached intermediates
+        
+    def __repr__(self):
+        return f"{type(self).__name__}(active={bool(self.depth)})"
+
+
+def evaluation_cached(f):
+    """Decorate a TEA method so that results are cached within an evaluation context."""
+    name = f.__name__
+    @wraps(f)
+    def g(self):
+        cache = self._get_evaluation_cache()
+        if cache is None: return f(self)
+        try:
+            return cache[name]
+        except KeyError:
+            cache[name] = value = f(self)
+            return value
+    return g
+
 # %% Techno-Economic Analysis
 
 _duration_array_cache = {}
@@ -327,7 +475,17 @@ class TEA:
                  '_startup_schedule', '_operating_days',
                  '_duration', '_depreciation_key', '_depreciation',
                  '_years', '_duration', '_start',  'IRR', '_IRR', '_sales',
-                 '_duration_array_cache', 'accumulate_interest_during_construction')
+                 '_duration_array_cache', 'accumulate_interest_during_construction',
+                 '_evaluation_cache')
+    
+    #: Shared evaluation context; while active, TEA intermediates are cached
+    #: and reused across indicators (see :class:`~biosteam.TEAEvaluationContext`).
+    evaluation_context: TEAEvaluationContext = TEAEvaluationContext()
+    
+    #: Whether to solve breakeven sales exactly by finding the active linear 
+    #: segment of the NPV with respect to sales. If False (or if the exact 
+    #: solution fails), an iterative solver is used.
+    exact_breakeven: bool = True
     
     #: Available depreciation schedules. Defaults include modified 
     #: accelerated cost recovery system from U.S. IRS publication 946 (MACRS),
@@ -428,6 +586,7 @@ class TEA:
     def copy(self, system=None):
         """Create a copy."""
         new = copy_(self)
+        new._evaluation_cache = None
         if system is not None:
             new.system = system
             system._TEA = new
@@ -491,6 +650,25 @@ class TEA:
         #: For convenience, set a TEA attribute for the system
         system._TEA = self
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Private attributes (e.g., solver guesses) do not invalidate 
+        # cached intermediates, only parameters do
+        if name[0] != '_': object.__setattr__(self, '_evaluation_cache', None)
+
+    def _get_evaluation_cache(self):
+        """Return dictionary of cached intermediates if an evaluation context is active."""
+        context = self.evaluation_context
+        if not context.depth: return None
+        key = (context.ID, Unit._summary_count)
+        try:
+            evaluation_cache = self._evaluation_cache
+        except AttributeError:
+            evaluation_cache = None
+        if evaluation_cache is None or evaluation_cache[0] != key:
+            self._evaluation_cache = evaluation_cache = (key, {})
+        return evaluation_cache[1]
+
     def _get_duration(self):
         return (self._start, self._years)
 
@@ -668,14 +846,17 @@ class TEA:
         """Total installed cost [USD]."""
         return self.system.installed_equipment_cost
     @property
+    @evaluation_cached
     def DPI(self) -> float:
         """Direct permanent investment [USD]."""
         return self._DPI(self.installed_equipment_cost)
     @property
+    @evaluation_cached
     def TDC(self) -> float:
         """Total depreciable capital [USD]."""
         return self._TDC(self.DPI)
     @property
+    @evaluation_cached
     def FCI(self) -> float:
         """Fixed capital investment [USD]."""
         return self._FCI(self.TDC)
@@ -684,6 +865,7 @@ class TEA:
         """Total capital investment [USD]."""
         return (1. + self.WC_over_FCI)*self.FCI
     @property
+    @evaluation_cached
     def FOC(self) -> float:
         """Fixed operating costs [USD/yr]."""
         return self._FOC(self.FCI)
@@ -867,6 +1049,43 @@ class TEA:
     
     def _taxable_nontaxable_depreciation_cashflows(self):
         """Return taxable, nontaxable and depreciation cash flows by year as a tuple[1d array, 1d array, 1d array]."""
+        if self._get_evaluation_cache() is None:
+            return self._taxable_nontaxable_depreciation_cashflows_at(self.VOC, self.sales)
+        else:
+            taxable_cashflow, nontaxable_cashflow, depreciation, sales_coefficients, VOC_coefficients = self._cashflow_decomposition()
+            return (
+                taxable_cashflow + self.sales * sales_coefficients - self.VOC * VOC_coefficients,
+                nontaxable_cashflow.copy(), 
+                depreciation.copy()
+            )
+    
+    def _sales_and_VOC_coefficients(self):
+        """Return fraction of annual sales and variable operating costs incurred by year as a tuple[1d array, 1d array]."""
+        start = self._start
+        sales_coefficients = np.ones(start + self._years)
+        sales_coefficients[:start] = 0.
+        VOC_coefficients = sales_coefficients.copy()
+        w0 = self._startup_time
+        w1 = 1. - w0
+        sales_coefficients[start] = w0 * self.startup_salesfrac + w1
+        VOC_coefficients[start] = w0 * self.startup_VOCfrac + w1
+        return sales_coefficients, VOC_coefficients
+    
+    @evaluation_cached
+    def _cashflow_decomposition(self):
+        """
+        Return taxable cash flows without sales and variable operating costs, 
+        nontaxable cash flows, depreciation, and the sales and variable 
+        operating cost coefficients by year. Taxable cash flows are linear 
+        with respect to sales and variable operating costs.
+        
+        """
+        return (
+            *self._taxable_nontaxable_depreciation_cashflows_at(0., 0.),
+            *self._sales_and_VOC_coefficients(),
+        )
+    
+    def _taxable_nontaxable_depreciation_cashflows_at(self, VOC, sales):
         # Cash flow data and parameters
         # C_FC: Fixed capital
         # C_WC: Working capital
@@ -882,7 +1101,6 @@ class TEA:
         start = self._start
         years = self._years
         FOC = self._FOC(FCI)
-        VOC = self.VOC
         D, C_FC, C_WC, Loan, LP, C, S = np.zeros((7, start + years))
         self._fill_depreciation_array(D, start, years, TDC)
         WC = self.WC_over_FCI * FCI
@@ -891,7 +1109,7 @@ class TEA:
             *taxable_and_nontaxable_cashflows(
                 system.unit_capital_costs if isinstance(system, bst.AgileSystem) else system.cost_units,
                 D, C, S, C_FC, C_WC, Loan, LP,
-                FCI, WC, TDC, VOC, FOC, self.sales,
+                FCI, WC, TDC, VOC, FOC, sales,
                 self._startup_time,
                 self.startup_VOCfrac,
                 self.startup_FOCfrac,
@@ -1050,13 +1268,29 @@ class TEA:
         Return the required additional sales [USD] to reach the breakeven 
         point (NPV = 0) through cash flow analysis. 
         
+        The NPV is piecewise linear with respect to sales (breakpoints 
+        arise from forwarded losses), so the breakeven point is solved 
+        exactly by default (see `exact_breakeven`).
+        
+        Within an evaluation context, the solution is reused until sales
+        or variable operating costs change (e.g., when solving the price 
+        of several products).
+        
         """
+        cache = self._get_evaluation_cache()
+        if cache is not None:
+            key = (self.sales, self.VOC)
+            if 'solve_sales' in cache:
+                last_key, sales = cache['solve_sales']
+                if key == last_key: return sales
+            sales = self._solve_sales()
+            cache['solve_sales'] = (key, sales)
+            return sales
+        return self._solve_sales()
+    
+    def _solve_sales(self):
         discount_factors = (1 + self.IRR)**self._get_duration_array()
-        sales_coefficients = np.ones_like(discount_factors, dtype=float)
-        start = self._start
-        sales_coefficients[:start] = 0
-        w0 = self._startup_time
-        sales_coefficients[start] =  w0*self.startup_salesfrac + (1.-w0)
+        sales_coefficients = self._sales_and_VOC_coefficients()[0]
         taxable_cashflow, nontaxable_cashflow, depreciation = self._taxable_nontaxable_depreciation_cashflows()
         if np.isnan(taxable_cashflow).any():
             warn('nan encountered in cashflow array; resimulating system', category=RuntimeWarning)
@@ -1071,6 +1305,54 @@ class TEA:
                 discount_factors,
                 self._fill_tax_and_incentives)
         x0 = self._sales if np.isfinite(self._sales) else 0
+        if self.exact_breakeven:
+            if type(self)._fill_tax_and_incentives is TEA._fill_tax_and_incentives:
+                sales = solve_breakeven_sales(
+                    taxable_cashflow, nontaxable_cashflow, sales_coefficients,
+                    discount_factors, self.income_tax, x0, 2 * taxable_cashflow.size + 1,
+                )
+                if np.isnan(sales) or abs(NPV_with_sales(sales, *args)) > 100.:
+                    sales = self._solve_sales_iteratively(x0, args)
+            else:
+                sales, linear = self._solve_sales_by_probing_linearity(x0, args)
+                if not linear: sales = self._solve_sales_iteratively(sales, args)
+        else:
+            sales = self._solve_sales_iteratively(x0, args)
+        self._sales = sales
+        return sales
+    
+    def _solve_sales_by_probing_linearity(self, x0, args, maxiter=20):
+        # Taxes and incentives may have breakpoints other than those of 
+        # forwarded losses. Within each segment of forwarded losses, assume 
+        # the NPV is linear and check the root. Return the root and whether 
+        # the assumption holds (otherwise, the root is only an estimate).
+        taxable_cashflow, _, _, sales_coefficients, *_ = args
+        f = NPV_with_sales
+        sales = x0
+        bracket = np.array([-np.inf, np.inf])
+        for iter in range(maxiter):
+            *_, lb, ub = linear_taxable_earnings_with_forwarded_losses(
+                taxable_cashflow, sales_coefficients, sales
+            )
+            y0 = f(sales, *args)
+            if abs(y0) <= 100.: return sales, True
+            # Probe the slope within the segment
+            dx = 1e-3 * (abs(sales) + 1.)
+            x1 = sales - dx if sales + dx > ub else sales + dx
+            if x1 < lb: break
+            slope = (f(x1, *args) - y0) / (x1 - sales)
+            if slope <= 0.: break
+            root = sales - y0 / slope
+            if lb <= root <= ub:
+                if abs(f(root, *args)) <= 100.: return root, True
+                sales = root
+                break
+            root = next_breakeven_sales_guess(sales, y0, root, lb, ub, bracket)
+            if np.isnan(root): break
+            sales = root
+        return sales, False
+    
+    def _solve_sales_iteratively(self, x0, args):
         f = NPV_with_sales
         y0 = f(x0, *args)
         x1 = x0 - y0 / self._years # First estimate
@@ -1080,7 +1362,6 @@ class TEA:
         except:
             bracket = flx.find_bracket(f, x0, x1, args=args)
             sales = flx.IQ_interpolation(f, *bracket, args=args, xtol=10, ytol=100, maxiter=1000, checkiter=False)
-        self._sales = sales
         return sales
     
     def __repr__(self):
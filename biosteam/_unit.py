@@ -72,6 +72,21 @@ def phenomena_oriented_run(self):
     else:
         self._energy_variable = None
 
+def get_auxiliary_results(auxiliaries):
+    # Design results, purchase costs, and utilities by auxiliary name 
+    # for validation of design-only auxiliaries
+    results = {}
+    for name, unit in auxiliaries:
+        if not (isinstance(unit, Unit) and (unit._design or unit._cost)): continue
+        for key, value in unit.design_results.items():
+            results[name, key] = value
+        for key, value in unit.baseline_purchase_costs.items():
+            results[name, key] = value
+        results[name, 'Power'] = unit.power_utility.rate
+        results[name, 'Duty'] = sum([i.unit_duty for i in unit.heat_utilities])
+        results[name, 'Parallel'] = unit.parallel.get('self', 1)
+    return results
+
 class Unit(AbstractUnit):
     """
     Abstract class for Unit objects. Child objects must contain
@@ -272,6 +287,19 @@ class Unit(AbstractUnit):
     #: [str] The energy variable for phenomena-oriented simulation.
     _energy_variable: str = None
 
+    #: [int] Number of times any unit operation has been designed and costed.
+    #: Systems use this counter to invalidate cached aggregate results.
+    _summary_count: int = 0
+
+    #: [bool] Whether to size and cost auxiliary units from their design inputs
+    #: (e.g., flow rate, pressure rise, duty) without simulating their mass and
+    #: energy balances.
+    _design_only_auxiliaries: bool = True
+
+    #: [bool] Whether to check design-only results of auxiliary units against
+    #: full simulation of auxiliary units.
+    _validate_design_only_auxiliaries: bool = False
+
     ### Abstract methods ###
     
     #: Create auxiliary components.
@@ -1185,6 +1213,7 @@ class Unit(AbstractUnit):
     
     def _summary(self, design_kwargs=None, cost_kwargs=None, lca_kwargs=None):
         """Run design/cost/LCA algorithms and compile results."""
+        Unit._summary_count += 1
         self._check_run()
         if not (self._design or self._cost): return
         if not self._skip_simulation_when_inlets_are_empty or not all([i.isempty() for i in self._ins]): 
@@ -1195,6 +1224,40 @@ class Unit(AbstractUnit):
         self._load_costs()
         self._load_operation_costs()
 
+    def _size_auxiliaries(self, design_only, full, auxiliaries=None):
+        """
+        Size and cost auxiliary units by calling `design_only`, a function
+        which sizes auxiliary units from their design inputs without
+        running their mass and energy balances. If design-only auxiliaries
+        are disabled, `full` (which fully simulates auxiliary units) is called 
+        instead. In validation mode, both are called and design results, 
+        purchase costs, and utilities of auxiliary units (defaults to all
+        auxiliary units) must agree.
+        """
+        if not self._design_only_auxiliaries: return full()
+        if self._validate_design_only_auxiliaries:
+            if auxiliaries is None: 
+                auxiliaries = list(self.get_auxiliary_units_with_names())
+            else:
+                auxiliaries = [(i.ID, i) for i in auxiliaries]
+            full()
+            expected = get_auxiliary_results(auxiliaries)
+            design_only()
+            actual = get_auxiliary_results(auxiliaries)
+            for name, value in expected.items():
+                other = actual.get(name)
+                if isinstance(value, str) or other is None or isinstance(other, str):
+                    agree = value == other
+                else:
+                    agree = np.allclose(value, other, rtol=1e-6, atol=1e-9)
+                if not agree:
+                    raise RuntimeError(
+                        f'{self!r} design-only auxiliary result {name!r} is '
+                        f'{other!r} but full simulation gives {value!r}'
+                    )
+        else:
+            design_only()
+
     def _load_operation_costs(self):
         ins = self._ins._streams
         outs = self._outs._streams
@@ -22,6 +22,7 @@ from ._feature import MockFeature
 from ._utils import var_indices, var_columns, indices_to_multiindex
 from ._prediction import ConvergenceModel
 from .._unit import Unit
+from .._tea import TEA
 from biosteam.exceptions import FailedEvaluation
 from warnings import warn
 from collections.abc import Sized
@@ -29,9 +30,11 @@ from biosteam.utils import TicToc
 from typing import Optional, Callable
 from ._parameter import Parameter
 from .evaluation_tools import load_default_parameters
+from .evaluation_tools.in_parallel import map_chunks_in_parallel
 import pickle
+import multiprocessing as mp
 
-__all__ = ('Model', 'EasyInputModel')
+__all__ = ('Model', 'EasyInputModel', 'DynamicEnsemble')
 
 def replace_nones(values, replacement):
     for i, j in enumerate(values):
@@ -89,6 +92,63 @@ if CP4:
     del signature, save_repr_init, shapes, baseshapes, Distribution, i
 del version_components, CP_MAJOR, CP_MINOR, CP4
 
+# %% Ensembles of dynamic simulations
+
+class DynamicEnsemble:
+    """
+    Create a DynamicEnsemble object that holds the tracked time-series data 
+    and integration status of dynamic simulations over a set of samples.
+    
+    Parameters
+    ----------
+    t : 1d array
+        Time points.
+    data : 3d array
+        Tracked data of each sample (samples x time x variables). Time 
+        points that were not reached are NaN.
+    header : pandas.MultiIndex
+        Names of tracked variables.
+    status : pandas.DataFrame
+        Integration status of each sample, with an 'status' column of 
+        'success', 'event' (terminated by an event), 'stiff' (step size became
+        too small), 'failed' (other integration failures), or 'error' 
+        (an exception was raised), as well as the solver's 'message' and the 
+        number of right-hand side evaluations ('nfev').
+        
+    """
+    __slots__ = ('t', 'data', 'header', 'status')
+    
+    def __init__(self, t, data, header, status):
+        self.t = t
+        self.data = data
+        self.header = header
+        self.status = status
+    
+    @property
+    def failed(self):
+        """Indices of samples that failed to integrate."""
+        status = self.status['status']
+        return status.index[~status.isin(('success', 'event'))]
+    
+    def to_frame(self, sample):
+        """Return the tracked data of a sample as a DataFrame."""
+        return pd.DataFrame(self.data[sample], index=pd.Index(self.t, name='t'), columns=self.header)
+    
+    def __repr__(self):
+        N_samples, N_time, N_variables = self.data.shape
+        return (f"<{type(self).__name__}: {N_samples} samples, {N_time} time points, "
+                f"{N_variables} variables, {len(self.failed)} failed>")
+
+
+def integration_status(sol):
+    if sol is None: return 'error', 'evaluation failed', 0
+    elif sol.status == 0: status = 'success'
+    elif sol.status == 1: status = 'event'
+    elif 'step size' in sol.message: status = 'stiff'
+    else: status = 'failed'
+    return status, sol.message, sol.nfev
+
+
 # %% Simulation of process systems
 
 class Model:
@@ -530,18 +590,23 @@ class Model:
         else:
             return self._specification() if self._specification else self._system.simulate(**kwargs)
     
+    def _evaluate_indicators(self):
+        # TEA intermediates are shared across indicators of the same sample
+        with TEA.evaluation_context:
+            return [i() for i in self.indicators]
+    
     def _evaluate_sample(self, sample, convergence_model=None, **kwargs):
         state_updated = False
         try:
             self._update_state(sample, convergence_model, **kwargs)
             state_updated = True
-            return [i() for i in self.indicators]
+            return self._evaluate_indicators()
         except Exception as exception:
             if self.retry_evaluation and not state_updated:
                 self._reset_system()
                 try:
                     self._update_state(sample, convergence_model, **kwargs)
-                    return [i() for i in self.indicators]
+                    return self._evaluate_indicators()
                 except Exception as new_exception: 
                     exception = new_exception
             if self._exception_hook: 
@@ -827,8 +892,34 @@ class Model:
             
     def single_point_sensitivity(self, 
             etol=0.01, array=False, parameters=None, indicators=None, evaluate=None, 
-            **kwargs
+            pool=None, **kwargs
         ):
+        """
+        Return the baseline indicator values and the indicator values at the 
+        lower and upper bounds of each parameter.
+        
+        Parameters
+        ----------
+        etol : float, optional
+            Relative tolerance of baseline indicator values before and after
+            evaluating sensitivity. Defaults to 0.01.
+        array : bool, optional
+            Whether to return arrays instead of pandas objects. Defaults to False.
+        parameters : Iterable[Parameter], optional
+            Defaults to all parameters.
+        indicators : Iterable[Indicator], optional
+            Defaults to all indicators.
+        evaluate : Callable, optional
+            Should return indicator values given a sample. Defaults to 
+            evaluating indicators.
+        pool : int or Pool, optional
+            Number of worker processes or a pool object. Parameters are 
+            distributed across workers in contiguous chunks, each starting 
+            from the baseline recycle data. Defaults to serial evaluation.
+        kwargs : dict
+            Any keyword arguments passed to :func:`biosteam.System.simulate`.
+            
+        """
         if parameters is None: parameters = self.parameters
         bounds = [i.bounds for i in parameters]
         sample = [i.baseline for i in parameters]
@@ -842,6 +933,7 @@ class Model:
         baseline_1 = np.array(evaluate(sample, **kwargs))
         sys = self.system
         if not sys.isdynamic: kwargs['recycle_data'] = sys.get_recycle_data()
+        sample_bounds = []
         for i in index:
             sample_lb = sample.copy()
             sample_ub = sample.copy()
@@ -853,8 +945,19 @@ class Model:
                 ub = hook(ub)
             sample_lb[i] = lb
             sample_ub[i] = ub
-            values_lb[i, :] = evaluate(sample_lb, **kwargs)
-            values_ub[i, :] = evaluate(sample_ub, **kwargs)
+            sample_bounds.append((sample_lb, sample_ub))
+        if pool is None:
+            for i, (sample_lb, sample_ub) in enumerate(sample_bounds):
+                values_lb[i, :] = evaluate(sample_lb, **kwargs)
+                values_ub[i, :] = evaluate(sample_ub, **kwargs)
+        else:
+            def evaluate_bounds(chunk):
+                return [(evaluate(sample_lb, **kwargs), evaluate(sample_ub, **kwargs))
+                        for sample_lb, sample_ub in chunk]
+            results = map_chunks_in_parallel(evaluate_bounds, sample_bounds, pool)
+            for i, (lb, ub) in enumerate(results):
+                values_lb[i, :] = lb
+                values_ub[i, :] = ub
         baseline_2 = np.array(evaluate(sample, **kwargs))
         error = np.abs(baseline_2 - baseline_1)
         index, = np.where(error > 1e-6)
@@ -1020,6 +1123,108 @@ class Model:
         finally:
             table[var_indices(self._indicators)] = replace_nones(values, [np.nan] * len(self.indicators))
     
+    def evaluate_ensemble(self, t_eval, pool=None, **kwargs):
+        """
+        Integrate the dynamic system over the loaded samples (an ensemble), 
+        save indicator values to `table`, and return the tracked time-series 
+        data of all samples as a :class:`DynamicEnsemble` object.
+        
+        Parameters
+        ----------
+        t_eval : 1d array
+            Time points at which tracked data is recorded.
+        pool : int or Pool, optional
+            Number of worker processes or a pool object. Samples are 
+            distributed across workers in contiguous chunks. Forked workers 
+            write tracked data directly to a shared array. Defaults to serial 
+            evaluation.
+        kwargs : dict
+            Any keyword arguments passed to :func:`biosteam.System.simulate`.
+            By default, the state of the system is reset before each sample
+            (i.e., `state_reset_hook='reset_cache'`).
+        
+        Notes
+        -----
+        Samples that fail to integrate (or raise an exception, including 
+        while evaluating indicators) do not abort the evaluation; their 
+        indicator values and tracked data are NaN and their status and 
+        exception are reported by the `status` attribute of the ensemble. 
+        The exception hook is only called to notify of failed samples. The structural 
+        Jacobian sparsity pattern and compiled kernels (if any) are reused 
+        across samples.
+        
+        """
+        samples = self._samples
+        if samples is None: raise RuntimeError('must load samples before evaluating')
+        system = self._system
+        if system is None or not system.isdynamic:
+            raise RuntimeError('ensemble evaluation requires a dynamic system')
+        scope = system.scope
+        if not scope.subjects:
+            raise RuntimeError('no tracked subjects; use `System.set_dynamic_tracker` '
+                               'to track subjects before evaluating an ensemble')
+        t_eval = np.asarray(t_eval, dtype=float)
+        kwargs['t_eval'] = t_eval
+        kwargs.setdefault('state_reset_hook', 'reset_cache')
+        header = scope._get_headers()[1:]
+        N_samples = samples.shape[0]
+        shape = (N_samples, t_eval.size, len(header))
+        shared = isinstance(pool, int)
+        if shared: # Inherited by forked workers
+            data = np.frombuffer(mp.RawArray('d', int(np.prod(shape)))).reshape(shape)
+        else:
+            data = np.empty(shape)
+        data[:] = np.nan
+        N_indicators = len(self._indicators)
+        exception_hook = self._exception_hook
+        
+        def evaluate_member(i, send_records):
+            scope.reset_cache()
+            sample = samples[i]
+            try:
+                self._update_state(sample, **kwargs)
+                status, message, nfev = integration_status(scope.sol)
+                if status not in ('success', 'event'):
+                    self._reset_system()
+                    return [np.nan] * N_indicators, status, message, nfev, None
+                values = self._evaluate_indicators()
+            except Exception as exception:
+                if exception_hook: exception_hook(exception, sample)
+                self._reset_system()
+                sol = scope.sol
+                nfev = 0 if sol is None else sol.nfev
+                message = f"[{type(exception).__name__}] {exception}"
+                return [np.nan] * N_indicators, 'error', message, nfev, None
+            ts = scope.time_series
+            ys = scope._get_records()
+            mask = (t_eval >= ts[0]) & (t_eval <= ts[-1])
+            if ts.size != mask.sum() or (ts != t_eval[mask]).any():
+                ys = scope._interpolate_eval(ts, ys, t_eval[mask])[1:]
+            if send_records: 
+                return values, status, message, nfev, (mask, ys.T)
+            data[i, mask] = ys.T
+            return values, status, message, nfev, None
+        
+        index = list(self._index)
+        if pool is None:
+            results = [evaluate_member(i, False) for i in index]
+        else:
+            def evaluate_members(chunk):
+                return [evaluate_member(i, not shared) for i in chunk]
+            results = map_chunks_in_parallel(evaluate_members, index, pool)
+        values = [None] * N_samples
+        status = [None] * N_samples
+        for i, (member_values, *member_status, records) in zip(index, results):
+            values[i] = member_values
+            status[i] = member_status
+            if records is not None: 
+                mask, ys = records
+                data[i, mask] = ys
+        table = self.table
+        table[var_indices(self._indicators)] = replace_nones(values, [np.nan] * N_indicators)
+        status = pd.DataFrame(status, index=table.index, columns=('status', 'message', 'nfev'))
+        return DynamicEnsemble(t_eval, data, header, status)
+    
     def _reset_system(self):
         if self._system is None: return 
         self._system.empty_outlet_streams()
@@ -1040,7 +1245,7 @@ class Model:
             xlfile=None, notify=0, notify_coordinate=True,
             multi_coordinate=False, 
             simulation_independent_coordinate=False,
-            f_evaluate=None
+            f_evaluate=None, pool=None,
         ):
         """
         Evaluate across coordinate and save sample indicators.
@@ -1063,6 +1268,12 @@ class Model:
             Notify elapsed time after given number of scenario evaluations.
         f_evaluate : callable, optional
             Function to evaluate model. Defaults to evaluate method.
+        pool : int or Pool, optional
+            Number of worker processes or a pool object. Coordinate values 
+            (or samples, if the coordinate is independent from simulation) 
+            are distributed across workers in contiguous chunks so that each
+            evaluation starts from the converged state of its neighbour. 
+            Defaults to serial evaluation.
         
         """
         if (isinstance(f_coordinate, Parameter)
@@ -1077,7 +1288,7 @@ class Model:
                     xlfile=xlfile, notify=notify, notify_coordinate=notify_coordinate,
                     multi_coordinate=multi_coordinate,
                     simulation_independent_coordinate=simulation_independent_coordinate,
-                    f_evaluate=f_evaluate
+                    f_evaluate=f_evaluate, pool=pool,
                 )
             finally:
                 f_coordinate.active = active
@@ -1107,22 +1318,32 @@ class Model:
             else:
                 evaluate = evaluate_sample
             N_samples, _ = samples.shape
-            number = 0
             index = self._index
-            N_samples, _ = self.table.shape
             indicator_indices = var_indices(self.indicators)
             shape = (N_samples, N_points)
             indicator_data = {i: np.zeros(shape) for i in indicator_indices}
-            for number, i in enumerate(index, number + 1): 
-                evaluate(samples[i])
-                for j, x in enumerate(coordinate):
-                    f_coordinate(x)
-                    for key, indicator in zip(indicator_data, self.indicators):
-                        data = indicator_data[key]
-                        try:
-                            data[i, j] = indicator()
-                        except:
-                            data[i, j] = None
+            indicators = self.indicators
+            def evaluate_samples(index):
+                results = []
+                for i in index:
+                    evaluate(samples[i])
+                    values = np.zeros([len(indicators), N_points])
+                    for j, x in enumerate(coordinate):
+                        f_coordinate(x)
+                        for k, indicator in enumerate(indicators):
+                            try:
+                                values[k, j] = indicator()
+                            except:
+                                values[k, j] = None
+                    results.append(values)
+                return results
+            if pool is None:
+                results = evaluate_samples(index)
+            else:
+                results = map_chunks_in_parallel(evaluate_samples, index, pool)
+            for i, values in zip(index, results):
+                for key, row in zip(indicator_data, values):
+                    indicator_data[key][i] = row
         else:
             if f_evaluate is None: f_evaluate = self.evaluate
             
@@ -1131,23 +1352,40 @@ class Model:
                 from biosteam.utils import TicToc
                 timer = TicToc()
                 timer.tic()
-                def evaluate(**kwargs):
+                def evaluate(n, **kwargs):
                     f_evaluate(**kwargs)
                     print(f"[Coordinate {n}] Elapsed time: {timer.elapsed_time:.0f} sec")
             else:
-                evaluate = f_evaluate
+                def evaluate(n, **kwargs):
+                    f_evaluate(**kwargs)
+            def evaluate_coordinate(points):
+                results = []
+                for n, x in points:
+                    f_coordinate(*x) if multi_coordinate else f_coordinate(x)
+                    evaluate(n, notify=notify)
+                    results.append(
+                        {i.index: self.table[i.index].to_numpy(copy=True) 
+                         for i in self.indicators}
+                    )
+                return results
+            points = list(enumerate(coordinate))
+            if pool is None:
+                results = evaluate_coordinate(points)
+            else:
+                results = map_chunks_in_parallel(evaluate_coordinate, points, pool)
+                # Update table with results at the last coordinate as in serial evaluation
+                if self.table is not None and results:
+                    for indicator, values in results[-1].items(): 
+                        self.table[indicator] = values
             indicator_data = None
-            for n, x in enumerate(coordinate):
-                f_coordinate(*x) if multi_coordinate else f_coordinate(x)
-                evaluate(notify=notify)
+            for n, columns in enumerate(results):
                 if indicator_data is None:
                     # Initialize data containers dynamically in case samples are loaded during evaluation
-                    N_samples, _ = self.table.shape
-                    indicator_indices = var_indices(self.indicators)
+                    N_samples = len(next(iter(columns.values()))) if columns else self.table.shape[0]
                     shape = (N_samples, N_points)
-                    indicator_data = {i: np.zeros(shape) for i in indicator_indices}
-                for indicator in indicator_data:
-                    indicator_data[indicator][:, n] = self.table[indicator]
+                    indicator_data = {i: np.zeros(shape) for i in columns}
+                for indicator, values in columns.items():
+                    indicator_data[indicator][:, n] = values
         
         if xlfile:
             if multi_coordinate:
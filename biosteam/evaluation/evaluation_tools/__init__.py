@@ -9,9 +9,12 @@
 """
 from . import parameter
 from . import in_parallel
+from . import grid
 
 __all__ = (*parameter.__all__,
-           *in_parallel.__all__)
+           *in_parallel.__all__,
+           *grid.__all__)
 
 from .parameter import *
-from .in_parallel import *
\ No newline at end of file
+from .in_parallel import *
+from .grid import *
\ No newline at end of file
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020-2023, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import numpy as np
+from .in_parallel import map_chunks_in_parallel
+
+__all__ = ('evaluate_on_grid', 'serpentine_order')
+
+def serpentine_order(points):
+    """
+    Return grid points (i.e., tuples of x and y indices) sorted row by row,
+    alternating the direction along x in every other row so that
+    consecutive points are always neighbours.
+
+    """
+    rows = sorted(set([j for i, j in points]))
+    parity = {j: n % 2 for n, j in enumerate(rows)}
+    return sorted(points, key=lambda p: (p[1], -p[0] if parity[p[1]] else p[0]))
+
+def _evaluate_points(f, x, y, points, pool):
+    points = serpentine_order(points)
+    if pool is None:
+        values = [f(x[i], y[j]) for i, j in points]
+    else:
+        values = map_chunks_in_parallel(
+            lambda chunk: [f(x[i], y[j]) for i, j in chunk], points, pool
+        )
+    return points, values
+
+def _coarse_indices(N, n):
+    return np.unique(np.linspace(0, N - 1, max(min(n, N), 2)).round().astype(int))
+
+def _split(i0, i1):
+    return (i0, i1) if i1 - i0 < 2 else (i0, (i0 + i1) // 2, i1)
+
+def _children(i0, i1, j0, j1):
+    xcuts = _split(i0, i1)
+    ycuts = _split(j0, j1)
+    return [(xcuts[a], xcuts[a + 1], ycuts[b], ycuts[b + 1])
+            for b in range(len(ycuts) - 1) for a in range(len(xcuts) - 1)]
+
+def _interpolate(Z, x, y, i0, i1, j0, j1):
+    # Bilinear interpolation of all grid points within a cell
+    tx = (x[i0:i1 + 1] - x[i0]) / (x[i1] - x[i0])
+    ty = (y[j0:j1 + 1] - y[j0]) / (y[j1] - y[j0])
+    tx = tx.reshape([1, -1] + [1] * (Z.ndim - 2))
+    ty = ty.reshape([-1, 1] + [1] * (Z.ndim - 2))
+    return (
+        Z[j0, i0] * (1 - tx) * (1 - ty) + Z[j0, i1] * tx * (1 - ty)
+        + Z[j1, i0] * (1 - tx) * ty + Z[j1, i1] * tx * ty
+    )
+
+def evaluate_on_grid(f, x, y, pool=None, adaptive=False, coarse_n=5,
+                     rtol=0.05, levels=None):
+    """
+    Return an array of results from evaluating `f` at every point of the
+    grid given by `x` and `y`.
+
+    Parameters
+    ----------
+    f : Callable[(float, float), array_like]
+        Should return results given an x and y value.
+    x : 1d array
+        X-coordinates of grid.
+    y : 1d array
+        Y-coordinates of grid.
+    pool : int or Pool, optional
+        Number of worker processes or a pool object with a `map` method
+        (see :func:`map_chunks_in_parallel`). Points are evaluated serially
+        by default.
+    adaptive : bool, optional
+        Whether to refine the grid adaptively starting from a coarse grid.
+        Defaults to False.
+    coarse_n : int, optional
+        Number of points along each dimension of the initial coarse grid.
+        Defaults to 5.
+    rtol : float, optional
+        Tolerance of interpolation error relative to the range of results 
+        evaluated so far. Defaults to 0.05.
+    levels : Iterable[float], optional
+        A cell is also refined if its corners lie on opposite sides of any
+        of these levels (e.g., contour levels).
+
+    Returns
+    -------
+    Z : array[len(y) x len(x) x ...]
+        Results in the same layout as `np.meshgrid(x, y)`.
+
+    Notes
+    -----
+    Points are evaluated in serpentine order so that each simulation starts
+    from the converged state of a neighbouring point. When run in parallel,
+    each worker evaluates a contiguous segment of this path.
+
+    In adaptive mode, cells of the coarse grid are split into quadrants
+    (i.e., a quadtree) wherever results at edge midpoints and centers
+    deviate from a bilinear interpolation of the corners by more than `rtol` 
+    times the range of results, or change between NaN and finite values 
+    (e.g., at infeasible regions and discontinuities). The results at
+    remaining grid points are bilinearly interpolated.
+
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    Nx = x.size
+    Ny = y.size
+    if adaptive:
+        xs = _coarse_indices(Nx, coarse_n)
+        ys = _coarse_indices(Ny, coarse_n)
+        points = [(i, j) for j in ys for i in xs]
+    else:
+        points = [(i, j) for j in range(Ny) for i in range(Nx)]
+    points, values = _evaluate_points(f, x, y, points, pool)
+    values = [np.asarray(i, dtype=float) for i in values]
+    Z = np.full((Ny, Nx, *values[0].shape), np.nan)
+    evaluated = np.zeros((Ny, Nx), bool)
+    for (i, j), value in zip(points, values):
+        Z[j, i] = value
+        evaluated[j, i] = True
+    if not adaptive: return Z
+    if levels is not None: levels = np.asarray(levels, dtype=float)
+    cells = [(xs[a], xs[a + 1], ys[b], ys[b + 1])
+             for b in range(len(ys) - 1) for a in range(len(xs) - 1)]
+    leaves = []
+    while cells:
+        # Evaluate corners of all subcells (i.e., edge midpoints and centers)
+        cells = [i for i in cells if i[1] - i[0] > 1 or i[3] - i[2] > 1]
+        subcells = [_children(*i) for i in cells]
+        new_points = set()
+        for i0, i1, j0, j1 in sum(subcells, []):
+            for point in ((i0, j0), (i1, j0), (i0, j1), (i1, j1)):
+                if not evaluated[point[1], point[0]]: new_points.add(point)
+        if new_points:
+            points, values = _evaluate_points(f, x, y, list(new_points), pool)
+            for (i, j), value in zip(points, values):
+                Z[j, i] = value
+                evaluated[j, i] = True
+        finite = Z[evaluated]
+        finite = finite[np.isfinite(finite).reshape([len(finite), -1]).all(axis=1)]
+        if finite.size:
+            tolerance = rtol * (finite.max(axis=0) - finite.min(axis=0))
+        else:
+            tolerance = np.zeros(Z.shape[2:])
+        refined = []
+        for (i0, i1, j0, j1), children in zip(cells, subcells):
+            xcuts = np.array(_split(i0, i1))
+            ycuts = np.array(_split(j0, j1))
+            points = Z[np.ix_(ycuts, xcuts)]
+            isnan = np.isnan(points)
+            if isnan.all():
+                refine = False
+            elif isnan.any():
+                refine = True
+            else:
+                # Refine where bilinear interpolation from cell corners 
+                # fails to predict edge midpoints and centers
+                predicted = _interpolate(Z, x, y, i0, i1, j0, j1)
+                predicted = predicted[np.ix_(ycuts - j0, xcuts - i0)]
+                refine = (np.abs(points - predicted) > tolerance).any()
+                if not refine and levels is not None:
+                    lb = points.min(axis=(0, 1))
+                    ub = points.max(axis=(0, 1))
+                    refine = any([((lb < i) & (ub >= i)).any() for i in levels])
+            if refine:
+                refined.extend(children)
+            else:
+                leaves.extend(children)
+        cells = refined
+    for i0, i1, j0, j1 in leaves:
+        if i1 - i0 < 2 and j1 - j0 < 2: continue # No interior points
+        interpolated = _interpolate(Z, x, y, i0, i1, j0, j1)
+        block = Z[j0:j1 + 1, i0:i1 + 1]
+        mask = ~evaluated[j0:j1 + 1, i0:i1 + 1]
+        block[mask] = interpolated[mask]
+    return Z
@@ -11,7 +11,80 @@ import numpy as np
 import multiprocessing as mp
 import pandas as pd
 
-__all__ = ('evaluate_coordinate_in_parallel',)
+__all__ = ('evaluate_coordinate_in_parallel', 'map_chunks_in_parallel')
+
+# Jobs registered here are inherited by forked worker processes so that
+# closures over models and systems need not be pickled.
+_jobs = {}
+
+def _run_job(args):
+    key, job, chunk = args
+    if job is None:
+        try:
+            job = _jobs[key]
+        except KeyError:
+            raise RuntimeError(
+                'job not found in worker process; worker processes must be '
+                'forked after the job is registered'
+            ) from None
+    return job(chunk)
+
+def split_into_chunks(items, N_chunks):
+    """
+    Return a list of contiguous chunks of items. Neighbouring items remain
+    together so that each worker may reuse the converged state of the last 
+    item as the initial guess for the next.
+    
+    """
+    N_items = len(items)
+    N_chunks = max(min(N_chunks, N_items), 1)
+    size, remainder = divmod(N_items, N_chunks)
+    chunks = []
+    start = 0
+    for i in range(N_chunks):
+        end = start + size + (i < remainder)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+def map_chunks_in_parallel(job, items, pool):
+    """
+    Return a list of results from evaluating `job` on contiguous chunks
+    of items in parallel.
+    
+    Parameters
+    ----------
+    job : Callable[list, list]
+        Should return a list of results given a chunk of items.
+    items : list
+        Items to evaluate.
+    pool : int or Pool
+        Number of worker processes or a pool object with a `map` method. 
+        If an integer is given, workers are forked from the current process
+        and inherit the current state of all systems. Otherwise, the job 
+        is pickled and sent to the pool (e.g., pools from the `multiprocess` 
+        library may pickle closures).
+    
+    """
+    items = list(items)
+    if isinstance(pool, int):
+        if 'fork' not in mp.get_all_start_methods():
+            raise RuntimeError(
+                "'fork' start method not available; pass a pool "
+                "object that can pickle the job instead"
+            )
+        key = id(job)
+        _jobs[key] = job
+        chunks = split_into_chunks(items, pool)
+        try:
+            with mp.get_context('fork').Pool(len(chunks)) as workers:
+                results = workers.map(_run_job, [(key, None, i) for i in chunks])
+        finally:
+            del _jobs[key]
+    else:
+        chunks = split_into_chunks(items, getattr(pool, '_processes', None) or mp.cpu_count())
+        results = pool.map(_run_job, [(None, job, i) for i in chunks])
+    return [j for i in results for j in i]
 
 def evaluate_coordinate_in_parallel(f_evaluate_at_coordinate, coordinate,
                                     metrics, multi_coordinate=False,
@@ -189,6 +189,10 @@ class BoilerTurbogenerator(bst.Facility):
     # Reverse osmosis (RO) typically rejects 25% of water, but the boiler-feed water is assumed to come after RO.
     # Setting this parameter to a fraction more than zero effectively assumes that this unit accounts for reverse osmosis.
     RO_rejection = 0 
+    #: [bool] Whether to solve the fuel flow rate in closed form (excess 
+    #: electricity is affine in fuel flow rate). If False or if the closed 
+    #: form solution does not balance, the fuel flow rate is solved iteratively.
+    closed_form_fuel_balance = True
     _N_ins = 7
     _N_outs = 3
     _units = {'Flow rate': 'kg/hr',
@@ -370,50 +374,62 @@ class BoilerTurbogenerator(bst.Facility):
         non_empty_feeds = [i for i in (feed_solids, feed_gas) if not i.isempty()]
         boiler_efficiency_basis = self.boiler_efficiency_basis
         fuel_source = self.fuel_source
+        # Heating values of feeds [kJ/hr] and fuel [kJ/kmol] are computed 
+        # only once; all terms are affine in fuel flow rate.
+        if boiler_efficiency_basis == 'LHV':
+            H_feeds = sum([feed.LHV for feed in non_empty_feeds])
+            H_fuel = chemicals[fuel_source].LHV
+        elif boiler_efficiency_basis == 'HHV':
+            H_feeds = sum([feed.HHV for feed in non_empty_feeds])
+            H_fuel = chemicals[fuel_source].HHV
+        else:
+            raise ValueError(
+                f"invalid boiler efficiency basis {boiler_efficiency_basis}; "
+                f"valid values include 'LHV', or 'HHV'"
+            )
+        duty_over_mol = 39000 # kJ / mol-superheated steam 
+        satisfy_system_electricity_demand = self.satisfy_system_electricity_demand
+        if satisfy_system_electricity_demand:
+            boiler = self.cost_items['Boiler']
+            boiler_power_over_flow = boiler.kW / boiler.S
         def calculate_excess_electricity_at_natual_gas_flow(fuel_flow):
             if fuel_flow:
                 fuel_flow = abs(fuel_flow)
                 fuel.imol[fuel_source] = fuel_flow
             else:
                 fuel.empty()
-            if boiler_efficiency_basis == 'LHV':
-                H_combustion = fuel.LHV
-                for feed in non_empty_feeds: H_combustion += feed.LHV
-            elif boiler_efficiency_basis == 'HHV':
-                H_combustion = fuel.HHV
-                for feed in non_empty_feeds: H_combustion += feed.HHV
-            else:
-                raise ValueError(
-                    f"invalid boiler efficiency basis {boiler_efficiency_basis}; "
-                    f"valid values include 'LHV', or 'HHV'"
-                )
+            H_combustion = H_feeds + H_fuel * fuel_flow
             self.H_content = H_content = B_eff * H_combustion 
             self.H_loss_to_emissions = H_combustion - H_content
             H_electricity = H_content - H_steam # Heat available for the turbogenerator
             electricity = H_electricity * TG_eff  # Electricity produced
             self.cooling_duty = electricity - H_electricity
             Design['Work'] = work = electricity / 3600
-            duty_over_mol = 39000 # kJ / mol-superheated steam 
             self.total_steam = H_content / duty_over_mol #: [float] Total steam produced by the boiler (kmol/hr)
             Design['Flow rate'] = flow_rate = self.total_steam * 18.01528
-            
-            if self.satisfy_system_electricity_demand:
-                boiler = self.cost_items['Boiler']
-                rate_boiler = boiler.kW * flow_rate / boiler.S
+            if satisfy_system_electricity_demand:
+                rate_boiler = boiler_power_over_flow * flow_rate
                 return work - self.electricity_demand - rate_boiler
             else:
                 return work
         
         self._excess_electricity_without_fuel = excess_electricity = calculate_excess_electricity_at_natual_gas_flow(0)
         if excess_electricity < 0:
+            # Excess electricity is affine in fuel flow rate (kW per kmol/hr)
+            slope = B_eff * H_fuel * TG_eff / 3600
+            if satisfy_system_electricity_demand:
+                slope -= boiler_power_over_flow * B_eff * H_fuel / duty_over_mol * 18.01528
             f = calculate_excess_electricity_at_natual_gas_flow
-            lb = 0.
-            fuel.imol[fuel_source] = 1
-            ub = - excess_electricity * 3600 / fuel.LHV
-            while f(ub) < 0.: 
-                lb = ub
-                ub *= 2
-            flx.IQ_interpolation(f, lb, ub, xtol=1, ytol=1)
+            if (not self.closed_form_fuel_balance or slope <= 0. 
+                or abs(f(-excess_electricity / slope)) > 1.): 
+                # Validation fallback
+                lb = 0.
+                fuel.imol[fuel_source] = 1
+                ub = - excess_electricity * 3600 / fuel.LHV
+                while f(ub) < 0.: 
+                    lb = ub
+                    ub *= 2
+                flx.IQ_interpolation(f, lb, ub, xtol=1, ytol=1)
         
         if self.cooling_duty > 0.: 
             # In the event that no electricity is produced and the solver
@@ -11,7 +11,12 @@ Created on Sat Aug 22 21:58:19 2020
 """
 import biosteam as bst
 import numpy as np
-from .hxn_synthesis import synthesize_network, StreamLifeCycle
+from .hxn_synthesis import (
+    synthesize_network, StreamLifeCycle, enthalpy_profile, problem_table_targets
+)
+from ...units.heat_exchange import (
+    compute_floating_head_purchase_cost, compute_double_pipe_purchase_cost
+)
 from warnings import warn
 
 __all__ = ('HeatExchangerNetwork',)
@@ -33,6 +38,10 @@ class HeatExchangerNetwork(bst.Facility):
     units : Iterable[Unit], optional
         All unit operations available to the heat exchanger network. Defaults
         to all unit operations in the system.
+    targeting : bool, optional
+        Whether to only estimate minimum utility targets and heat exchanger
+        area through a problem table (without synthesizing a network). 
+        Defaults to False.
     
     Notes
     -----
@@ -41,6 +50,17 @@ class HeatExchangerNetwork(bst.Facility):
     '<sys>_HXN' where <sys> is the name of the system associated to the 
     HeatExchangerNetwork object.
     
+    In targeting mode, no heat exchangers are created. Enthalpy-temperature
+    profiles of streams are computed once per stream state and the minimum
+    utility loads are solved by a problem table. Utility savings are 
+    distributed across agents in proportion to their original duties. The 
+    process-process heat transfer area is estimated by Bath's formula 
+    (assuming `U_targeting` as the overall heat transfer coefficient) and 
+    costed as the minimum number of units, `N_streams - 1`, of equal area.
+    Utility heat exchangers are not recosted. Targeting is useful for fast
+    screening (e.g., within Monte Carlo analysis); synthesized networks 
+    always require at least the targeted utility loads.
+    
     References
     ----------
     .. [1] Seider, W. D., Lewin,  D. R., Seader, J. D., Widagdo, S., Gani, R.,
@@ -101,15 +121,22 @@ class HeatExchangerNetwork(bst.Facility):
     acceptable_energy_balance_error = 0.02
     raise_energy_balance_error = False
     network_priority = -2
+    #: [float] Overall heat transfer coefficient [kW/m2/K] used to estimate 
+    #: heat exchanger area in targeting mode.
+    U_targeting = 0.5
+    #: [int] Number of points evaluated for stream enthalpy profiles in 
+    #: targeting mode.
+    N_profile_points = 8
     _N_ins = 0
     _N_outs = 0
     _units= {'Flow rate': 'kg/hr',
-             'Work': 'kW'}
+             'Work': 'kW',
+             'Area': 'ft^2'}
     
     def __init__(self, ID='', T_min_app=5., units=None, ignored=None, Qmin=1e-3,
                  force_ideal_thermo=False, cache_network=False, avoid_recycle=False,
                  acceptable_energy_balance_error=None, replace_unit_heat_utilities=False,
-                 sort_hus_by_T=False):
+                 sort_hus_by_T=False, targeting=False):
         bst.Facility.__init__(self, ID, None, None)
         self.T_min_app = T_min_app
         self.units = units
@@ -120,6 +147,8 @@ class HeatExchangerNetwork(bst.Facility):
         self.avoid_recycle = avoid_recycle
         self.replace_unit_heat_utilities = replace_unit_heat_utilities
         self.sort_hus_by_T = sort_hus_by_T
+        self.targeting = targeting
+        self._enthalpy_profiles = {}
         if acceptable_energy_balance_error is not None:
             self.acceptable_energy_balance_error = acceptable_energy_balance_error
         
@@ -143,7 +172,77 @@ class HeatExchangerNetwork(bst.Facility):
     def _design(self): pass
     def _load_capital_costs(self): pass # Do not replace installed costs
 
+    def _get_enthalpy_profile(self, hx):
+        inlet = hx.ins[0]
+        outlet = hx.outs[0]
+        mol = inlet.mol.to_array()
+        key = (inlet.T, outlet.T, inlet.P, inlet.phases, outlet.phases, outlet.H)
+        profiles = self._enthalpy_profiles
+        if hx in profiles:
+            other_key, other_mol, profile = profiles[hx]
+            if key == other_key and (mol == other_mol).all(): return profile
+        if self.force_ideal_thermo:
+            thermo = inlet.thermo.ideal()
+            inlet = inlet.copy(thermo=thermo)
+            outlet = outlet.copy(thermo=thermo)
+        profiles[hx] = (key, mol, profile) = (
+            key, mol, enthalpy_profile(inlet, outlet, self.N_profile_points)
+        )
+        return profile
+
+    def _cost_targets(self):
+        hx_utils = self._get_original_heat_utilties()
+        hus_heating = [hu for hu in hx_utils if hu.duty > 0]
+        hus_cooling = [hu for hu in hx_utils if hu.duty < 0]
+        cold_profiles = [self._get_enthalpy_profile(hu.unit) for hu in hus_heating]
+        hot_profiles = [self._get_enthalpy_profile(hu.unit) for hu in hus_cooling]
+        hot_util_load, cold_util_load, pinch_T, area = problem_table_targets(
+            hot_profiles, cold_profiles, self.T_min_app, self.U_targeting
+        )
+        # Targets are in terms of process stream enthalpies; utility duties 
+        # also account for heat transfer efficiencies
+        stream_heat = sum([Hs[-1] - Hs[0] for Ts, Hs in cold_profiles])
+        stream_cool = sum([Hs[-1] - Hs[0] for Ts, Hs in hot_profiles])
+        heat_fraction = min(max(hot_util_load / stream_heat, 0.), 1.) if stream_heat else 1.
+        cool_fraction = min(max(cold_util_load / stream_cool, 0.), 1.) if stream_cool else 1.
+        self.original_heat_util_load = original_heat = sum([hu.duty for hu in hus_heating])
+        self.original_cool_util_load = original_cool = sum([abs(hu.duty) for hu in hus_cooling])
+        self.actual_heat_util_load = hot_util_load = heat_fraction * original_heat
+        self.actual_cool_util_load = cold_util_load = cool_fraction * original_cool
+        self.pinch_T = pinch_T
+        self.target_area = area = 10.763 * area # to ft2
+        self.energy_balance_percent_error = 0.
+        self.design_results['Area'] = area
+        N_units = len(hx_utils) - 1
+        if area and N_units > 0:
+            A = area / N_units
+            if A < 150: # Double pipe
+                purchase_cost = N_units * compute_double_pipe_purchase_cost(max(A, 2.1718), bst.CE)
+                F_BM = 1.8
+            else: # Shell and tube
+                purchase_cost = N_units * compute_floating_head_purchase_cost(A, bst.CE)
+                F_BM = 3.17
+        else:
+            purchase_cost = F_BM = 0.
+        self.purchase_costs['Heat exchangers'] = self.baseline_purchase_costs['Heat exchangers'] = purchase_cost
+        self.installed_costs['Heat exchangers'] = F_BM * purchase_cost
+        heat_utilities = []
+        for hus, load, original_load in ((hus_heating, hot_util_load, original_heat),
+                                         (hus_cooling, cold_util_load, original_cool)):
+            if not original_load: continue
+            savings = 1. - load / original_load
+            if not savings: continue
+            for hu in bst.HeatUtility.sum_by_agent(hus):
+                hu.scale(savings)
+                # Negative duty without switching heat/cool (i.e. negative costs)
+                hu.reverse()
+                heat_utilities.append(hu)
+        self.heat_utilities = heat_utilities
+
     def _cost(self):
+        if self.targeting: 
+            self._cost_targets()
+            return
         sys = self.system
         hx_utils = self._get_original_heat_utilties()
         flowsheet = bst.Flowsheet(sys.ID + '_HXN')
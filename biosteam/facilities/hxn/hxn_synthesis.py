@@ -14,7 +14,8 @@ import numpy as np
 import biosteam as bst
 from warnings import warn
 
-__all__ = ('StreamLifeCycle', 'synthesize_network')
+__all__ = ('StreamLifeCycle', 'synthesize_network', 'enthalpy_profile',
+           'problem_table_targets')
 
 class LifeStage:
         
@@ -226,6 +227,147 @@ def temperature_interval_pinch_analysis(hus,
            streams_quenched
             
         
+def enthalpy_profile(inlet, outlet, N_points=8, dT_isothermal=0.01):
+    """
+    Return temperatures [K] and enthalpies [kJ/hr] of a stream heated or
+    cooled from the `inlet` to the `outlet` state, sorted by temperature.
+    
+    Intermediate points are evaluated by vapor-liquid equilibrium only if
+    the stream may change phase; otherwise, only the temperature is set.
+    The end points are taken from the streams as given.
+    
+    """
+    T_in = inlet.T
+    T_out = outlet.T
+    P = inlet.P
+    H_in = inlet.H
+    H_out = outlet.H
+    if abs(T_out - T_in) < dT_isothermal:
+        # Phase change at constant temperature; spread the duty over a 
+        # narrow temperature range to keep the profile invertible.
+        if H_out > H_in: T_out = T_in + dT_isothermal
+        else: T_out = T_in - dT_isothermal
+        Ts = np.array([T_in, T_out])
+        Hs = np.array([H_in, H_out])
+    else:
+        Ts = np.linspace(T_in, T_out, N_points)
+        Hs = np.zeros(N_points)
+        Hs[0] = H_in
+        Hs[-1] = H_out
+        stream = inlet.copy()
+        sensible = not (isinstance(inlet, bst.MultiStream) 
+                        or isinstance(outlet, bst.MultiStream)
+                        or inlet.phase != outlet.phase)
+        for i in range(1, N_points - 1):
+            T = Ts[i]
+            if sensible: 
+                stream.T = T
+            else:
+                try: 
+                    stream.vle(T=T, P=P)
+                except:
+                    warn(f"could not solve VLE for {repr(stream)}; "
+                          "enthalpy profile linearly interpolated", RuntimeWarning)
+                    Hs[i] = H_in + (H_out - H_in) * (T - T_in) / (T_out - T_in)
+                    continue
+            Hs[i] = stream.H
+    if Ts[0] > Ts[-1]: 
+        Ts = Ts[::-1]
+        Hs = Hs[::-1]
+    return Ts, Hs
+
+def _composite_curve(profiles):
+    # Cumulative heat content [kJ/hr] of a set of streams above their lowest 
+    # temperature at every profile temperature [K], in ascending order.
+    T = np.unique(np.concatenate([Ts for Ts, Hs in profiles]))
+    Q = np.zeros(T.size)
+    for Ts, Hs in profiles: Q += np.abs(np.interp(T, Ts, Hs) - Hs[0])
+    return T, Q
+
+def _log_mean(dT1, dT2):
+    dT1 = np.maximum(dT1, 1e-6)
+    dT2 = np.maximum(dT2, 1e-6)
+    ratio = dT1 / dT2
+    similar = np.abs(ratio - 1.) < 1e-6
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lm = np.where(similar, 0.5 * (dT1 + dT2), (dT1 - dT2) / np.log(ratio))
+    return lm
+
+def problem_table_targets(hot_profiles, cold_profiles, T_min_app=5., U=0.5):
+    """
+    Return minimum utility targets and a heat transfer area estimate of the 
+    heat recovery region for the given hot and cold stream profiles. 
+    
+    Parameters
+    ----------
+    hot_profiles : Iterable[tuple[1d array, 1d array]]
+        Temperatures [K] and enthalpies [kJ/hr] of streams that require 
+        cooling, sorted by temperature (see :func:`enthalpy_profile`).
+    cold_profiles : Iterable[tuple[1d array, 1d array]]
+        Temperatures [K] and enthalpies [kJ/hr] of streams that require 
+        heating, sorted by temperature.
+    T_min_app : float, optional
+        Minimum approach temperature [K]. Defaults to 5.
+    U : float, optional
+        Overall heat transfer coefficient [kW/m2/K]. Defaults to 0.5.
+    
+    Returns
+    -------
+    hot_util_load : float
+        Minimum heating utility duty [kJ/hr].
+    cold_util_load : float
+        Minimum cooling utility duty [kJ/hr].
+    pinch_T : float
+        Pinch temperature of cold streams [K]; hot streams are pinched at
+        `pinch_T + T_min_app`. NaN if there is no pinch.
+    area : float
+        Heat transfer area [m2] of process-process heat exchange estimated 
+        by Bath's formula over the balanced composite curves, 
+        :math:`A = \\sum_k \\Delta Q_k / (U \\Delta T_{lm,k})`.
+    
+    Notes
+    -----
+    Like the temperature interval pinch analysis used for synthesis, hot 
+    stream temperatures are shifted down by the minimum approach 
+    temperature while cold streams remain unshifted. Stream heat loads 
+    within each interval are interpolated from the enthalpy profiles, 
+    so the problem table is evaluated without additional phase equilibrium
+    calculations.
+    
+    """
+    hot_profiles = [(Ts - T_min_app, Hs) for Ts, Hs in hot_profiles]
+    cold_profiles = list(cold_profiles)
+    profiles = hot_profiles + cold_profiles
+    if not profiles: return 0., 0., np.nan, 0.
+    boundaries = np.unique(np.concatenate([Ts for Ts, Hs in profiles]))[::-1]
+    surplus = np.zeros(boundaries.size - 1)
+    for Ts, Hs in hot_profiles: 
+        surplus += np.abs(np.diff(np.interp(boundaries, Ts, Hs)))
+    for Ts, Hs in cold_profiles: 
+        surplus -= np.abs(np.diff(np.interp(boundaries, Ts, Hs)))
+    cascade = np.zeros(boundaries.size)
+    cascade[1:] = np.cumsum(surplus)
+    index = cascade.argmin()
+    hot_util_load = -cascade[index]
+    cold_util_load = cascade[-1] + hot_util_load
+    pinch_T = boundaries[index] if 0 < index < boundaries.size - 1 else np.nan
+    
+    # Bath's formula over the heat recovery region of the composite curves
+    if hot_profiles and cold_profiles:
+        T_hot, Q_hot = _composite_curve([(Ts + T_min_app, Hs) for Ts, Hs in hot_profiles])
+        T_cold, Q_cold = _composite_curve(cold_profiles)
+        Q_hot -= cold_util_load
+        recovered = Q_hot[-1]
+    else:
+        recovered = 0.
+    if recovered > 0.:
+        Q = np.unique(np.concatenate([Q_hot, Q_cold]).clip(0., recovered))
+        dT = np.interp(Q, Q_hot, T_hot) - np.interp(Q, Q_cold, T_cold)
+        area = (np.diff(Q) / _log_mean(dT[:-1], dT[1:])).sum() / (3600. * U)
+    else:
+        area = 0.
+    return hot_util_load, cold_util_load, pinch_T, area
+    
 def load_duties(streams, streams_quenched, pinch_T_arr, T_out_arr, indices, is_cold, Q_hot_side, Q_cold_side):
     for index in indices:
         stream = streams[index].copy()
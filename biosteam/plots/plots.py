@@ -1381,7 +1381,8 @@ plot_kde_2d = plot_uncertainty_pairs_2d
 def generate_contour_data(
         z_at_xy, xlim, ylim, n=5, file=None, load=True, save=True,
         strict_convergence=None, filterwarnings=True, smooth=True, 
-        vectorize=True, args=(),
+        vectorize=True, args=(), pool=None, adaptive=False, coarse_n=5,
+        rtol=0.05, levels=None,
     ):
     if strict_convergence is not None: 
         bst.System.strict_convergence = strict_convergence
@@ -1396,19 +1397,25 @@ def generate_contour_data(
         if filterwarnings:
             from warnings import filterwarnings
             filterwarnings('ignore')
-        data0 = np.asarray(z_at_xy(x0, y0, *args))
-        shape = data0.shape
-        if len(shape) == 1:
-            shape = f"({shape[0]})"
-        if vectorize:
-            N_args = len(args)
-            Z_at_XY = np.vectorize(
-                z_at_xy, signature=f'(),()->{shape}',
-                excluded=tuple(range(2, 2 + N_args)),
+        if adaptive or pool is not None:
+            Z = bst.evaluation.evaluation_tools.evaluate_on_grid(
+                lambda x, y: z_at_xy(x, y, *args), x, y, pool=pool, 
+                adaptive=adaptive, coarse_n=coarse_n, rtol=rtol, levels=levels,
             )
         else:
-            Z_at_XY = z_at_xy
-        Z = Z_at_XY(X, Y, *args)
+            data0 = np.asarray(z_at_xy(x0, y0, *args))
+            shape = data0.shape
+            if len(shape) == 1:
+                shape = f"({shape[0]})"
+            if vectorize:
+                N_args = len(args)
+                Z_at_XY = np.vectorize(
+                    z_at_xy, signature=f'(),()->{shape}',
+                    excluded=tuple(range(2, 2 + N_args)),
+                )
+            else:
+                Z_at_XY = z_at_xy
+            Z = Z_at_XY(X, Y, *args)
         if smooth: # Smooth curves due to avoid discontinuities
             from scipy.ndimage.filters import gaussian_filter
             A, B, *other = Z.shape
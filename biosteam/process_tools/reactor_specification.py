@@ -66,7 +66,8 @@ class ReactorSpecification:
                  'titer',
                  'productivity',
                  'production',
-                 'reaction_name')
+                 'reaction_name',
+                 '_titer_model')
     
     def __init__(self, reactor, reaction_name, substrates, products, yield_, titer, 
                  productivity, production):
@@ -78,7 +79,7 @@ class ReactorSpecification:
         self.titer = titer #: [float] g products / L effluent
         self.productivity = productivity  #: [float] g products / L effluent / hr
         self.production = float(production) #: [float] kg / hr
-        self.reaction_name
+        self._titer_model = None
       
     def load_specifications(self, yield_=None, titer=None, productivity=None,
                             production=None):
@@ -138,7 +139,8 @@ class ReactorSpecification:
         return data
 
     def evaluate_across_TRY(self, system, 
-            titer, yield_, metrics, productivities):
+            titer, yield_, metrics, productivities, 
+            pool=None, adaptive=False, coarse_n=5, rtol=0.05):
         """
         Evaluate metrics at given titer and yield across a set of 
         productivities. Return an array with the all metric results.
@@ -153,6 +155,21 @@ class ReactorSpecification:
             Should return a number given no parameters.
         productivities : array_like[P elements]
             Productivities to evaluate.
+        pool : int or Pool, optional
+            Number of worker processes or a pool object with a `map` method.
+            If given, titer and yield must be a meshgrid (i.e., titer
+            varies along columns and yield along rows).
+        adaptive : bool, optional
+            Whether to refine the titer-yield grid adaptively and interpolate
+            results at the remaining points (see 
+            :func:`~biosteam.evaluation.evaluation_tools.evaluate_on_grid`). 
+            Titer and yield must be a meshgrid. Defaults to False.
+        coarse_n : int, optional
+            Number of points along each dimension of the initial coarse grid
+            in adaptive mode. Defaults to 5.
+        rtol : float, optional
+            Relative variation of results between grid points that triggers 
+            refinement in adaptive mode. Defaults to 0.05.
         
         Returns
         -------
@@ -171,6 +188,23 @@ class ReactorSpecification:
         results [Y x T x M x P]
         
         """
+        if adaptive or pool is not None:
+            from ..evaluation.evaluation_tools import evaluate_on_grid
+            titer = np.asarray(titer)
+            yield_ = np.asarray(yield_)
+            if titer.ndim != 2 or titer.shape != yield_.shape:
+                raise ValueError('titer and yield must be a meshgrid')
+            T = titer[0]
+            Y = yield_[:, 0]
+            if not ((titer == T).all() and (yield_ == Y[:, None]).all()):
+                raise ValueError('titer and yield must be a meshgrid')
+            productivities = np.asarray(productivities)
+            return evaluate_on_grid(
+                lambda titer, yield_: evaluate_across_TRY.pyfunc(
+                    self, system, titer, yield_, metrics, productivities
+                ),
+                T, Y, pool=pool, adaptive=adaptive, coarse_n=coarse_n, rtol=rtol,
+            )
         return evaluate_across_TRY(self, system, 
                                    titer, yield_, 
                                    metrics, productivities)
@@ -236,7 +270,11 @@ class ReactorSpecification:
         Notes
         -----
         Substrate concentration in bioreactor feed is adjusted to satisfy this 
-        specification. 
+        specification. Titer is first solved in closed form assuming product 
+        formation and effluent volume are affine in substrate loading (fitted 
+        by two reactor evaluations and cached while the yield and the 
+        composition of the rest of the feed remain unchanged). If the solution
+        cannot be verified, the titer is solved iteratively.
         
         Warnings
         --------
@@ -248,13 +286,94 @@ class ReactorSpecification:
         feed.imol[self.products] = 0.
         substrates = feed.imass[self.substrates].sum()
         self.titer = titer
-        try:
-            flx.aitken_secant(f, substrates, ytol=1e-5)
-        except:
-            flx.IQ_interpolation(f, 1e-12, 0.50 * feed.F_mass, ytol=1e-5, maxiter=100)
+        if not self._load_titer_analytically(titer):
+            try:
+                flx.aitken_secant(f, substrates, ytol=1e-5)
+            except:
+                flx.IQ_interpolation(f, 1e-12, 0.50 * feed.F_mass, ytol=1e-5, maxiter=100)
             
         self.reactor.tau = titer / self.productivity
     
+    def substrate_loadings(self, titers):
+        """
+        Return the substrate flow rates [kg/hr] in the reactor feed required
+        to achieve the given titers, assuming that product formation and 
+        effluent volume are affine in substrate loading (e.g., reactions 
+        with fixed conversion). Infeasible titers are returned as NaN.
+        
+        Parameters
+        ----------
+        titers : array_like
+            Titers in g products / L effluent.
+        
+        """
+        a, b, c, d = self._get_titer_model(refit=False)
+        scalar = np.ndim(titers) == 0
+        titers = np.atleast_1d(np.asarray(titers, dtype=float))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            substrates = (titers * c - a) / (b - titers * d)
+        substrates[~(substrates > 1e-16)] = np.nan
+        return float(substrates[0]) if scalar else substrates
+    
+    def _titer_model_key(self):
+        # The model is fitted per unit flow of non-substrate chemicals, so 
+        # the key only depends on their composition (which does not change
+        # when production is loaded)
+        feed = self.feed
+        mol = feed.mol.to_array()
+        chemicals = feed.chemicals
+        mol[chemicals.get_index(self.substrates)] = 0.
+        mol[chemicals.get_index(self.products)] = 0.
+        F_mol = mol.sum()
+        if F_mol: mol /= F_mol
+        return (np.asarray(self.reaction.X).tobytes(), feed.T, feed.P, mol.tobytes()), F_mol
+    
+    def _get_titer_model(self, refit):
+        # Coefficients of product formation (a + b * substrates) [kg/hr] and 
+        # effluent volume (c + d * substrates) [m3/hr]; intercepts scale with 
+        # the flow rate of non-substrate chemicals
+        key, F_mol = self._titer_model_key()
+        titer_model = self._titer_model
+        if not refit and titer_model is not None and titer_model[0] == key:
+            _, F_mol_fit, (a, b, c, d) = titer_model
+            if F_mol_fit: 
+                scale = F_mol / F_mol_fit
+                a *= scale
+                c *= scale
+            return a, b, c, d
+        feed = self.feed
+        reactor = self.reactor
+        streams = [feed, *reactor.outs]
+        data = [i.get_data() for i in streams]
+        substrates = feed.imass[self.substrates].sum()
+        if substrates <= 1e-16: substrates = 0.1 * feed.F_mass
+        s1 = substrates
+        s2 = 0.5 * substrates
+        try:
+            P1, V1 = self._products_and_volume(s1)
+            P2, V2 = self._products_and_volume(s2)
+        finally:
+            for i, j in zip(streams, data): i.set_data(j)
+        b = (P1 - P2) / (s1 - s2)
+        d = (V1 - V2) / (s1 - s2)
+        coefficients = (P1 - b * s1, b, V1 - d * s1, d)
+        self._titer_model = (key, F_mol, coefficients)
+        return coefficients
+    
+    def _load_titer_analytically(self, titer):
+        # Return whether the titer was loaded by solving the titer as a ratio
+        # of affine functions of substrate loading; the solution is verified
+        # by rerunning the reactor.
+        f = self._titer_objective_function
+        for refit in (False, True):
+            a, b, c, d = self._get_titer_model(refit)
+            denominator = b - titer * d
+            if denominator <= 0.: return False 
+            substrates = (titer * c - a) / denominator
+            if substrates <= 1e-16: return False
+            if abs(f(substrates)) < 1e-5: return True
+        return False
+    
     def load_productivity(self, productivity):
         """
         Load productivity specification.
@@ -307,14 +426,30 @@ class ReactorSpecification:
         else:
             return 0.
     
+    def _load_substrates(self, substrates):
+        feed = self.feed
+        mass_substrates = feed.imass[self.substrates]
+        r_substrates = mass_substrates / mass_substrates.sum()
+        feed.imass[self.substrates] = substrates * r_substrates
+    
+    def _products_and_volume(self, substrates):
+        """
+        Return the mass flow rate of products [kg/hr] and the volumetric 
+        flow rate of the effluent [m3/hr] given the substrate flow rate [kg/hr].
+        """
+        self._load_substrates(substrates)
+        reactor = self.reactor
+        tmo.reaction.CHECK_FEASIBILITY = False
+        reactor.run()
+        tmo.reaction.CHECK_FEASIBILITY = True
+        effluent = self.effluent
+        return effluent.imass[self.products].sum(), effluent.F_vol
+    
     def _titer_objective_function(self, substrates):
         """
         Return the titer of products given the ratio of substrates over feed 
         water.
         """
         if substrates <= 1e-16: raise InfeasibleRegion('substrate concentration')
-        feed = self.feed
-        mass_substrates = feed.imass[self.substrates]
-        r_substrates = mass_substrates / mass_substrates.sum()
-        feed.imass[self.substrates] = substrates * r_substrates
+        self._load_substrates(substrates)
         return self._calculate_titer() - self.titer
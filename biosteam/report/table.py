@@ -25,7 +25,8 @@ __all__ = ('stream_table', 'stream_tables',
            'lca_inventory_table',
            'lca_property_allocation_factor_table',
            'lca_displacement_allocation_factor_table',
-           'FOCTableBuilder')
+           'FOCTableBuilder', 'stream_flow_matrix', 'stream_data_table',
+           'save_stream_table')
 
 def _stream_key(s): # pragma: no coverage
     num = s.ID[1:]
@@ -475,7 +476,7 @@ def tables_to_excel(tables, writer, sheet='Sheet1', n_row=1, row_spacing=2):
     row_spacing += 1 # Account for Python index offset
     for t in tables:
         label = t.columns.name
-        t.to_excel(writer, sheet, 
+        t.to_excel(writer, sheet_name=sheet, 
                    startrow=n_row, index_label=label)
         n_row += len(t.index) + row_spacing
     return n_row
@@ -735,6 +736,194 @@ def stream_tables(streams, **stream_properties):
         stream_tables.append(stream_table(streams, chemicals=chemicals, T='K', **stream_properties))
     return stream_tables
 
+_phase_names = {
+    'l': 'liquid',
+    'L': 'LIQUID',
+    'g': 'gas',
+    's': 'solid',
+    'S': 'SOLID',
+}
+
+_phase_name_cache = {}
+
+def _phase_name(phase):
+    if phase in _phase_name_cache: return _phase_name_cache[phase]
+    name = '|'.join([_phase_names[i] for i in phase if i in _phase_names])
+    _phase_name_cache[phase] = name
+    return name
+
+def _sorted_streams(streams):
+    return sorted(sorted([i for i in streams if i.ID], key=lambda i: i.ID), key=_stream_key)
+
+def _default_chemicals(streams):
+    all_chemicals = tuple(set([i.chemicals for i in streams]))
+    sizes = [(i, chemical.size) for i, chemical in enumerate(all_chemicals)]
+    index, size = max(sizes, key=lambda x: x[1])
+    return all_chemicals[index]
+
+def stream_flow_matrix(streams, chemicals, flow='kmol/hr'):
+    """
+    Return a 2d array of chemical flow rates by stream (chemicals by streams).
+    Molar flow rates of all streams are stacked into one matrix and unit 
+    conversions are made in bulk.
+    
+    Parameters
+    ----------
+    streams : Sequence[Stream]
+    chemicals : Chemicals
+        Chemicals of matrix rows. Chemicals of all streams must be included.
+    flow : str, optional
+        Units for flow rate. Defaults to 'kmol/hr'.
+    
+    Examples
+    --------
+    >>> import biosteam as bst
+    >>> bst.settings.set_thermo(['Water', 'Ethanol'], cache=True)
+    >>> s1 = bst.Stream(Water=1, Ethanol=2)
+    >>> s2 = bst.Stream(Water=3)
+    >>> bst.report.stream_flow_matrix([s1, s2], s1.chemicals)
+    array([[1., 3.],
+           [2., 0.]])
+    
+    """
+    name, factor = tmo.Stream._get_flow_name_and_factor(flow)
+    data = np.zeros([chemicals.size, len(streams)])
+    if name == 'vol': # Volumetric flow rates depend on the thermal condition of each stream
+        for j, s in enumerate(streams):
+            if s.chemicals is chemicals:
+                data[:, j] = s.get_flow(flow)
+            else:
+                data[chemicals.get_index(s.chemicals.IDs), j] = s.get_flow(flow)
+        return data
+    for j, s in enumerate(streams):
+        if s.chemicals is chemicals:
+            data[:, j] = s.mol.to_array()
+        else:
+            data[chemicals.get_index(s.chemicals.IDs), j] = s.mol.to_array()
+    if name == 'mass':
+        data *= (factor * chemicals.MW)[:, None]
+    elif factor != 1.:
+        data *= factor
+    return data
+
+def _stream_properties(streams, mol, chemicals, props):
+    # Return stream properties by name as 1d arrays. Properties are retrieved 
+    # from each stream and unit conversions are made in bulk.
+    units_of_measure = tmo.Stream._units_of_measure
+    properties = {}
+    for attr, units in props.items():
+        if attr not in units_of_measure:
+            raise ValueError(f"'{attr}' is not a property")
+        if attr == 'F_mol':
+            values = mol.sum(axis=0)
+        elif attr == 'F_mass':
+            values = chemicals.MW @ mol
+        else:
+            values = np.array([getattr(s, attr) for s in streams])
+        properties[f'{attr} ({units})'] = units_of_measure[attr].convert(values, units)
+    return properties
+
+def _composition(flows, percent):
+    net = flows.sum(axis=0)
+    basis = net / 100. if percent else net
+    mask = basis > 1e-24
+    fracs = np.zeros_like(flows)
+    fracs[:, mask] = flows[:, mask] / basis[mask]
+    return net, fracs
+
+def stream_data_table(streams, flow='kg/hr', percent=True, chemicals=None, **props):
+    """
+    Return a stream table as a pandas DataFrame object with streams as rows.
+    Unlike :func:`~biosteam.report.stream_table`, all columns are typed, 
+    which allows for fast export to Parquet, CSV, or Excel.
+
+    Parameters
+    ----------
+    streams : array_like[Stream]
+    flow : str
+        Units for flow rate.
+    percent : bool, optional
+        Whether to report composition in percent. Defaults to True.
+    chemicals : Chemicals, optional
+        Chemicals to include. Defaults to chemicals of the largest
+        thermodynamic property package.
+    props : str
+        Additional stream properties and units as key-value pairs
+    
+    Examples
+    --------
+    >>> import biosteam as bst
+    >>> bst.settings.set_thermo(['Water', 'Ethanol'], cache=True)
+    >>> s1 = bst.Stream('s1', Water=20, Ethanol=80, units='kg/hr')
+    >>> bst.report.stream_data_table([s1], T='degC')
+       Source Sink   Phase  T (degC)  flow (kg/hr)  Water  Ethanol
+    s1      -    -  liquid        25           100     20       80
+    
+    """
+    ss = _sorted_streams(streams)
+    if not chemicals: chemicals = _default_chemicals(ss)
+    mol = stream_flow_matrix(ss, chemicals)
+    flows = stream_flow_matrix(ss, chemicals, flow) if flow != 'kmol/hr' else mol
+    net, fracs = _composition(flows, percent)
+    data = {
+        'Source': [s.source.ID if s.source else '-' for s in ss],
+        'Sink': [s.sink.ID if s.sink else '-' for s in ss],
+        'Phase': [_phase_name(s.phase) for s in ss],
+        **_stream_properties(ss, mol, chemicals, props),
+        f'flow ({flow})': net,
+    }
+    for ID, values in zip(chemicals.IDs, fracs): data[ID] = values
+    return DataFrame(data, index=[s.ID for s in ss])
+
+def save_stream_table(streams, file, flow='kg/hr', percent=True, chemicals=None, **props):
+    """
+    Save a stream table with streams as rows. The file format is inferred from 
+    the file extension: Parquet (.parquet), CSV (.csv), or Excel (.xlsx). 
+    Excel files are written in constant memory mode when xlsxwriter is 
+    installed.
+
+    Parameters
+    ----------
+    streams : array_like[Stream]
+    file : str
+        File name to save stream table.
+    flow : str
+        Units for flow rate.
+    percent : bool, optional
+        Whether to report composition in percent. Defaults to True.
+    chemicals : Chemicals, optional
+        Chemicals to include. Defaults to chemicals of the largest
+        thermodynamic property package.
+    props : str
+        Additional stream properties and units as key-value pairs
+    
+    """
+    df = stream_data_table(streams, flow, percent, chemicals, **props)
+    file = str(file)
+    extension = file.rsplit('.', 1)[-1].lower()
+    if extension == 'parquet':
+        df.to_parquet(file)
+    elif extension == 'csv':
+        df.to_csv(file)
+    elif extension in ('xlsx', 'xls'):
+        with _excel_writer(file) as writer: df.to_excel(writer, sheet_name='Stream table')
+    else:
+        raise ValueError(
+            "file extension must be either 'parquet', 'csv', or 'xlsx'; "
+           f"not '{extension}'"
+        )
+
+def _excel_writer(file, constant_memory=True):
+    try:
+        import xlsxwriter
+    except ImportError:
+        return ExcelWriter(file)
+    else:
+        return ExcelWriter(
+            file, engine='xlsxwriter', 
+            engine_kwargs={'options': {'constant_memory': constant_memory}},
+        )
+
 def stream_table(streams, flow='kg/hr', percent=True, chemicals=None, **props):
     """
     Return a stream table as a pandas DataFrame object.
@@ -750,65 +939,30 @@ def stream_table(streams, flow='kg/hr', percent=True, chemicals=None, **props):
     """
     
     # Prepare rows and columns
-    ss = sorted(sorted([i for i in streams if i.ID], key=lambda i: i.ID), key=_stream_key)
-    if not chemicals: 
-        all_chemicals = tuple(set([i.chemicals for i in ss]))
-        sizes = [(i, chemical.size) for i, chemical in enumerate(all_chemicals)]
-        index, size = max(sizes, key=lambda x: x[1])
-        chemicals = all_chemicals[index]
+    ss = _sorted_streams(streams)
+    if not chemicals: chemicals = _default_chemicals(ss)
     n = len(ss)
     m = chemicals.size
     p = len(props)
     array = np.empty((m+p+5, n), dtype=object)
-    IDs = n*[None]
-    sources = array[0, :]
-    sinks = array[1, :]
-    phases = array[2, :]
-    prop_molar_data = array[3:3+p+1,:]
-    flows = array[p+3, :]
+    array[0, :] = [s.source.ID if s.source else '-' for s in ss]
+    array[1, :] = [s.sink.ID if s.sink else '-' for s in ss]
+    array[2, :] = [_phase_name(s.phase) for s in ss]
+    mol = stream_flow_matrix(ss, chemicals)
+    flows = stream_flow_matrix(ss, chemicals, flow) if flow != 'kmol/hr' else mol
+    net, fracs = _composition(flows, percent)
+    properties = _stream_properties(ss, mol, chemicals, props)
+    for i, values in enumerate(properties.values(), 3): array[i, :] = values
+    array[p+3, :] = net
     array[p+4, :] = ''
-    fracs = array[p+5:m+p+5, :]
-    for j in range(n):
-        s = ss[j]
-        sources[j] = s.source.ID if s.source else '-'
-        sinks[j] = s.sink.ID if s.sink else '-'
-        IDs[j] = s.ID
-        phase = ''
-        for i in s.phase:
-            if i == 'l':
-                phase += 'liquid|'
-            elif i == 'L':
-                phase += 'LIQUID|'
-            elif i == 'g':
-                phase += 'gas|'
-            elif i == 's':
-                phase += 'solid|'
-            elif i == 'S':
-                phase += 'SOLID|'
-        phase = phase.rstrip('|')
-        phases[j] = phase
-        flow_j = s.get_flow(units=flow)
-        flows[j] = net_j = flow_j.sum()
-        if percent: net_j /= 100.
-        fracs_j = flow_j/net_j if net_j > 1e-24 else 0
-        if s.chemicals is chemicals:
-            fracs[:, j] = fracs_j
-        else:
-            fracs[:, j] = 0.
-            fracs[chemicals.get_index(s.chemicals.IDs), j] = fracs_j
-        i = 0
-        for attr, units in props.items():
-            prop_molar_data[i, j] = s.get_property(attr, units)
-            i += 1
+    array[p+5:m+p+5, :] = fracs
     index = (
         'Source', 
         'Sink',
         'Phase', 
-        *[f'{attr} ({units})' for attr, units in props.items()], 
+        *properties,
         f'flow ({flow})',
         ('Composition [%]:' if percent else 'Composition:'),
         *chemicals.IDs
     )
-    return DataFrame(array, columns=IDs, index=index)
-
-
+    return DataFrame(array, columns=[s.ID for s in ss], index=index)
\ No newline at end of file
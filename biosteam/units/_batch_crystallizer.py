@@ -11,7 +11,6 @@ import numpy as np
 from .. import Unit
 from .design_tools import size_batch
 from .decorators import cost
-import flexsolve as flx
 from math import ceil
 
 __all__ = ('BatchCrystallizer',)
@@ -167,10 +166,12 @@ class BatchCrystallizer(Unit):
         V_wf = self.V_wf
         Design = self.design_results
         if self.V:
-            f = lambda N: v_0 / N / V_wf * (tau + tau_0) / (1 - 1 / N) - self.V
-            N = flx.IQ_interpolation(f, self.Nmin, self.Nmax,
-                                     xtol=0.01, ytol=0.5, checkbounds=False)
-            N = ceil(N)
+            # Vessel volume is v_0 * (tau + tau_0) / V_wf / (N - 1)
+            N = v_0 / self.V / V_wf * (tau + tau_0) + 1
+            if N < 2:
+                N = 2
+            else:
+                N = ceil(N)
         else:
             N = self._N
         dct = size_batch(v_0, tau, tau_0, N, V_wf)
@@ -10,6 +10,7 @@
 import numpy as np
 import biosteam as bst
 from .. import Unit
+from ..utils import get_solver_memory, clear_solver_memory
 from .mixing import Mixer
 from .heat_exchange import HXutility
 from ._flash import Flash, Evaporator
@@ -302,6 +303,7 @@ class MultiEffectEvaporator(Unit):
         
     def reset_cache(self, isdynamic=None):
         self._reload_components = True
+        clear_solver_memory(self)
         
     def _load_components(self):
         P = self.P
@@ -389,10 +391,14 @@ class MultiEffectEvaporator(Unit):
                     break
             
             self.P = P
-            self._V_first_effect = flx.IQ_interpolation(self._V_overall_objective_function,
-                                                        0., 1., None, None, self._V_first_effect, 
-                                                        xtol=1e-9, ytol=1e-6,
-                                                        checkiter=False)
+            cold_solve = lambda f: flx.IQ_interpolation(
+                f, 0., 1., None, None, self._V_first_effect, 
+                xtol=1e-9, ytol=1e-6, checkiter=False
+            )
+            self._V_first_effect = get_solver_memory(self, 'V_first_effect').solve(
+                self._V_overall_objective_function, cold_solve,
+                xtol=1e-9, ytol=1e-6, lb=0., ub=1.,
+            )
             V_overall = self.V
         else: 
             V_overall = self._V_overall(self.V)
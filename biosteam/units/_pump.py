@@ -161,19 +161,48 @@ class Pump(Unit):
         s_out.copy_like(s_in)
         if self.P: s_out.P = self.P 
     
-    def _design(self):
+    def simulate_as_auxiliary_pump(self, F_vol=None, F_mass=None, nu=None):
+        """
+        Size and cost pump without running mass and energy balances. The
+        pressure rise is given by the pressure specification and other design 
+        inputs default to the properties of the inlet stream.
+        
+        Parameters
+        ----------
+        F_vol : float, optional
+            Volumetric flow rate [m3/hr].
+        F_mass : float, optional
+            Mass flow rate [kg/hr].
+        nu : float, optional
+            Kinematic viscosity [m2/s].
+        
+        """
+        inlet = self.ins[0]
+        self.simulate(
+            run=False, # Do not run mass and energy balance
+            design_kwargs=dict(
+                F_vol=F_vol, F_mass=F_mass, nu=nu, 
+                dP=0. if self.P is None else self.P - inlet.P,
+            )
+        )
+    
+    def _design(self, F_vol=None, F_mass=None, nu=None, dP=None):
         Design = self.design_results
         si, = self.ins
         so, = self.outs
-        if si.isempty(): 
+        if F_mass is None:
+            if si.isempty(): 
+                self.design_results.clear()
+                return
+            F_mass = si.F_mass
+        elif not F_mass:
             self.design_results.clear()
             return
         Pi = si.P
-        Po = so.P
-        Qi = si.F_vol
-        mass = si.F_mass
-        nu = si.nu
-        dP = Po - Pi
+        Qi = si.F_vol if F_vol is None else F_vol
+        mass = F_mass
+        if nu is None: nu = si.nu
+        if dP is None: dP = so.P - Pi
         if dP < 1: dP = self.dP_design
         power_ideal = Qi*dP*3.725e-7 # hp
         q = Qi*4.403 # gpm
@@ -29,6 +29,7 @@ from numba import njit
 import flexsolve as flx
 import matplotlib.pyplot as plt
 from scipy.integrate import solve_ivp
+from scipy.sparse import dia_matrix
 from scipy.ndimage.filters import gaussian_filter
 from thermosteam.units_of_measure import format_units
 
@@ -102,7 +103,7 @@ def dCdt_optimized_Langmuir(
 def dCdt(
         t, C, N_slices, 
         Da, dz, isotherm_model, isotherm_args,
-        beta_q0_rho_over_C0, C0, q0
+        beta_q0_rho_over_C0, C0, q0, CL_in
     ):
     CL = C[:N_slices] 
     qt = C[N_slices:] # q-avg
@@ -113,7 +114,7 @@ def dCdt(
     qe[qe > q0] = q0
     dCL_dz = CL.copy()
     dCL_dz[1:] = (CL[1:] - CL[:-1]) / dz
-    dCL_dz[0] = (CL[0] - 1) / dz
+    dCL_dz[0] = (CL[0] - CL_in) / dz
     dC_dt = C.copy()
     dq_dt = Da * (qe - qt)
     dCL_dt = -dCL_dz - beta_q0_rho_over_C0 * dq_dt
@@ -121,6 +122,74 @@ def dCdt(
     dC_dt[N_slices:] = dq_dt
     return dC_dt 
 
+Freundlich_CL_linear = 1e-4
+
+@njit(cache=True)
+def dimensionless_equilibrium_loading(CL, isotherm, parameter):
+    # Equilibrium loading and its derivative with respect to the fluid
+    # concentration, both scaled by the equilibrium loading at the feed.
+    # Langmuir isotherm (isotherm == 0): parameter = KL * C0.
+    # Freundlich isotherm (isotherm == 1): parameter = 1 / n.
+    CL = CL.copy()
+    CL[CL < 0] = 0
+    if isotherm == 0:
+        den = 1 + parameter * CL
+        qe = CL * (1 + parameter) / den
+        dqe_dCL = (1 + parameter) / (den * den)
+    else:
+        # Linear below CL_linear to avoid an infinite slope at CL = 0
+        CL_ = np.maximum(CL, Freundlich_CL_linear)
+        dqe_dCL = parameter * CL_ ** (parameter - 1)
+        qe = CL_ ** parameter
+        mask = CL < Freundlich_CL_linear
+        dqe_dCL[mask] = Freundlich_CL_linear ** (parameter - 1)
+        qe[mask] = CL[mask] * dqe_dCL[mask]
+        mask = qe > 1
+        qe[mask] = 1
+        dqe_dCL[mask] = 0
+    return qe, dqe_dCL
+
+@njit(cache=True)
+def dCdt_banded(
+        t, y, N_slices, Da, dz, beta_q0_rho_over_C0, isotherm, parameter, CL_in,
+    ):
+    # Fluid concentrations and loadings are interleaved (i.e., 
+    # y = [CL_0, q_0, CL_1, q_1, ...]) to keep the Jacobian banded.
+    # The inlet concentration, CL_in, is 1 for the feed and 0 for a clean 
+    # regeneration fluid.
+    CL = y[0::2]
+    qt = y[1::2]
+    qe, dqe_dCL = dimensionless_equilibrium_loading(CL, isotherm, parameter)
+    dCL_dz = np.empty(N_slices)
+    dCL_dz[1:] = (CL[1:] - CL[:-1]) / dz
+    dCL_dz[0] = (CL[0] - CL_in) / dz
+    dq_dt = Da * (qe - qt)
+    dy_dt = np.empty(2 * N_slices)
+    dy_dt[0::2] = -dCL_dz - beta_q0_rho_over_C0 * dq_dt
+    dy_dt[1::2] = dq_dt
+    return dy_dt
+
+@njit(cache=True)
+def jacobian_banded(
+        t, y, N_slices, Da, dz, beta_q0_rho_over_C0, isotherm, parameter, CL_in,
+    ):
+    # Jacobian of `dCdt_banded` in packed banded format (lband=2, uband=1),
+    # where J_packed[1 + i - j, j] = J[i, j].
+    CL = y[0::2]
+    qe, dqe_dCL = dimensionless_equilibrium_loading(CL, isotherm, parameter)
+    J = np.zeros((4, 2 * N_slices))
+    J[0, 1::2] = beta_q0_rho_over_C0 * Da # dCL_i/dt by q_i
+    J[1, 0::2] = -1 / dz - beta_q0_rho_over_C0 * Da * dqe_dCL # dCL_i/dt by CL_i
+    J[1, 1::2] = -Da # dq_i/dt by q_i
+    J[2, 0::2] = Da * dqe_dCL # dq_i/dt by CL_i
+    J[3, 0:-2:2] = 1 / dz # dCL_i/dt by CL_{i-1}
+    return J
+
+def sparse_jacobian_banded(t, y, N_slices, *args):
+    N = 2 * N_slices
+    J = jacobian_banded(t, y, N_slices, *args)
+    return dia_matrix((J, (1, 0, -1, -2)), shape=(N, N)).tocsc()
+
 def adsorption_bed_pressure_drop(
         D = 0.001, # particle diameter [m]
         rho = 800, # liquid density [kg/m3]
@@ -337,6 +406,10 @@ class SingleComponentAdsorptionColumn(PressureVessel, bst.Unit):
         'Langmuir': equilibrium_loading_Langmuir_isotherm,
         'Freundlich': equilibrium_loading_Freundlich_isotherm,
     }
+    
+    #: [float] Loading relative to the saturated bed at which the bed is 
+    #: considered regenerated.
+    regenerated_loading = 1e-3
 
     def _init(self,
             cycle_time,
@@ -388,7 +461,7 @@ class SingleComponentAdsorptionColumn(PressureVessel, bst.Unit):
         if regeneration_isotherm_model is None:
             if regeneration_isotherm_args is not None:
                 raise ValueError('no regeneration isotherm model given')
-        elif isinstance(isotherm_model, str):
+        elif isinstance(regeneration_isotherm_model, str):
             if regeneration_isotherm_model in self.isotherm_models:
                 regeneration_isotherm_model = self.isotherm_models[regeneration_isotherm_model]
             else:
@@ -445,11 +518,11 @@ class SingleComponentAdsorptionColumn(PressureVessel, bst.Unit):
             self.heat_exchanger.T = regeneration_fluid.T
             self._size_columns()
             self.regeneration_superficial_velocity = u = self._solve_regeneration_velocity()
-            Q = self.area * u
-            regeneration_fluid.F_vol = Q * 3600 # m3/s to m3/h
-            self.heat_exchanger.ins[0].copy_flow(regeneration_fluid)
+            regeneration_fluid.F_vol = self.area * u # m3/h
+            self.ins[1].copy_flow(regeneration_fluid)
+            self.regeneration_pump.run()
             self.heat_exchanger.run()
-            spent_fluid.copy(regeneration_fluid)
+            spent_fluid.copy_like(regeneration_fluid)
             spent_fluid.imol[self.adsorbate] = feed.imol[self.adsorbate]
 
     def column_widget(self):
@@ -517,11 +590,13 @@ class SingleComponentAdsorptionColumn(PressureVessel, bst.Unit):
         void_fraction = self.void_fraction
         rho_adsorbent = self.rho_adsorbent
         if regeneration:
-            C_init[N_slices:] = 1 # saturated column for regeneration
+            C_init[:] = 1 # saturated column for regeneration
+            CL_in = 0 # clean regeneration fluid
             isotherm_model = self.regeneration_isotherm_model
             isotherm_args = self.regeneration_isotherm_args
             k = self.k_regeneration
         else:
+            CL_in = 1
             k = self.k
             isotherm_model = self.isotherm_model
             isotherm_args = self.isotherm_args
@@ -532,30 +607,24 @@ class SingleComponentAdsorptionColumn(PressureVessel, bst.Unit):
         C0 = self.C0
         q0 = isotherm_model(C0, *isotherm_args)
         beta_q0_rho_over_C0 = (beta * q0 * rho_adsorbent / 1000) / C0
+        tf = cycle_time / t_scale
         if isotherm_model is equilibrium_loading_Langmuir_isotherm:
             KL, q_m = isotherm_args
-            KL_qm = KL * q_m
-            q0_over_C0 = q0 / C0
-            q0_KL = q0 * KL
-            args = (N_slices, Da, dz, KL_qm,
-                    q0_over_C0, q0_KL, beta_q0_rho_over_C0)
-            f = dCdt_optimized_Langmuir
-            sol = solve_ivp(
-                f, t_span=(0, cycle_time / t_scale), 
-                y0=C_init, 
-                method='BDF',
-                args=args,
-            ) 
-            CL = sol.y[:N_slices]
-            q = sol.y[N_slices:]
-            t = sol.t
+            t, CL, q = self._simulate_dimensionless_bed(
+                regeneration, Da, beta_q0_rho_over_C0, 0, KL * C0, tf
+            )
+        elif isotherm_model is equilibrium_loading_Freundlich_isotherm:
+            K, n = isotherm_args
+            t, CL, q = self._simulate_dimensionless_bed(
+                regeneration, Da, beta_q0_rho_over_C0, 1, 1 / n, tf
+            )
         else:
             args = (N_slices, Da, dz, isotherm_model, isotherm_args,
-                    beta_q0_rho_over_C0, C0, q0)
+                    beta_q0_rho_over_C0, C0, q0, CL_in)
             f = dCdt
             time_step = 0.2 / N_slices
             t, Y = fixed_step_odeint(
-                f, C_init, time_step, cycle_time / t_scale, args
+                f, C_init, time_step, tf, args
             )
             t = np.array(t)
             Y = gaussian_filter(np.array(Y).T, 5, axes=1)
@@ -572,6 +641,27 @@ class SingleComponentAdsorptionColumn(PressureVessel, bst.Unit):
             self.q_scaled = q
             self.t_scale = t_scale
     
+    def _simulate_dimensionless_bed(
+            self, regeneration, Da, beta_q0_rho_over_C0, isotherm, parameter, tf
+        ):
+        N_slices = self.N_slices
+        if regeneration:
+            y0 = np.ones(2 * N_slices) # saturated column for regeneration
+            CL_in = 0. # clean regeneration fluid
+        else:
+            y0 = np.zeros(2 * N_slices)
+            CL_in = 1.
+        # The BDF solver subtracts from uninitialized differences on the first 
+        # step, which raises errors under biosteam's numpy error settings
+        with np.errstate(invalid='ignore'):
+            sol = solve_ivp(
+                dCdt_banded, t_span=(0, tf), y0=y0, method='BDF',
+                args=(N_slices, Da, 1 / (N_slices - 1), beta_q0_rho_over_C0, 
+                      isotherm, parameter, CL_in),
+                jac=sparse_jacobian_banded,
+            )
+        return sol.t, sol.y[0::2], sol.y[1::2]
+    
     def _estimate_length_of_unused_bed(self, LUB):
         L_guess = self.LES + LUB
         self._simulate_adsorption_bed(
@@ -592,20 +682,20 @@ class SingleComponentAdsorptionColumn(PressureVessel, bst.Unit):
         self.LUB = LUB = self.MTZ / 2
         return LUB
     
-    def _regeneration_time_objective(self, 
+    def _regeneration_loading_objective(self, 
             u, # [m / hr]
         ):
         self._simulate_adsorption_bed(
             True, self.column_length, u,
         )
-        q = self.q_scaled
-        mask = (q > 1e-6).all(axis=0) & (q < 1e-3).all(axis=0) # slices that have finished regenerating
-        time_index = np.where(mask)[0][-1] # Conservative time point
-        return self.t_scaled[time_index] * self.t_scale - self.cycle_time
+        # Log of the highest remaining loading at the end of the cycle relative
+        # to that of a regenerated bed; continuous and decreasing with velocity
+        q = self.rq_scaled[:, -1].max()
+        return np.log(max(q, 1e-12) / self.regenerated_loading)
     
     def _solve_regeneration_velocity(self):
         self.regeneration_velocity = u = flx.IQ_interpolation(
-            self._estimate_regeneration_time, 4, 14.4, self.cycle_time, 
+            self._regeneration_loading_objective, 4, 14.4,
             xtol=1e-3, ytol=1e-2, 
         ) 
         return u
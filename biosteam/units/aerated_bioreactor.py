@@ -23,6 +23,7 @@ from math import pi
 import numpy as np
 from scipy.constants import g
 import flexsolve as flx
+from biosteam.utils import get_solver_memory
 from warnings import filterwarnings, catch_warnings
 from scipy.optimize import minimize_scalar, minimize, least_squares, differential_evolution
 from biosteam.units.design_tools import aeration
@@ -247,42 +248,57 @@ class AeratedBioreactor(AbstractStirredTankReactor):
         air_cc.P = compressor.P = self._inlet_air_pressure()
         air_cc.T = self.T
         
+        def load_oxygen_flow(O2):
+            air.set_flow([O2, O2 * 79. / 21.], 'mol/s', ['O2', 'N2'])
+            air_cc.copy_flow(air) # Skip simulation of air cooler
+            effluent.set_data(effluent_no_air_data)
+            effluent.mix_from([effluent, air_cc], energy_balance=False)
+            vent.empty()
+            self._run_vent(vent, effluent)
+        
         if self.optimize_power:
+            # At fixed inlet and outlet conditions, compressor power is 
+            # proportional to the air flow rate; simulate the compressor once 
+            # to get the slope and optimize using this linear model
+            load_oxygen_flow(OUR)
+            compressor.simulate()
+            compressor_power_per_O2 = compressor.power_utility.consumption / OUR
             def total_power_at_oxygen_flow(O2):
-                air.set_flow([O2, O2 * 79. / 21.], 'mol/s', ['O2', 'N2'])
-                air_cc.copy_flow(air) # Skip simulation of air cooler
-                compressor.simulate()
-                effluent.set_data(effluent_no_air_data)
-                effluent.mix_from([effluent, air_cc], energy_balance=False)
-                vent.empty()
-                self._run_vent(vent, effluent)
-                total_power = self._solve_total_power(OUR)
-                return total_power
+                load_oxygen_flow(O2)
+                return self._solve_total_power(OUR, compressor_power_per_O2 * O2)
             
             f = total_power_at_oxygen_flow
-            minimize_scalar(f, 1.2 * OUR, bounds=[OUR, 10 * OUR], tol=OUR * 1e-3)
+            O2 = minimize_scalar(f, 1.2 * OUR, bounds=[OUR, 10 * OUR], tol=OUR * 1e-3).x
+            load_oxygen_flow(O2)
+            compressor.simulate()
+            self._solve_total_power(OUR)
         else:
+            # The oxygen transfer rate is independent of compressor power, 
+            # so the compressor is only simulated at the solution
             def air_flow_rate_objective(O2):
-                air.set_flow([O2, O2 * 79. / 21.], 'mol/s', ['O2', 'N2'])
-                air_cc.copy_flow(air) # Skip simulation of air cooler
-                compressor.simulate()
-                effluent.set_data(effluent_no_air_data)
-                effluent.mix_from([effluent, air_cc], energy_balance=False)
-                vent.empty()
-                self._run_vent(vent, effluent)
+                load_oxygen_flow(O2)
                 return OUR - self.get_OTR()
             
             f = air_flow_rate_objective
             y0 = air_flow_rate_objective(OUR)
             if y0 <= 0.: # Correlation is not perfect and special cases lead to OTR > OUR
+                compressor.simulate()
                 return
-            flx.IQ_interpolation(f, x0=OUR, x1=10 * OUR, 
-                                 y0=y0, ytol=1e-3, xtol=1e-3)
+            cold_solve = lambda f: flx.IQ_interpolation(
+                f, x0=OUR, x1=10 * OUR, y0=y0, ytol=1e-3, xtol=1e-3
+            )
+            O2 = get_solver_memory(self, 'O2').solve(
+                f, cold_solve, ytol=1e-3, xtol=1e-3, lb=OUR, ub=10 * OUR
+            )
+            load_oxygen_flow(O2)
+            compressor.simulate()
         
     def _run_reactions(self, effluent):
         self.reactions.force_reaction(effluent)
     
-    def _solve_total_power(self, OUR): # For OTR = OUR [mol / s]
+    def _solve_total_power(self, OUR, compressor_power=None): # For OTR = OUR [mol / s]
+        # Compressor power [kW] defaults to the power of the simulated compressor
+        if compressor_power is None: compressor_power = self.compressor.power_utility.consumption
         air_in = self.sparged_gas
         N_reactors = self.parallel['self']
         operating_time = self.tau / self.design_results.get('Batch time', 1.)
@@ -297,7 +313,7 @@ class AeratedBioreactor(AbstractStirredTankReactor):
         kLa = OUR / (LMDF * V * self.effluent_density * N_reactors * operating_time) 
         P = self.get_agitation_power(kLa)
         agitation_power_kW = P / 1000
-        total_power_kW = (agitation_power_kW + self.compressor.power_utility.consumption / N_reactors) / V
+        total_power_kW = (agitation_power_kW + compressor_power / N_reactors) / V
         self.kW_per_m3 = agitation_power_kW / V 
         return total_power_kW
     
@@ -547,6 +563,27 @@ class GasFedBioreactor(AbstractStirredTankReactor):
         for i in self.gas_coolers: i.simulate()
         self.sparger.simulate()
     
+    def _load_gas_flows(self):
+        # Same as `_load_gas_feeds` assuming that only flow rates have changed
+        # (i.e., thermal conditions remain the same) and without design/costing
+        for compressor, cooler in zip(self.compressors, self.gas_coolers):
+            compressor.outs[0].copy_flow(compressor.ins[0])
+            cooler.outs[0].copy_flow(cooler.ins[0])
+        self.sparger.run()
+    
+    def _get_compressor_power_model(self):
+        # Return a function of the total compressor power [kW] at the current 
+        # inlet flow rates given the last simulation of the compressors 
+        # (compressor power is proportional to the flow rate at fixed 
+        # inlet and outlet conditions)
+        compressors = self.compressors
+        specific_power = np.array([
+            i.power_utility.consumption / i.ins[0].F_mol if i.ins[0].F_mol else 0.
+            for i in compressors
+        ])
+        inlets = [i.ins[0] for i in compressors]
+        return lambda: specific_power @ np.array([i.F_mol for i in inlets])
+    
     def _run(self):
         variable_gas_feeds = self.variable_gas_feeds
         vent, effluent = self.outs
@@ -589,26 +626,33 @@ class GasFedBioreactor(AbstractStirredTankReactor):
                 for i in index:
                     gas = variable_gas_feeds[i]
                     gas.set_total_flow(F_feeds[i], 'mol/s')
-                self._load_gas_feeds()
+                self._load_gas_flows()
                 effluent.set_data(effluent_liquid_data)
                 effluent.mix_from([self.sparged_gas, -s_consumed, s_produced, *liquid_feeds], energy_balance=False)
-                if (effluent.mol < 0).any(): breakpoint()
                 vent.empty()
                 self._run_vent(vent, effluent)
             
             baseline_feed = bst.Stream.sum(self.normal_gas_feeds, energy_balance=False)
             baseline_flows = baseline_feed.get_flow('mol/s', self.gas_substrates)
             bounds = np.array([[max(1.01 * SURs[i] - baseline_flows[i], 1e-6), 10 * SURs[i]] for i in index])
+            x0 = 1.2 * SURs
+            # Rigorously simulate gas feed auxiliaries once; only flow rates 
+            # change within the optimization
+            for i in index: variable_gas_feeds[i].set_total_flow(x0[i] / x_substrates[i], 'mol/s')
+            self._load_gas_feeds()
             if self.optimize_power:
+                # At fixed inlet and outlet conditions, compressor power is 
+                # proportional to the gas flow rate
+                compressor_power = self._get_compressor_power_model()
                 def total_power_at_substrate_flow(F_substrates):
-                    load_flow_rates(F_substrates)
-                    total_power = self._solve_total_power(SURs)
+                    load_flow_rates(F_substrates / x_substrates)
+                    total_power = self._solve_total_power(SURs, compressor_power())
                     return total_power
                 
                 f = total_power_at_substrate_flow
                 with catch_warnings():
                     filterwarnings('ignore')
-                    results = minimize(f, 1.2 * SURs, bounds=bounds, tol=SURs.max() * 1e-6)
+                    results = minimize(f, x0, bounds=bounds, tol=SURs.max() * 1e-6)
                     load_flow_rates(results.x / x_substrates)
             else:
                 def gas_flow_rate_objective(F_substrates):
@@ -627,9 +671,11 @@ class GasFedBioreactor(AbstractStirredTankReactor):
                 with catch_warnings():
                     filterwarnings('ignore')
                     bounds = bounds.T
-                    results = least_squares(f, 1.2 * SURs, bounds=bounds, ftol=SURs.min() * 1e-6)
+                    results = least_squares(f, x0, bounds=bounds, ftol=SURs.min() * 1e-6)
                 self._results = results
                 load_flow_rates(results.x / x_substrates)
+            self._load_gas_feeds()
+            if self.optimize_power: self._solve_total_power(SURs)
         else:
             try:
                 feed, = [i for i in self.ins if i.phase != 'g']
@@ -652,7 +698,11 @@ class GasFedBioreactor(AbstractStirredTankReactor):
                 self._run_vent(vent, effluent)
                 return effluent.imass[product] / effluent.ivol['Water'] - titer
                 
-            flx.IQ_interpolation(liquid_flow_rate_objective, 0.05 * F_liquid_max, F_liquid_max, ytol=1e-3)
+            cold_solve = lambda f: flx.IQ_interpolation(f, 0.05 * F_liquid_max, F_liquid_max, ytol=1e-3)
+            get_solver_memory(self, 'F_liquid').solve(
+                liquid_flow_rate_objective, cold_solve, ytol=1e-3,
+                lb=0.05 * F_liquid_max, ub=F_liquid_max,
+            )
         # self.show()
         # breakpoint()
         
@@ -685,7 +735,9 @@ class GasFedBioreactor(AbstractStirredTankReactor):
         self._run_vent(vent, effluent)
         return F_liquid_max
         
-    def _solve_total_power(self, SURs): # For STR = SUR [mol / s]
+    def _solve_total_power(self, SURs, compressor_power=None): # For STR = SUR [mol / s]
+        # Compressor power [kW] defaults to the power of the simulated compressors
+        if compressor_power is None: compressor_power = sum([i.power_utility.consumption for i in self.compressors])
         gas_in = self.sparged_gas
         N_reactors = self.parallel['self']
         operating_time = self.tau / self.design_results.get('Batch time', 1.)
@@ -708,7 +760,7 @@ class GasFedBioreactor(AbstractStirredTankReactor):
             Ps.append(aeration.P_at_kLa_Riet(kLa, V, U, **self.kLa_kwargs))
         P = max(Ps)  
         agitation_power_kW = P / 1000
-        compressor_power_kW = sum([i.power_utility.consumption for i in self.compressors]) / N_reactors
+        compressor_power_kW = compressor_power / N_reactors
         total_power_kW = (agitation_power_kW + compressor_power_kW) / V
         self.kW_per_m3 = agitation_power_kW / V 
         return total_power_kW
@@ -30,6 +30,7 @@ from warnings import warn
 from math import log, exp, ceil
 from typing import NamedTuple, Tuple, Callable, Dict
 from thermosteam.constants import R
+from thermosteam import IdealMixture
 from .heat_exchange import HX
 from ..utils import list_available_names
 from ..exceptions import DesignWarning, bounds_warning
@@ -58,6 +59,171 @@ class CompressorCostAlgorithm(NamedTuple):
     CE: float #: Chemical engineering price cost index.
 
 
+class IsentropicPath:
+    """
+    Create an IsentropicPath object that tabulates the heat capacity, 
+    enthalpy, and entropy of a single phase stream with fixed composition
+    to solve isentropic and isenthalpic temperatures with Newton steps 
+    on closed-form functions. The heat capacity is interpolated linearly 
+    between nodes (every `dT` degrees) and integrated analytically. Pressure
+    dependence of entropy is that of an ideal gas, so paths only apply to
+    streams with ideal mixture models (i.e., not equations of state).
+    
+    Parameters
+    ----------
+    stream : Stream
+        Stream with the phase and composition of the path.
+    
+    """
+    __slots__ = ('key', 'phase', 'z', 'mixture', 'T_nodes', 'C_nodes',
+                 'H_nodes', 'S_nodes', 'valid')
+    
+    #: [float] Temperature interval between nodes.
+    dT = 10.
+    
+    #: [float] Maximum temperature error [K] of the fast solution as checked
+    #: against the rigorous entropy/enthalpy of the stream.
+    T_tol = 0.05
+    
+    #: [float] Reference pressure [Pa].
+    P_ref = 101325.
+    
+    def __init__(self, stream):
+        self.key = self.stream_key(stream)
+        self.phase = stream.phase
+        mol = stream.mol.to_array()
+        self.z = mol / mol.sum()
+        self.mixture = stream.mixture
+        T = stream.T
+        self.T_nodes = np.array([T])
+        self.C_nodes = np.array([self.mixture.Cn(self.phase, self.z, T)])
+        self.H_nodes = np.array([self.mixture.H(self.phase, self.z, T, self.P_ref)])
+        self.S_nodes = np.array([self.mixture.S(self.phase, self.z, T, self.P_ref)])
+        self.valid = True
+    
+    @staticmethod
+    def stream_key(stream):
+        mol = stream.mol.to_array()
+        return (stream.phase, stream.mixture, (mol / mol.sum()).tobytes())
+    
+    @classmethod
+    def is_applicable(cls, stream):
+        return (stream.phase == 'g' and not isinstance(stream, bst.MultiStream)
+                and isinstance(stream.mixture, IdealMixture) and stream.F_mol > 0.)
+    
+    def _extend(self, T):
+        T_nodes = self.T_nodes
+        dT = self.dT
+        mixture = self.mixture
+        phase = self.phase
+        z = self.z
+        if T < T_nodes[0]:
+            N = ceil((T_nodes[0] - T) / dT)
+            new = T_nodes[0] - dT * np.arange(N, 0, -1)
+            new = new[new > 0.]
+            T_nodes = np.concatenate([new, T_nodes])
+            C_nodes = np.concatenate([[mixture.Cn(phase, z, i) for i in new], self.C_nodes])
+        elif T > T_nodes[-1]:
+            N = ceil((T - T_nodes[-1]) / dT)
+            new = T_nodes[-1] + dT * np.arange(1, N + 1)
+            T_nodes = np.concatenate([T_nodes, new])
+            C_nodes = np.concatenate([self.C_nodes, [mixture.Cn(phase, z, i) for i in new]])
+        else:
+            return
+        H_nodes = np.zeros(T_nodes.size)
+        S_nodes = np.zeros(T_nodes.size)
+        T0 = T_nodes[:-1]
+        T1 = T_nodes[1:]
+        C0 = C_nodes[:-1]
+        m = (C_nodes[1:] - C0) / (T1 - T0)
+        H_nodes[1:] = np.cumsum(C0 * (T1 - T0) + 0.5 * m * (T1 - T0) ** 2)
+        S_nodes[1:] = np.cumsum((C0 - m * T0) * np.log(T1 / T0) + m * (T1 - T0))
+        # Anchor to original reference node
+        index = T_nodes.searchsorted(self.T_nodes[0])
+        H_nodes += self.H_nodes[0] - H_nodes[index]
+        S_nodes += self.S_nodes[0] - S_nodes[index]
+        self.T_nodes = T_nodes
+        self.C_nodes = C_nodes
+        self.H_nodes = H_nodes
+        self.S_nodes = S_nodes
+        
+    def _segment(self, T):
+        T_nodes = self.T_nodes
+        if T < T_nodes[0] or T > T_nodes[-1]: 
+            self._extend(T)
+            T_nodes = self.T_nodes
+        if T_nodes.size == 1: 
+            self._extend(T_nodes[0] + self.dT)
+            T_nodes = self.T_nodes
+        i = min(max(T_nodes.searchsorted(T) - 1, 0), T_nodes.size - 2)
+        T0 = T_nodes[i]
+        C0 = self.C_nodes[i]
+        m = (self.C_nodes[i + 1] - C0) / (T_nodes[i + 1] - T0)
+        return i, T0, C0, m
+    
+    def C(self, T):
+        """Return molar heat capacity [kJ/kmol/K]."""
+        i, T0, C0, m = self._segment(T)
+        return C0 + m * (T - T0)
+    
+    def H(self, T):
+        """Return molar enthalpy [kJ/kmol]."""
+        i, T0, C0, m = self._segment(T)
+        dT = T - T0
+        return self.H_nodes[i] + C0 * dT + 0.5 * m * dT * dT
+    
+    def S(self, T, P):
+        """Return molar entropy [kJ/kmol/K]."""
+        i, T0, C0, m = self._segment(T)
+        return (self.S_nodes[i] + (C0 - m * T0) * log(T / T0) + m * (T - T0)
+                - R * log(P / self.P_ref))
+    
+    def T_at_S(self, S, P, T_guess, maxiter=20):
+        """Return temperature [K] at given molar entropy [kJ/kmol/K] and pressure [Pa]."""
+        T = T_guess
+        for i in range(maxiter):
+            dT = (S - self.S(T, P)) * T / self.C(T)
+            T += dT
+            if abs(dT) < 1e-9 * T: return T
+        raise RuntimeError('isentropic temperature did not converge')
+    
+    def T_at_H(self, H, T_guess, maxiter=20):
+        """Return temperature [K] at given molar enthalpy [kJ/kmol]."""
+        T = T_guess
+        for i in range(maxiter):
+            dT = (H - self.H(T)) / self.C(T)
+            T += dT
+            if abs(dT) < 1e-9 * T: return T
+        raise RuntimeError('isenthalpic temperature did not converge')
+    
+    def isentropic_T(self, T_in, P_in, P_out):
+        """Return isentropic outlet temperature [K] from given inlet conditions."""
+        # Ideal gas with constant heat capacity as initial guess
+        T_guess = T_in * (P_out / P_in) ** (R / self.C(T_in))
+        return self.T_at_S(self.S(T_in, P_in), P_out, T_guess)
+    
+    def set_T(self, stream, T, S=None, H=None):
+        """
+        Set temperature of stream solved by the fast path and check against
+        the rigorous entropy or enthalpy of the stream. The temperature is 
+        corrected by one Newton step on the rigorous residual. If the residual 
+        exceeds `T_tol`, the path is marked invalid and the temperature is 
+        solved rigorously.
+        
+        """
+        stream.T = T
+        if S is not None:
+            dT = (S - stream.S) * T / stream.C
+        else:
+            dT = (H - stream.H) / stream.C
+        if abs(dT) > self.T_tol:
+            self.valid = False
+            if S is not None: stream.S = S
+            else: stream.H = H
+        else:
+            stream.T = T + dT
+
+
 class Compressor(Unit, isabstract=True):
     """
     Abstract class for compressors that includes design and costing. Child classes
@@ -65,6 +231,11 @@ class Compressor(Unit, isabstract=True):
     design and costing is estimated according to [1]_.
     
     """
+    #: [bool] Whether to solve isentropic and isenthalpic states of single 
+    #: phase gases with ideal mixture models through a cached 
+    #: :class:`IsentropicPath` (without VLE). States are solved rigorously
+    #: if the path fails or deviates from the rigorous thermodynamics.
+    fast_isentropic_path = True
     _graphics = compressor_graphics
     _N_ins = 1
     _N_outs = 1
@@ -142,6 +313,7 @@ class Compressor(Unit, isabstract=True):
         self.compressor_type = 'Default' if compressor_type is None else compressor_type 
         self.driver = 'Default' if driver is None else driver
         self.driver_efficiency = 'Default' if driver_efficiency is None else driver_efficiency
+        self._isentropic_path = None
 
     @property
     def compressor_type(self):
@@ -204,6 +376,42 @@ class Compressor(Unit, isabstract=True):
                                  f"{list_available_names(self.material_factors)}")
         self._material = material
 
+    def _get_isentropic_path(self, stream):
+        if not (self.fast_isentropic_path and self.vle is not True 
+                and IsentropicPath.is_applicable(stream)): return None
+        path = self._isentropic_path
+        if path is None or path.key != IsentropicPath.stream_key(stream):
+            try:
+                path = IsentropicPath(stream)
+            except Exception:
+                self._isentropic_path = None
+                return None
+            self._isentropic_path = path
+        elif not path.valid:
+            return None
+        return path
+    
+    def _set_isentropic_state(self, out, feed, path):
+        # Outlet must be at the outlet pressure
+        if path is not None:
+            try:
+                path.set_T(out, path.isentropic_T(feed.T, feed.P, out.P), S=feed.S)
+            except Exception:
+                path.valid = False
+            else:
+                return
+        out.S = feed.S
+    
+    def _set_enthalpy(self, out, H, path):
+        if path is not None and path.valid:
+            try:
+                path.set_T(out, path.T_at_H(H / out.F_mol, out.T), H=H)
+            except Exception:
+                path.valid = False
+            else:
+                return
+        out.H = H
+
     def _determine_compressor_type(self):
         psig = (self.P - 101325.) * 14.6959 / 101325.
         cost_algorithms = self.baseline_cost_algorithms
@@ -551,18 +759,15 @@ class IsentropicCompressor(Compressor, new_graphics=False):
         out = self.outs[0]
         out.copy_like(feed)
         out.P = self.P
-        out.S = feed.S
-        if self.vle is True:
-            out.vle(S=out.S, P=out.P)
-            T_isentropic = out.T
-        else:
-            T_isentropic = out.T
-        self.T_isentropic = T_isentropic
+        path = self._get_isentropic_path(feed)
+        self._set_isentropic_state(out, feed, path)
+        if self.vle is True: out.vle(S=out.S, P=out.P)
+        self.T_isentropic = out.T
         dH_isentropic = out.H - feed.H
         self.design_results['Ideal power'] = dH_isentropic / 3600. # kW
         self.design_results['Ideal duty'] = 0.
         dH_actual = dH_isentropic / self.eta
-        out.H = feed.H + dH_actual        
+        self._set_enthalpy(out, feed.H + dH_actual, path)
         if self.vle is True: out.vle(H=out.H, P=out.P)
         if self.system and self.system.algorithm == 'Phenomena oriented':
             self._coeffs = {self: feed.T, feed.source: out.T} # dT_out = (T_out/T_in) * dT_in
@@ -797,7 +1002,8 @@ class PolytropicCompressor(Compressor, new_graphics=False):
 
         # calculate polytropic exponent and real gas correction factor
         out.P = self.P
-        out.S = feed.S
+        path = self._get_isentropic_path(feed)
+        self._set_isentropic_state(out, feed, path)
         k = log(out.P / feed.P) / log(feed.V / out.V)
         n_1_n = (k - 1) / k # n: polytropic exponent
         W_poly = feed.P * feed.V / n_1_n * ((out.P/feed.P)**n_1_n - 1) # kJ/kmol
@@ -809,8 +1015,7 @@ class PolytropicCompressor(Compressor, new_graphics=False):
         W_actual = f * feed.P * feed.V / n_1_n * ((out.P/feed.P)**n_1_n - 1) / self.eta * out.F_mol # kJ/kmol -> kJ/hr
 
         # calculate outlet state
-        out.H = feed.H + W_actual # kJ/hr
-
+        self._set_enthalpy(out, feed.H + W_actual, path) # kJ/hr
         return W_actual # kJ/hr
 
     def _hundseid(self):
@@ -820,6 +1025,40 @@ class PolytropicCompressor(Compressor, new_graphics=False):
         n_steps = self.n_steps
 
         pr = (self.P / feed.P) ** (1 / n_steps) # pressure ratio between discrete steps
+        path = self._get_isentropic_path(feed)
+        if path is not None:
+            # Integrate path with closed-form functions; the isentropic state 
+            # of the final step and the outlet are checked against rigorous 
+            # entropy and enthalpy.
+            try:
+                F_mol = feed.F_mol
+                T = feed.T
+                P = feed.P
+                H = path.H(T)
+                W_actual = 0
+                for i in range(n_steps):
+                    P_next = P * pr
+                    T_isentropic = path.isentropic_T(T, P, P_next)
+                    dH_i = (path.H(T_isentropic) - H) / self.eta
+                    H += dH_i
+                    T_last = T
+                    T = path.T_at_H(H, T)
+                    W_actual += dH_i
+                    P_last = P
+                    P = P_next
+                W_actual *= F_mol # kJ/kmol -> kJ/hr
+                out.T = T_last
+                out.P = P_last
+                S = out.S
+                out.P = P
+                path.set_T(out, T_isentropic, S=S)
+                if path.valid:
+                    out.P = self.P
+                    path.set_T(out, T, H=feed.H + W_actual)
+                    if path.valid: return W_actual # kJ/hr
+            except Exception:
+                path.valid = False
+            out.copy_like(self.ins[0])
         W_actual = 0
         for i in range(n_steps):
             # isentropic pressure change
@@ -8,11 +8,16 @@
 """
 """
 import biosteam as bst
+import numpy as np
 import copy
+from numba import njit
+from weakref import WeakKeyDictionary
 from ._design import design
 from math import ceil
 
-__all__ = ('cost', 'copy_algorithm', 'add_cost', 'CostItem')
+__all__ = ('cost', 'copy_algorithm', 'add_cost', 'CostItem', 
+           'CompiledCostItems', 'compile_cost_items', 'evaluate_cost_items',
+           'cost_items_at_design')
 
 class CostItem:
     """
@@ -50,7 +55,8 @@ class CostItem:
     
     """
     __slots__ = ('_basis', '_units', 'S', 'lb', 'ub', 'CE',
-                 'cost', 'n', 'kW', 'N', 'f', 'condition', 'magnitude')
+                 'cost', 'n', 'kW', 'N', 'f', 'condition', 'magnitude',
+                 '_version')
     
     def __init__(self, basis, units, S, lb, ub, CE, cost, n, kW, N, f, condition,
                  magnitude):
@@ -81,8 +87,15 @@ class CostItem:
         self.condition = condition
         self.magnitude = magnitude
     
+    def __setattr__(self, name, value):
+        # The version is incremented every time the cost item is modified
+        # to invalidate compiled cost items
+        object.__setattr__(self, name, value)
+        if name != '_version':
+            object.__setattr__(self, '_version', getattr(self, '_version', 0) + 1)
+    
     __getitem__ = object.__getattribute__
-    __setitem__ = object.__setattr__
+    __setitem__ = __setattr__
     
     def copy(self):
         new = CostItem.__new__(CostItem)
@@ -123,6 +136,130 @@ class CostItem:
             +(f" N     '{self.N}'" if self.N is not None else ""))
     show = _ipython_display_
 
+class CompiledCostItems:
+    """
+    Create a CompiledCostItems object which holds the scaling parameters of 
+    cost items as coefficient arrays for evaluation with a compiled kernel. 
+    Cost items with a custom cost function `f` or a `condition` are flagged 
+    to be evaluated in Python.
+    
+    Parameters
+    ----------
+    cost_items : dict[str, CostItem]
+        Cost items by name.
+    
+    """
+    __slots__ = ('cost_items', 'versions', 'names', 'items', 'bases', 
+                 'has_N', 'python', 'S', 'lb', 'ub', 'CE', 'cost', 'n', 
+                 'kW', 'magnitude')
+    
+    def __init__(self, cost_items):
+        self.cost_items = cost_items
+        self.names = tuple(cost_items)
+        self.items = items = tuple(cost_items.values())
+        self.versions = [i._version for i in items]
+        self.bases = tuple([i._basis for i in items])
+        self.has_N = np.array([bool(i.N) for i in items], dtype=bool)
+        self.python = np.array([bool(i.f or i.condition) for i in items], dtype=bool)
+        self.S = np.array([i.S for i in items], dtype=float)
+        self.lb = np.array([-np.inf if i.lb is None else i.lb for i in items], dtype=float)
+        self.ub = np.array([np.inf if i.ub is None else i.ub for i in items], dtype=float)
+        self.CE = np.array([i.CE for i in items], dtype=float)
+        self.cost = np.array([i.cost or 0. for i in items], dtype=float)
+        self.n = np.array([1. if i.n is None else i.n for i in items], dtype=float)
+        self.kW = np.array([i.kW for i in items], dtype=float)
+        self.magnitude = np.array([bool(i.magnitude) for i in items], dtype=bool)
+    
+    def isvalid(self):
+        """Return whether the compiled arrays reflect the current cost items."""
+        items = tuple(self.cost_items.values())
+        return (len(items) == len(self.items)
+                and all([i is j for i, j in zip(items, self.items)])
+                and [i._version for i in items] == self.versions)
+    
+    def __repr__(self):
+        return f"<{type(self).__name__}: {', '.join(self.names)}>"
+    
+    
+_compiled_cost_items = WeakKeyDictionary()
+
+def compile_cost_items(unit):
+    """
+    Return compiled cost items of a unit operation. Compiled cost items are 
+    cached by unit class and recompiled only when cost items are modified.
+    
+    Parameters
+    ----------
+    unit : Unit
+        Unit operation decorated with cost items.
+    
+    """
+    cls = type(unit)
+    cost_items = unit.cost_items
+    compiled = _compiled_cost_items.get(cls)
+    if compiled is None or compiled.cost_items is not cost_items or not compiled.isvalid():
+        _compiled_cost_items[cls] = compiled = CompiledCostItems(cost_items)
+    return compiled
+
+@njit(cache=True)
+def _evaluate_compiled_cost_items(S, N, has_N, python, S0, lb, ub, I, cost, n, kW, magnitude):
+    # Same logic as `_evaluate_cost_item` for all cost items and scenarios. 
+    # NaN parallel units signify that the number of units is not defined.
+    M, K = S.shape
+    C = np.zeros((M, K))
+    P = np.full((M, K), np.nan)
+    power = np.zeros(K)
+    for i in range(M):
+        if python[i]: continue
+        for j in range(K):
+            s = S[i, j]
+            if magnitude[i]: s = abs(s)
+            if s < lb[i]:
+                s = lb[i]
+            elif ub[i] != np.inf:
+                Nj = np.ceil(s / ub[i])
+                if Nj != 0.:
+                    q = s / S0[i]
+                    F = q / Nj
+                    C[i, j] = I[i] * cost[i] * F ** n[i]
+                    P[i, j] = Nj
+                    power[j] += kW[i] * q
+                continue
+            F = s / S0[i]
+            C[i, j] = I[i] * cost[i] * F ** n[i]
+            if has_N[i]: 
+                Nj = N[i, j]
+                P[i, j] = Nj
+                power[j] += Nj * kW[i] * F
+            else:
+                power[j] += kW[i] * F
+    return C, P, power
+
+def _evaluate_cost_item(x, S, N):
+    # Returns purchase cost, number of parallel units (None if not defined), 
+    # and electricity rate of a cost item.
+    I = bst.CE / x.CE
+    if x.magnitude: S = abs(S)
+    if x.lb is not None and S < x.lb:
+        S = x.lb
+    elif x.ub is not None:
+        N = ceil(S / x.ub)
+        if N == 0.: return 0., None, 0.
+        q = S / x.S
+        F = q / N
+        return I * (x.f(F) if x.f else x.cost * F**x.n), N, x.kW * q
+    F = S / x.S
+    C = I * (x.f(F) if x.f else x.cost * F**x.n)
+    if x.N:
+        return C, N, N * x.kW * F
+    else:
+        return C, None, x.kW * F
+
+def _get_number_of_units(unit, x, D):
+    N = getattr(unit, x.N, None)
+    if N: return N
+    return D[x.N] if x.ub is None else D.get(x.N, np.nan)
+
 def _decorated_cost(self):
     D = self.design_results
     C = self.baseline_purchase_costs
@@ -131,34 +268,118 @@ def _decorated_cost(self):
     for i, x in self.cost_items.items():
         if x.condition is not None: 
             if not x.condition(): continue
-        I = bst.CE / x.CE
-        S = D[x._basis]
-        if x.magnitude: S = abs(S)
-        if x.lb is not None and S < x.lb:
-            S = x.lb
-        elif x.ub is not None:
-            N = ceil(S / x.ub)
-            if N == 0.:
-                C[i] = 0.
-            else:
-                q = S/x.S
-                F = q/N
-                C[i] = I * (x.f(F) if x.f else x.cost * F**x.n)
-                P[i] = N
-                kW += x.kW*q
-            continue
-        if x.N:
-            N = getattr(self, x.N, None) or D[x.N]
-            F = S / x.S
-            C[i] = I * (x.f(F) if x.f else x.cost * F**x.n)
-            P[i] = N
-            kW += N * x.kW * F
-        else:
-            F = S / x.S
-            C[i] = I * (x.f(F) if x.f else x.cost * F**x.n)
-            kW += x.kW * F
+        C[i], N, kWi = _evaluate_cost_item(
+            x, D[x._basis], _get_number_of_units(self, x, D) if x.N else None
+        )
+        if N is not None: P[i] = N
+        kW += kWi
     if kW: self.add_power_utility(kW)
 
+def evaluate_cost_items(unit, design_results):
+    """
+    Return baseline purchase costs [USD], number of parallel units, and the 
+    electricity rate [kW] of decorated cost items given a column of scenario 
+    design results. All scenarios are costed in one call to a compiled 
+    kernel; only cost items with a custom cost function `f` or a `condition` 
+    are evaluated in Python.
+    
+    Parameters
+    ----------
+    unit : Unit
+        Unit operation decorated with cost items.
+    design_results : dict[str, float|1d array]
+        Design results by name for each scenario. Results not present default
+        to the `design_results` of the unit operation.
+    
+    Returns
+    -------
+    purchase_costs : dict[str, 1d array]
+        Baseline purchase costs by cost item (not including cost factors).
+    parallel : dict[str, 1d array]
+        Number of parallel units by cost item. NaN signifies that the
+        number of units is not defined by the cost item.
+    kW : 1d array
+        Electricity rate of cost items.
+    
+    Examples
+    --------
+    >>> import biosteam as bst
+    >>> from biosteam.units.decorators import cost, evaluate_cost_items
+    >>> @cost('Flow rate', 'Pump', units='kg/hr', S=1000, CE=500, cost=1e4, n=0.6, kW=2)
+    ... class A(bst.Unit): pass
+    >>> unit = A(None)
+    >>> purchase_costs, parallel, kW = evaluate_cost_items(unit, {'Flow rate': [1000, 2000]})
+    >>> (purchase_costs['Pump'] * 500 / bst.CE).round(1)
+    array([10000. , 15157.2])
+    >>> kW
+    array([2., 4.])
+    
+    """
+    D = unit.design_results | design_results
+    K = max([np.size(i) for i in design_results.values()], default=1)
+    compiled = compile_cost_items(unit)
+    python = compiled.python
+    M = len(python)
+    S = np.zeros([M, K])
+    N = np.zeros([M, K])
+    for i, x in enumerate(compiled.items):
+        if python[i]: continue
+        S[i] = D[x._basis]
+        if x.N: N[i] = _get_number_of_units(unit, x, D)
+    costs, parallel, kW = _evaluate_compiled_cost_items(
+        S, N, compiled.has_N, python, compiled.S, compiled.lb, compiled.ub, bst.CE / compiled.CE, 
+        compiled.cost, compiled.n, compiled.kW, compiled.magnitude,
+    )
+    for i, x in enumerate(compiled.items):
+        if not python[i] or x.condition is not None and not x.condition(): continue
+        Si = np.broadcast_to(np.asarray(D[x._basis], dtype=float), K)
+        Ni = np.broadcast_to(np.asarray(_get_number_of_units(unit, x, D) if x.N else np.nan, dtype=float), K)
+        for j in range(K):
+            costs[i, j], Nj, kWj = _evaluate_cost_item(x, Si[j], Ni[j])
+            if Nj is not None: parallel[i, j] = Nj
+            kW[j] += kWj
+    names = compiled.names
+    return (
+        {j: costs[i] for i, j in enumerate(names)},
+        {j: parallel[i] for i, j in enumerate(names)},
+        kW,
+    )
+
+def cost_items_at_design(unit, design_results):
+    """
+    Return purchase costs [USD] of decorated cost items and the electricity 
+    rate [kW] given design results. Design results may be arrays, in which 
+    case all candidate designs are costed in one vectorized call without 
+    simulating the unit operation. Purchase costs account for parallel units
+    and design, pressure, and material factors.
+    
+    Parameters
+    ----------
+    unit : Unit
+        Unit operation decorated with cost items.
+    design_results : dict[str, float|1d array]
+        Design results by name. Results not present default to the 
+        `design_results` of the unit operation.
+    
+    Returns
+    -------
+    purchase_costs : dict[str, 1d array]
+        Purchase costs by cost item.
+    kW : 1d array
+        Electricity rate of cost items.
+    
+    """
+    purchase_costs, parallel, kW = evaluate_cost_items(unit, design_results)
+    F_D = unit.F_D
+    F_P = unit.F_P
+    F_M = unit.F_M
+    N_default = int(unit.parallel.get('self', 1))
+    for i, C in purchase_costs.items():
+        N = parallel[i]
+        N = np.where(N == N, N, N_default)
+        purchase_costs[i] = C * N * F_D.get(i, 1.) * F_P.get(i, 1.) * F_M.get(i, 1.)
+    return purchase_costs, kW
+
 def copy_algorithm(other, cls=None, run=True, design=True, cost=True):
     if not cls: return lambda cls: copy_algorithm(other, cls, run, design, cost)
     dct = cls.__dict__
@@ -24,17 +24,18 @@ def size_batch(F_vol, tau_reaction, tau_cleaning, N_reactors, V_wf) -> dict:
         Reaction time.
     tau_cleaning : float
         Cleaning in place time.
-    N_reactors : int
-        Number of reactors.
+    N_reactors : int or 1d array
+        Number of reactors. An array of candidate numbers of reactors may be
+        given to size all candidates at once.
     V_wf : float
         Fraction of working volume.
     
     Returns
     -------
     dict
-        * 'Reactor volume': float
-        * 'Batch time': float
-        * 'Loading time': float
+        * 'Reactor volume': float or 1d array
+        * 'Batch time': float or 1d array
+        * 'Loading time': float or 1d array
        
     Notes
     -----
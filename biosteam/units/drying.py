@@ -30,6 +30,7 @@ from .design_tools import (
 )
 from .decorators import cost
 from .._unit import Unit
+from ..utils import get_solver_memory
 from math import exp, log
 from thermosteam import separations
 
@@ -259,7 +260,7 @@ class DrumDryer(Unit):
                 duty = (dry_solids.H + hot_air.H + emissions.H) - (wet_solids.H + air.H + natural_gas.H)
                 CH4 = duty / LHV
                 return CH4
-            flx.wegstein(f, 0., 1e-3)
+            get_solver_memory(self, 'CH4').fixed_point(f, 0., 1e-3)
         
     def _design(self):
         length_to_diameter = self.length_to_diameter
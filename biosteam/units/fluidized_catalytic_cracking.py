@@ -3,10 +3,38 @@
 """
 import biosteam as bst
 from math import sqrt, pi
+from warnings import warn
 import numpy as np
 
 __all__ = ('FluidizedCatalyticCracking',)
 
+def enthalpy_polynomial_coefficients(streams, T, dT):
+    """
+    Return a 2d array of coefficients (a0, a1, a2) for each stream, where
+    the net enthalpy is Hnet(T + x) = a0 + a1 * x + a2 * x ** 2. Streams are
+    left at temperature `T`.
+    """
+    coefficients = np.zeros([len(streams), 3])
+    for i, stream in enumerate(streams):
+        stream.T = T - dT
+        H_lb = stream.Hnet
+        stream.T = T + dT
+        H_ub = stream.Hnet
+        stream.T = T
+        H = stream.Hnet
+        coefficients[i] = (
+            H, 
+            (H_ub - H_lb) / (2 * dT),
+            (H_ub - 2 * H + H_lb) / (2 * dT * dT),
+        )
+    return coefficients
+
+def quadratic(a, x):
+    return a[0] + x * (a[1] + x * a[2])
+
+def quadratic_derivative(a, x):
+    return a[1] + 2 * x * a[2]
+
 class FluidizedCatalyticCracking(bst.Unit):
     """
     Create a reactor for catalytic cracking.
@@ -38,6 +66,16 @@ class FluidizedCatalyticCracking(bst.Unit):
     """
     _N_ins = 4
     _N_outs = 3
+    
+    #: [float] Temperature tolerance [K] of the coupled reactor/regenerator energy balance.
+    energy_balance_Ttol = 1e-3
+    
+    #: [float] Temperature interval [K] to fit outlet enthalpies as quadratic polynomials.
+    energy_balance_sampling_dT = 5.
+    
+    #: [int] Maximum number of iterations of the coupled reactor/regenerator energy balance.
+    energy_balance_maxiter = 20
+    
     auxiliary_unit_names = (
         'pump', 'feed_preheater', 'air_compressor', 'condenser', 
         'riser', 'stripper', 'regenerator', 'reactor',
@@ -128,6 +166,12 @@ class FluidizedCatalyticCracking(bst.Unit):
         self.regenerator_length_to_diameter = regenerator_length_to_diameter
         self.regenerator_pressure = regenerator_pressure
         self.feed_vapor_fraction = feed_vapor_fraction
+        self._regenerated_catalyst = bst.Stream(None, thermo=self.thermo)
+        self._spent_catalyst = bst.Stream(None, thermo=self.thermo)
+        self.reset_cache()
+    
+    def reset_cache(self, isdynamic=None):
+        self._T_regenerator = self._T_reactor = None
         
     @property
     def feed(self): return self.ins[0]
@@ -151,6 +195,7 @@ class FluidizedCatalyticCracking(bst.Unit):
     def flue_gas(self): return self.outs[2]
     
     def _setup(self):
+        super()._setup()
         pump = self.auxiliary(
             'pump', bst.Pump, ins=self.feed, P=self.feed_pressure,
         )
@@ -208,41 +253,82 @@ class FluidizedCatalyticCracking(bst.Unit):
             air.F_mass = F_mass_O2_new = air.F_mass + dF_emissions
             flue_gas.mol += air.mol * (dF_emissions / F_mass_O2_new)
         self.air_compressor.run()
-        regenerated_catalyst = bst.Stream(
-            None, 
-            Catalyst=catalyst_recirculation,
-            units='kg/hr'
-        )
-        spent_catalyst = bst.Stream(
-            None, 
-            Catalyst=catalyst_recirculation, 
-            units='kg/hr'
-        )
-        spent_catalyst.mol += product_loss
+        regenerated_catalyst = self._regenerated_catalyst
+        spent_catalyst = self._spent_catalyst
+        regenerated_catalyst.empty()
+        regenerated_catalyst.imass['Catalyst'] = catalyst_recirculation
+        spent_catalyst.mol = product_loss
+        spent_catalyst.imass['Catalyst'] = catalyst_recirculation
         compressed_air = self.air_compressor-0
         heated_feed = self.feed_preheater-0
-        regenerator_outlets = [flue_gas, regenerated_catalyst, discarded_catalyst]
-        regenerator_inlets = [compressed_air, spent_catalyst, fresh_catalyst]
-        reactor_outlets = [product, spent_catalyst]
-        reactor_inlets = [heated_feed, steam, regenerated_catalyst]
-        feed_temperature = self.feed_preheater.outs[0].T
-        for i in regenerator_outlets + reactor_outlets: i.T = feed_temperature # Initial guess
-        dTs = np.ones(2)
-        while np.abs(dTs).sum() > 0.1:
-            # Energy balance correction equations
-            # dT_regenerator * (C_flue_gas + C_catalyst_regen + C_discarded_catalyst) - dT_reactor * C_catalyst_spent = DeltaH_regen
-            # dT_reactor * (C_catalyst_spent + C_product) - dT_regenerator * C_catalyst_regen = DeltaH_reactor
-            A = np.array(
-                [[sum([i.C for i in regenerator_outlets]), -spent_catalyst.C],
-                 [-regenerated_catalyst.C, sum([i.C for i in reactor_outlets])]]
-            )
-            b = np.array(
-                [sum([i.Hnet for i in regenerator_inlets]) - sum([i.Hnet for i in regenerator_outlets]),
-                 sum([i.Hnet for i in reactor_inlets]) - sum([i.Hnet for i in reactor_outlets])]
-            )
-            dT_regenerator, dT_reactor = dTs = np.linalg.solve(A, b)
-            for i in regenerator_outlets: i.T += dT_regenerator
-            for i in reactor_outlets: i.T += dT_reactor
+        # Enthalpies of inlets at fixed temperatures are computed only once
+        H_regenerator_in = compressed_air.Hnet + fresh_catalyst.Hnet
+        H_reactor_in = heated_feed.Hnet + steam.Hnet
+        T_regenerator = self._T_regenerator
+        T_reactor = self._T_reactor
+        if T_regenerator is None or T_reactor is None:
+            T_regenerator = T_reactor = heated_feed.T # Initial guess
+        self._T_regenerator, self._T_reactor = self._solve_energy_balance(
+            [flue_gas, regenerated_catalyst, discarded_catalyst],
+            [product, spent_catalyst],
+            H_regenerator_in, H_reactor_in, T_regenerator, T_reactor,
+        )
+        
+    def _solve_energy_balance(self, 
+            regenerator_outlets, reactor_outlets, 
+            H_regenerator_in, H_reactor_in, T_regenerator, T_reactor
+        ):
+        # Energy balances (the regenerated catalyst is a reactor inlet and 
+        # the spent catalyst is a regenerator inlet):
+        # H_regenerator_in + H_spent_catalyst(T_reactor) - H_regenerator_out(T_regenerator) = 0
+        # H_reactor_in + H_regenerated_catalyst(T_regenerator) - H_reactor_out(T_reactor) = 0
+        # Each iteration fits quadratic polynomials of the outlet enthalpies
+        # centered at the current temperatures and solves the balances with 
+        # Newton's method on these polynomials. Convergence is checked with the
+        # rigorous residuals at the center.
+        regenerated_catalyst = regenerator_outlets[1]
+        spent_catalyst = reactor_outlets[1]
+        Ttol = self.energy_balance_Ttol
+        dT = self.energy_balance_sampling_dT
+        for n in range(self.energy_balance_maxiter):
+            regenerator_coefficients = enthalpy_polynomial_coefficients(regenerator_outlets, T_regenerator, dT)
+            reactor_coefficients = enthalpy_polynomial_coefficients(reactor_outlets, T_reactor, dT)
+            a_regenerator_out = regenerator_coefficients.sum(0)
+            a_reactor_out = reactor_coefficients.sum(0)
+            a_regenerated_catalyst = regenerator_coefficients[1]
+            a_spent_catalyst = reactor_coefficients[1]
+            x_regenerator = x_reactor = 0.
+            for i in range(50):
+                residuals = np.array([
+                    H_regenerator_in 
+                    + quadratic(a_spent_catalyst, x_reactor)
+                    - quadratic(a_regenerator_out, x_regenerator),
+                    H_reactor_in 
+                    + quadratic(a_regenerated_catalyst, x_regenerator)
+                    - quadratic(a_reactor_out, x_reactor),
+                ])
+                jacobian = np.array([
+                    [-quadratic_derivative(a_regenerator_out, x_regenerator),
+                     quadratic_derivative(a_spent_catalyst, x_reactor)],
+                    [quadratic_derivative(a_regenerated_catalyst, x_regenerator),
+                     -quadratic_derivative(a_reactor_out, x_reactor)],
+                ])
+                dx_regenerator, dx_reactor = np.linalg.solve(jacobian, -residuals)
+                if i == 0 and abs(dx_regenerator) < Ttol and abs(dx_reactor) < Ttol:
+                    # Rigorous residuals at the center are within tolerance
+                    for stream in regenerator_outlets: stream.T = T_regenerator
+                    for stream in reactor_outlets: stream.T = T_reactor
+                    return T_regenerator, T_reactor
+                x_regenerator += dx_regenerator
+                x_reactor += dx_reactor
+                if abs(dx_regenerator) < 1e-9 and abs(dx_reactor) < 1e-9: break
+            T_regenerator += x_regenerator
+            T_reactor += x_reactor
+            dT = min(max(abs(x_regenerator), abs(x_reactor), Ttol), self.energy_balance_sampling_dT)
+        for stream in regenerator_outlets: stream.T = T_regenerator
+        for stream in reactor_outlets: stream.T = T_reactor
+        warn(f'{self!r} reactor/regenerator energy balance did not converge', RuntimeWarning)
+        return T_regenerator, T_reactor
 
     def _design(self):
         # volume = L * pi * D**2 / 4
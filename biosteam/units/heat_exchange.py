@@ -28,6 +28,7 @@ from math import exp, log as ln
 from typing import Optional
 from numba import njit
 from .._heat_utility import UtilityAgent
+from .._flash_scheduler import flash_scheduler
 
 __all__ = ('HX', 'HXutility', 'HXutilities', 'HXprocess')
 
@@ -584,42 +585,14 @@ class HXutility(HX):
                 raise RuntimeError("may only specify either temperature, 'T', "
                                    "vapor fraction 'V', or enthalpy 'H', "
                                    "in a rigorous simulation")
-            if V_given:
-                if V == 0:
-                    outlet.phase = 'l'
-                    outlet.T = outlet.bubble_point_at_P().T
-                elif V == 1:
-                    outlet.phase = 'g'
-                    outlet.T = outlet.dew_point_at_P().T
-                elif 0 < V < 1:
-                    outlet.vle(V=V, P=outlet.P)
-                else:
-                    raise RuntimeError("vapor fraction, 'V', must be a "
-                                       "positive fraction")
-            elif T_given:
-                if outlet.isempty():
-                    outlet.T = T
-                else:
-                    try:
-                        outlet.vle(T=T, P=outlet.P)
-                    except RuntimeError as e:
-                        if len(outlet.phases) > 1:
-                            raise e
-                        T_bubble = outlet.bubble_point_at_P().T
-                        if T <= T_bubble:
-                            outlet.phase = 'l'
-                        else:
-                            T_dew = outlet.dew_point_at_P().T
-                            if T_dew >= T:
-                                outlet.phase = 'g'
-                            else:
-                                raise RuntimeError(
-                                    'outlet in vapor-liquid equilibrium, but stream is linked')
-                        outlet.T = T
-                    except ValueError:
-                        outlet.vle(T=T, P=outlet.P)
-            else:
-                outlet.vle(H=H, P=outlet.P)
+            if (flash_scheduler.can_defer(outlet) 
+                and not (self.heat_only or self.cool_only)):
+                # No other unit uses the outlet before the next 
+                # synchronization point (e.g., recycle loop convergence)
+                if T_given: outlet.T = T
+                flash_scheduler.defer(outlet, self._rigorous_flash)
+                return
+            self._rigorous_flash()
         else:
             if T_given and H_given:
                 raise RuntimeError("cannot specify both temperature, 'T' "
@@ -656,6 +629,47 @@ class HXutility(HX):
             outlet.copy_like(feed)
             return
 
+    def _rigorous_flash(self):
+        outlet = self.outs[0]
+        T = self.T
+        V = self.V
+        if V is not None:
+            if V == 0:
+                outlet.phase = 'l'
+                outlet.T = outlet.bubble_point_at_P().T
+            elif V == 1:
+                outlet.phase = 'g'
+                outlet.T = outlet.dew_point_at_P().T
+            elif 0 < V < 1:
+                outlet.vle(V=V, P=outlet.P)
+            else:
+                raise RuntimeError("vapor fraction, 'V', must be a "
+                                   "positive fraction")
+        elif T is not None:
+            if outlet.isempty():
+                outlet.T = T
+            else:
+                try:
+                    outlet.vle(T=T, P=outlet.P)
+                except RuntimeError as e:
+                    if len(outlet.phases) > 1:
+                        raise e
+                    T_bubble = outlet.bubble_point_at_P().T
+                    if T <= T_bubble:
+                        outlet.phase = 'l'
+                    else:
+                        T_dew = outlet.dew_point_at_P().T
+                        if T_dew >= T:
+                            outlet.phase = 'g'
+                        else:
+                            raise RuntimeError(
+                                'outlet in vapor-liquid equilibrium, but stream is linked')
+                    outlet.T = T
+                except ValueError:
+                    outlet.vle(T=T, P=outlet.P)
+        else:
+            outlet.vle(H=self.H, P=outlet.P)
+
     def get_streams(self):
         """
         Return inlet and outlet streams.
@@ -17,6 +17,7 @@ from .._unit import Unit
 from thermosteam._graphics import mixer_graphics
 import flexsolve as flx
 import biosteam as bst
+from ..utils import get_solver_memory, clear_solver_memory
 import numpy as np
 from typing import Optional
 
@@ -280,6 +281,7 @@ class SteamMixer(Unit):
         return self.ins[1]
     
     def reset_cache(self, isdynamic=None): 
+        clear_solver_memory(self)
         for utility in bst.HeatUtility.heating_agents:
             if utility.P > self.P: break
         self.steam.copy_like(utility)
@@ -347,9 +349,13 @@ class SteamMixer(Unit):
             steam = self.steam
         steam_mol = steam.F_mol or 1.
         f = self.pressure_objective_function
-        steam_mol = flx.IQ_interpolation(f, *flx.find_bracket(f, 0., steam_mol, None, None), 
-                                         xtol=1e-2, ytol=1e-4, 
-                                         maxiter=500, checkroot=False)
+        cold_solve = lambda f: flx.IQ_interpolation(
+            f, *flx.find_bracket(f, 0., steam_mol, None, None), 
+            xtol=1e-2, ytol=1e-4, maxiter=500, checkroot=False
+        )
+        steam_mol = get_solver_memory(self, 'steam').solve(
+            f, cold_solve, xtol=1e-2, ytol=1e-4, lb=0.
+        )
         self.outs[0].P = self.P
         
     def _design(self): 
@@ -43,7 +43,7 @@ References
 import numpy as np
 from .. import Unit
 from .design_tools import size_batch
-from .decorators import cost
+from .decorators import cost, cost_items_at_design
 from math import ceil
 from scipy.integrate import odeint
 from thermosteam.reaction import Reaction, ParallelReaction
@@ -199,21 +199,38 @@ class NRELBatchBioreactor(Unit, isabstract=True):
     def tau(self, tau):
         self._tau = tau
     
+    def _batch_design(self, N):
+        v_0 = self.effluent.F_vol
+        design = size_batch(v_0, self._tau, self.tau_0, N, self.V_wf)
+        design['Number of reactors'] = N
+        design['Recirculation flow rate'] = v_0 / N
+        design['Reactor duty'] = self.Hnet
+        return design
+    
+    def capital_cost_curve(self, N=None):
+        """
+        Return the number of reactors and the total purchase cost [USD] at each 
+        number of reactors. All candidates are designed and costed in one 
+        vectorized call without rerunning the unit operation.
+        
+        Parameters
+        ----------
+        N : 1d array, optional
+            Candidate number of reactors. Defaults to all integers from 
+            `Nmin` to `Nmax`.
+        
+        """
+        if N is None: 
+            N = np.arange(max(self.Nmin, 2), max(self.Nmax, 2) + 1)
+        else:
+            N = np.asarray(N)
+        purchase_costs, kW = cost_items_at_design(self, self._batch_design(N))
+        return N, sum(purchase_costs.values())
+    
     @property
     def N_at_minimum_capital_cost(self):
-        cost_old = np.inf
-        self.autoselect_N = False
-        self._N, N = 2, self._N
-        cost_new = self.purchase_cost
-        self._summary()
-        while cost_new < cost_old:
-            self._N += 1
-            self._summary()
-            cost_old = cost_new
-            cost_new = self.purchase_cost
-        self._N, N = N, self._N
-        self.autoselect_N = True
-        return N - 1
+        N, cost = self.capital_cost_curve()
+        return int(N[cost.argmin()])
         
     def _design(self):
         effluent = self.effluent
@@ -232,12 +249,8 @@ class NRELBatchBioreactor(Unit, isabstract=True):
                 N = ceil(N)
         else:
             N = self._N
-        Design.update(size_batch(v_0, tau, tau_0, N, V_wf))
-        Design['Number of reactors'] = N
-        Design['Recirculation flow rate'] = v_0 / N
-        duty = self.Hnet
-        Design['Reactor duty'] = duty
-        self.add_heat_utility(duty, self.T)
+        Design.update(self._batch_design(N))
+        self.add_heat_utility(Design['Reactor duty'], self.T)
 
 
 class NRELFermentation(NRELBatchBioreactor):
@@ -320,27 +320,52 @@ class AbstractStirredTankReactor(PressureVessel, Unit, isabstract=True):
                 )
             reactor_duty = duty / N
             dT_hx_loop = self.dT_hx_loop
-            reactor_product = self.effluent.copy()
-            reactor_product.scale(1 / N)
-            hx_inlet = reactor_product.copy()
-            hx_outlet = hx_inlet.copy()
+            effluent = self.effluent
+            hx_outlet = effluent.copy()
             hx_outlet.T += (dT_hx_loop if duty > 0. else -dT_hx_loop)
-            dH = hx_outlet.H - hx_inlet.H
-            recirculation_ratio = reactor_duty / dH # Recirculated flow over net product flow
-            hx_inlet.scale(recirculation_ratio)
-            hx_outlet.scale(recirculation_ratio)
-            if self.batch:
-                self.recirculation_pump.ins[0].copy_like(hx_inlet)
-                self.recirculation_pump.simulate()
-            else:
-                self.recirculation_pump.ins[0].mix_from([hx_inlet, reactor_product])
-                self.recirculation_pump.simulate()
-                self.splitter.split = recirculation_ratio / (1 + recirculation_ratio)
-                self.splitter.simulate()
-                self.scaler.scale = N
-                self.scaler.simulate()
-            self.heat_exchanger.T = hx_outlet.T
-            self.heat_exchanger.simulate()
+            dH = hx_outlet.H - effluent.H
+            recirculation_ratio = duty / dH # Recirculated flow over net product flow
+            
+            def design_only():
+                # The recirculation loop is linear in the flow rate of 
+                # the reactor product, so streams are only scaled.
+                hx = self.heat_exchanger
+                hx_inlet = hx.ins[0]
+                hx_inlet.copy_like(effluent)
+                hx_inlet.scale(recirculation_ratio / N)
+                hx.outs[0].copy_like(hx_outlet)
+                hx.outs[0].scale(recirculation_ratio / N)
+                hx.T = hx_outlet.T
+                pump = self.recirculation_pump
+                pump.ins[0].copy_like(effluent)
+                if self.batch:
+                    pump.ins[0].scale(recirculation_ratio / N)
+                else:
+                    pump.ins[0].scale((1 + recirculation_ratio) / N)
+                    self.splitter.split = recirculation_ratio / (1 + recirculation_ratio)
+                    self.scaler.scale = N
+                pump.simulate_as_auxiliary_pump()
+                hx.simulate(run=False, design_kwargs=dict(duty=reactor_duty))
+            
+            def full():
+                reactor_product = effluent.copy()
+                reactor_product.scale(1 / N)
+                hx_inlet = reactor_product.copy()
+                hx_inlet.scale(recirculation_ratio)
+                if self.batch:
+                    self.recirculation_pump.ins[0].copy_like(hx_inlet)
+                    self.recirculation_pump.simulate()
+                else:
+                    self.recirculation_pump.ins[0].mix_from([hx_inlet, reactor_product])
+                    self.recirculation_pump.simulate()
+                    self.splitter.split = recirculation_ratio / (1 + recirculation_ratio)
+                    self.splitter.simulate()
+                    self.scaler.scale = N
+                    self.scaler.simulate()
+                self.heat_exchanger.T = hx_outlet.T
+                self.heat_exchanger.simulate()
+            
+            self._size_auxiliaries(design_only, full)
             
     def _cost(self):
         Design = self.design_results
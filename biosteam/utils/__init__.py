@@ -14,6 +14,7 @@ from . import (patches,
                stream_link_options,
                functors,
                scope,
+               solver_memory,
 )
 __all__ = ('colors',
            'patches', 
@@ -26,6 +27,7 @@ __all__ = ('colors',
            *stream_link_options.__all__,
            *functors.__all__,
            *scope.__all__,
+           *solver_memory.__all__,
 )
 from thermosteam.utils import *
 from .patches import *
@@ -34,5 +36,6 @@ from .piping import *
 from .stream_link_options import *
 from .functors import *
 from .scope import *
+from .solver_memory import *
 
 del utils
\ No newline at end of file
@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020-2023, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import flexsolve as flx
+from weakref import WeakKeyDictionary
+from math import inf
+
+__all__ = (
+    'SolverMemory',
+    'get_solver_memory',
+    'clear_solver_memory',
+    'solver_memory_report',
+)
+
+#: dict[Unit, dict[str, SolverMemory]] All solver memories by unit and solve name.
+_solver_memories = WeakKeyDictionary()
+
+def get_solver_memory(unit, name):
+    """
+    Return the SolverMemory object of a unit's specification solve, creating
+    it if necessary.
+
+    Parameters
+    ----------
+    unit : Unit
+        Unit which owns the solve.
+    name : str
+        Name of the solve.
+
+    """
+    try:
+        memories = _solver_memories[unit]
+    except KeyError:
+        _solver_memories[unit] = memories = {}
+    try:
+        memory = memories[name]
+    except KeyError:
+        memories[name] = memory = SolverMemory(name)
+    return memory
+
+def clear_solver_memory(unit=None):
+    """
+    Forget the last solutions of all solves of a unit (or of all units
+    if no unit is given) while keeping their statistics.
+    """
+    if unit is None:
+        for memories in _solver_memories.values():
+            for i in memories.values(): i.clear()
+    elif unit in _solver_memories:
+        for i in _solver_memories[unit].values(): i.clear()
+
+def solver_memory_report(units=None):
+    """
+    Return a DataFrame of warm-start hit rates and function evaluations
+    saved by each solver memory.
+
+    Parameters
+    ----------
+    units : Iterable[Unit], optional
+        Units to report. Defaults to all units with solver memories.
+
+    """
+    import pandas as pd
+    if units is None: units = list(_solver_memories)
+    index = []
+    data = []
+    for unit in units:
+        if unit not in _solver_memories: continue
+        for name, memory in _solver_memories[unit].items():
+            index.append((unit.ID, name))
+            data.append((
+                memory.solves, memory.hit_rate, memory.bracket_hits,
+                memory.cold_solves, memory.evaluations,
+                memory.estimated_evaluations_saved,
+            ))
+    return pd.DataFrame(
+        data,
+        index=pd.MultiIndex.from_tuples(index, names=('Unit', 'Solve')),
+        columns=('Solves', 'Hit rate', 'Bracket hits', 'Cold solves',
+                 'Evaluations', 'Evaluations saved'),
+    )
+
+
+class SolverMemory:
+    """
+    Create a SolverMemory object that warm starts a scalar specification
+    solve using the last solution, a local secant slope, and the tightest
+    valid bracket found in the previous solve.
+
+    Each root solve first evaluates the last solution and takes secant
+    steps starting with the remembered slope. As soon as the root is
+    bracketed, inverse quadratic interpolation is performed within this
+    tight bracket (or the remembered bracket if the secant steps diverge). If no valid bracket is found,
+    the original (cold) solve is used.
+
+    Parameters
+    ----------
+    name : str
+        Name of the solve.
+
+    Examples
+    --------
+    >>> from biosteam.utils import SolverMemory
+    >>> import flexsolve as flx
+    >>> memory = SolverMemory('sqrt')
+    >>> cold_solve = lambda f: flx.IQ_interpolation(f, 0., 10., ytol=1e-9)
+    >>> for a in (2., 2.01, 2.02):
+    ...     x = memory.solve(lambda x: x * x - a, cold_solve, ytol=1e-9, lb=0.)
+    >>> round(x, 6)
+    1.421267
+    >>> memory.solves, memory.bracket_hits, memory.cold_solves
+    (3, 2, 1)
+    >>> memory.cold_evaluations, memory.warm_evaluations
+    (10, 8)
+
+    """
+    #: [int] Maximum number of secant steps from the last solution before
+    #: falling back to the last bracket.
+    secant_steps = 3
+
+    __slots__ = (
+        'name', 'x', 'slope', 'bracket',
+        'solves', 'hits', 'bracket_hits', 'cold_solves',
+        'warm_evaluations', 'cold_evaluations',
+    )
+
+    def __init__(self, name):
+        #: [str] Name of the solve.
+        self.name = name
+
+        #: [float|None] Last solution.
+        self.x = None
+
+        #: [float|None] Secant slope of the objective near the last solution.
+        self.slope = None
+
+        #: [tuple[float, float]|None] Tightest bracket found in the last solve.
+        self.bracket = None
+
+        #: [int] Number of solves.
+        self.solves = 0
+
+        #: [int] Number of solves converged by the warm start (without bracketing).
+        self.hits = 0
+
+        #: [int] Number of solves converged within a tight bracket.
+        self.bracket_hits = 0
+
+        #: [int] Number of solves that required the original solve.
+        self.cold_solves = 0
+
+        #: [int] Function evaluations in warm started solves.
+        self.warm_evaluations = 0
+
+        #: [int] Function evaluations in cold solves.
+        self.cold_evaluations = 0
+
+    def clear(self):
+        """Forget last solution, slope, and bracket."""
+        self.x = self.slope = self.bracket = None
+
+    @property
+    def evaluations(self):
+        """[int] Total number of function evaluations."""
+        return self.warm_evaluations + self.cold_evaluations
+
+    @property
+    def hit_rate(self):
+        """[float] Fraction of solves converged without the original solve."""
+        solves = self.solves
+        return (solves - self.cold_solves) / solves if solves else 0.
+
+    @property
+    def estimated_evaluations_saved(self):
+        """[float] Function evaluations saved relative to the average cold solve."""
+        cold_solves = self.cold_solves
+        if not cold_solves: return 0.
+        warm_solves = self.solves - cold_solves
+        return warm_solves * self.cold_evaluations / cold_solves - self.warm_evaluations
+
+    def solve(self, f, cold_solve, xtol=0., ytol=5e-8, lb=-inf, ub=inf, maxiter=50):
+        """
+        Return the root of `f`, warm starting from the last solution. The
+        last function evaluation is always at the returned root.
+
+        Parameters
+        ----------
+        f : Callable[[float], float]
+            Objective function.
+        cold_solve : Callable[[Callable], float]
+            Original solve to use when no bracket is found; takes the objective
+            function and returns the root.
+        xtol : float, optional
+            Solution tolerance.
+        ytol : float, optional
+            Residual tolerance.
+        lb : float, optional
+            Lower bound of the solution.
+        ub : float, optional
+            Upper bound of the solution.
+        maxiter : int, optional
+            Maximum number of iterations within a tight bracket.
+
+        """
+        points = []
+        def objective(x):
+            y = f(x)
+            points.append((x, y))
+            return y
+        self.solves += 1
+        x = self._warm_solve(objective, xtol, ytol, lb, ub, maxiter)
+        if x is None:
+            N_warm = len(points)
+            x = cold_solve(objective)
+            if not points or points[-1][0] != x: objective(x)
+            self.cold_solves += 1
+            self.warm_evaluations += N_warm
+            self.cold_evaluations += len(points) - N_warm
+        else:
+            if points[-1][0] != x: objective(x)
+            self.warm_evaluations += len(points)
+        self._remember(x, points)
+        return x
+
+    def fixed_point(self, f, x, xtol=5e-8, maxiter=50):
+        """
+        Return the fixed point of `f` by Wegstein's method, starting from the
+        last solution (or `x` if no solution is remembered).
+
+        """
+        evaluations = 0
+        def g(x):
+            nonlocal evaluations
+            evaluations += 1
+            return f(x)
+        self.solves += 1
+        if self.x is None:
+            self.x = x = flx.wegstein(g, x, xtol, maxiter=maxiter)
+            self.cold_solves += 1
+            self.cold_evaluations += evaluations
+        else:
+            self.x = x = flx.wegstein(g, self.x, xtol, maxiter=maxiter)
+            self.hits += 1
+            self.warm_evaluations += evaluations
+        return x
+
+    def _warm_solve(self, f, xtol, ytol, lb, ub, maxiter):
+        x0 = self.x
+        if x0 is None: return None
+        x0 = min(max(x0, lb), ub)
+        y0 = f(x0)
+        if abs(y0) < ytol:
+            self.hits += 1
+            return x0
+        slope = self.slope
+        if not slope: return None
+        for i in range(self.secant_steps):
+            x1 = min(max(x0 - y0 / slope, lb), ub)
+            if x1 == x0: break
+            y1 = f(x1)
+            if abs(y1) < ytol:
+                self.hits += 1
+                return x1
+            if y0 * y1 < 0.:
+                self.bracket_hits += 1
+                return flx.IQ_interpolation(
+                    f, x0, x1, y0, y1, xtol=xtol, ytol=ytol,
+                    maxiter=maxiter, checkiter=False
+                )
+            if abs(y1) >= abs(y0) or y1 == y0: break
+            slope = (y1 - y0) / (x1 - x0)
+            x0, y0 = x1, y1
+        bracket = self.bracket
+        if bracket is None: return None
+        # Evaluate the end of the last bracket towards the root
+        xa, xb = bracket
+        x1 = xa if (-y0 / slope < 0.) else xb
+        x1 = min(max(x1, lb), ub)
+        if x1 == x0: return None
+        y1 = f(x1)
+        if y0 * y1 < 0.:
+            self.bracket_hits += 1
+            return flx.IQ_interpolation(
+                f, x0, x1, y0, y1, xtol=xtol, ytol=ytol,
+                maxiter=maxiter, checkiter=False
+            )
+
+    def _remember(self, x, points):
+        self.x = x
+        below = above = None
+        for xi, yi in points:
+            if yi < 0.:
+                if below is None or abs(xi - x) < abs(below[0] - x): below = (xi, yi)
+            elif yi > 0.:
+                if above is None or abs(xi - x) < abs(above[0] - x): above = (xi, yi)
+        if below and above:
+            xa, ya = below
+            xb, yb = above
+            self.slope = (yb - ya) / (xb - xa)
+            self.bracket = (xa, xb) if xa < xb else (xb, xa)
+        else:
+            # Secant slope of the two best evaluated points
+            points = sorted(set(points), key=lambda i: abs(i[1]))
+            if len(points) > 1:
+                (xa, ya), (xb, yb) = points[:2]
+                if xa != xb: self.slope = (yb - ya) / (xb - xa)
+            self.bracket = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.name!r})"
@@ -6,6 +6,7 @@
 # github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
 # for license details.
 sympy = None
+import numpy as np
 import biosteam as bst
 from . import (
     get_BD_dct,
@@ -14,6 +15,7 @@ from . import (
     IC_purchase_cost_algorithms
 )
 
+DesignError = bst.exceptions.DesignError
 
 __all__ = ('InternalCirculationRx',)
 
@@ -218,6 +220,89 @@ class InternalCirculationRx(bst.MixTank):
 
 
     def _run_separate(self, run_inputs):
+        Vliq = run_inputs[5]
+        Xb, Xe, Sb, Vb = [float(i) for i in self.solve_separate(*run_inputs)]
+        if Vb != Vb: # NaN
+            raise DesignError('No feasible design found for the given parameters.')
+        Vt = Vliq - Vb # volume of the top rx, m3
+        self._Vb, self._Vt = Vb, Vt
+        return Xb, Xe
+
+    @staticmethod
+    def solve_separate(Qi, Si, Xi, Qe, Se, Vliq, Y, mu_max, b, Fxb, Fxt):
+        """
+        Return the steady state biomass concentrations in the bottom 
+        reactor and the effluent (Xb, Xe) [kg/m3], the substrate 
+        concentration in the bottom reactor (Sb) [kg/m3], and the volume of 
+        the bottom reactor (Vb) [m3] for the "separate" design method. 
+        All arguments may be arrays (e.g., for batches of influent conditions);
+        results are NaN where no feasible design exists.
+        
+        Notes
+        -----
+        Eliminating Xb, Xe, and Sb from the biomass and substrate balances of 
+        the bottom and top reactors gives a quadratic in Vb, which is 
+        solved in closed form. When multiple roots satisfy the design 
+        constraints, the one with the lowest effluent biomass is selected.
+        
+        """
+        arrays = np.broadcast_arrays(
+            *[np.asarray(i, dtype=float) for i in 
+              (Qi, Si, Xi, Qe, Se, Vliq, Y, mu_max, b, Fxb, Fxt)]
+        )
+        shape = arrays[0].shape
+        Qi, Si, Xi, Qe, Se, Vliq, Y, mu_max, b, Fxb, Fxt = [i.flatten() for i in arrays]
+        k = mu_max - b
+        A = Qe*Fxb + Qi - Qe # Xb * (A - k*Vb) = Qi*Xi
+        B = Qe*Fxt - k*Vliq # Xe * (B + k*Vb) = Qe*Fxb*Xb
+        c = Qi*Xi
+        D = Y*(Si - Se)
+        E = mu_max*c/Qi
+        F = mu_max*Fxb*c
+        a2 = -k*(D*k + E)
+        a1 = D*k*(A - B) - E*B + F
+        a0 = D*A*B - F*Vliq
+        with np.errstate(divide='ignore', invalid='ignore'):
+            discriminant = a1*a1 - 4*a2*a0
+            root = np.sqrt(np.where(discriminant >= 0, discriminant, np.nan))
+            linear = a2 == 0
+            Vb = np.stack([
+                np.where(linear, -a0/a1, (-a1 + root)/(2*a2)),
+                np.where(linear, np.nan, (-a1 - root)/(2*a2)),
+            ])
+            Vt = Vliq - Vb
+            den_b = A - k*Vb
+            den_t = B + k*Vb
+            # Degenerate roots (e.g., no biomass in influent) are solved from
+            # the substrate balances instead
+            Xb = np.where(
+                np.abs(den_b) > 1e-12 * (np.abs(A) + np.abs(k*Vb)), 
+                c/den_b,
+                (Si - Se)/(mu_max*Vb/(Y*Qi) + mu_max*Vt*Fxb/(Y*den_t))
+            )
+            Sb = Si - mu_max*Xb*Vb/(Y*Qi)
+            Xe = np.where(
+                np.abs(den_t) > 1e-12 * (np.abs(B) + np.abs(k*Vb)),
+                Qe*Fxb*Xb/den_t,
+                Y*Qe*(Sb - Se)/(mu_max*Vt)
+            )
+            OLRt = Qe*Sb / Vt
+            OLRb = Qi*Si / Vb
+            feasible = (
+                (0 <= OLRt) & (OLRt <= OLRb) &
+                (0 <= Se) & (Se <= Sb) & (Sb <= Si) &
+                (0 <= Xe) & (Xe <= Xb) &
+                (0 <= Vb) & (Vb <= Vliq)
+            )
+        index = np.where(feasible, Xe, np.inf).argmin(axis=0)
+        results = [np.take_along_axis(i, index[None], 0)[0] for i in (Xb, Xe, Sb, Vb)]
+        infeasible = ~feasible.any(axis=0)
+        for i in results: i[infeasible] = np.nan
+        return [i.reshape(shape) for i in results]
+
+    @staticmethod
+    def _solve_separate_symbolically(run_inputs):
+        # Reference implementation for validating `solve_separate`
         global sympy 
         if sympy is None: import sympy
         Qi, Si, Xi, Qe, Se, Vliq, Y, mu_max, b, Fxb, Fxt = run_inputs
@@ -237,13 +322,7 @@ class InternalCirculationRx(bst.MixTank):
              sympy.Eq(biomass_t, 0),
              sympy.Eq(substrate_b, 0),
              sympy.Eq(substrate_t, 0)), (Xb, Xe, Sb, Vb))
-
-        Xb, Xe, Sb, Vb = self._filter_results('separate', parameters, results)
-
-        Vt = Vliq - Vb # volume of the top rx, m3
-        self._Vb, self._Vt = Vb, Vt
-        return Xb, Xe
-
+        return InternalCirculationRx._filter_results('separate', parameters, results)
 
     @staticmethod
     def _filter_results(method, parameters, results):
@@ -265,9 +344,10 @@ class InternalCirculationRx(bst.MixTank):
                 solutions.append(result)
 
         if len(solutions) == 0 :
-            raise bst.DesignError('No feasible design found for the given parameters.')
-
-        elif len(solutions) >1: # find more than one solution
+            raise DesignError('No feasible design found for the given parameters.')
+        elif len(solutions) == 1:
+            return solutions[0]
+        else: # find more than one solution
             Xbs = [i[1] for i in solutions]
             index = Xbs.index(min(Xbs)) # choose the one with lowest effluent biomass
             return solutions[index]
@@ -307,7 +387,16 @@ class InternalCirculationRx(bst.MixTank):
                                            vle=False,
                                            hxn_ok=self.hxn_ok)
         
-        for p in (self.effluent_pump, self.sludge_pump): p.simulate()
+        pumps = (self.effluent_pump, self.sludge_pump)
+        
+        def design_only():
+            # Pump inlets are proxies of the effluent and sludge
+            for p in pumps: p.simulate_as_auxiliary_pump()
+        
+        def full():
+            for p in pumps: p.simulate()
+        
+        self._size_auxiliaries(design_only, full)
 
 
 
@@ -674,12 +674,19 @@ class AnMBR(bst.Unit):
         self.AF_pump = self.AF.lift_pump if self.AF else None
         self.AeF_pump = self.AeF.lift_pump if self.AeF else None
 
-        pipe_ss, pump_ss, hdpe = 0., 0., 0.
-        for i in pumps:
-            p = getattr(self, f'{i}_pump')
-            if p == None: continue
+        pump_units = [getattr(self, f'{i}_pump') for i in pumps]
+        pump_units = [p for p in pump_units if p is not None]
+
+        def design_only():
+            # Pump inlets are proxies of streams at design conditions
+            for p in pump_units: p.simulate(run=False)
 
-            p.simulate()
+        def full():
+            for p in pump_units: p.simulate()
+
+        self._size_auxiliaries(design_only, full, pump_units)
+        pipe_ss, pump_ss, hdpe = 0., 0., 0.
+        for p in pump_units:
             pipe_ss += p.design_results['Pipe stainless steel [kg]']
             pump_ss += p.design_results['Pump stainless steel [kg]']
             hdpe += p.design_results['Chemical storage HDPE [m3]']
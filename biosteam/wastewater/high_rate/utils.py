@@ -13,6 +13,7 @@ This module contains data and utility functions for the high-rate wastewater tre
 
 import biosteam as bst
 import numpy as np
+from weakref import WeakKeyDictionary
 from chemicals.elements import molecular_weight
 from warnings import warn
 from thermosteam import Chemical, Chemicals, Stream, settings, Thermo
@@ -42,6 +43,7 @@ __all__ = (
     # Digestion
     'get_BD_dct',
     'get_digestable_chemicals',
+    'get_digestion_stoichiometry',
     'compute_stream_COD',
     'get_digestion_rxns',
     # Miscellaneous
@@ -367,8 +369,8 @@ def get_COD_stoichiometry(chemical):
 
 
 def get_digestable_chemicals(chemicals):
-    chems = [chemicals[i.ID] for i in chemicals
-             if get_COD_stoichiometry(i)['O2']!=0]
+    iCOD = get_digestion_stoichiometry(chemicals)[0]
+    chems = [chemicals[i.ID] for i, COD in zip(chemicals, iCOD) if COD != 0]
     return chems
 
 
@@ -433,6 +435,68 @@ def get_BD_dct(chemicals, default_BD=1, **kwargs):
     return BD_dct
 
 
+_digestion_stoichiometry_cache = WeakKeyDictionary()
+
+def _get_digestion_cache(chemicals):
+    try:
+        return _digestion_stoichiometry_cache[chemicals]
+    except KeyError:
+        pass
+    O2_MW = molecular_weight({'O': 2})
+    iCOD = np.array([-get_COD_stoichiometry(i)['O2'] for i in chemicals]) * O2_MW
+    IDs = chemicals.IDs
+    index = []
+    BMP = []
+    biogas_rxns = []
+    for n, i in enumerate(chemicals):
+        stoichiometry = get_BMP_stoichiometry(i)
+        if not stoichiometry.get(i.ID): continue # no conversion of this chemical
+        index.append(n)
+        row = np.zeros(len(IDs))
+        for ID, value in stoichiometry.items():
+            if value: row[chemicals.index(ID)] = value
+        BMP.append(row)
+        # Do not check atomic balance as P will not be accounted for
+        biogas_rxns.append(
+            Rxn(reaction=stoichiometry, reactant=i.ID, X=1., chemicals=chemicals,
+                check_atomic_balance=False)
+        )
+    BMP = np.array(BMP) if BMP else np.zeros([0, len(IDs)])
+    for i in (iCOD, BMP): i.setflags(write=False)
+    cache = _digestion_stoichiometry_cache[chemicals] = {
+        'iCOD': iCOD, 
+        'index': np.array(index, dtype=int),
+        'BMP': BMP,
+        'biogas_rxns': biogas_rxns,
+        'rxns': {},
+    }
+    return cache
+
+def get_digestion_stoichiometry(chemicals):
+    r"""
+    Return the theoretical chemical oxygen demand (COD) and biochemical
+    methane potential (BMP) stoichiometry of all chemicals. Results are 
+    computed once and cached for each chemicals object.
+    
+    Parameters
+    ----------
+    chemicals : CompiledChemicals
+    
+    Returns
+    -------
+    iCOD : 1d array
+        COD of each chemical, [kg O2/kmol].
+    index : 1d array[int]
+        Indices of chemicals that can be converted to biogas.
+    BMP : 2d array
+        Molar stoichiometry of biogas production from each chemical in 
+        `index` (one row per chemical), see :func:`get_BMP_stoichiometry`.
+    
+    """
+    cache = _get_digestion_cache(chemicals)
+    return cache['iCOD'], cache['index'], cache['BMP']
+
+
 def compute_stream_COD(stream):
     r"""
     Compute the chemical oxygen demand (COD) of a given stream in kg-O2/m3
@@ -441,56 +505,82 @@ def compute_stream_COD(stream):
     .. math::
         COD [\frac{kg}{m^3}] = mol_{chemical} [\frac{kmol}{m^3}] * \frac{g O_2}{mol chemical}
     """
-    chems = stream.chemicals
-    mol = stream.mol
-    if stream.F_vol == 0: return 0
-    iCOD = np.array([-get_COD_stoichiometry(i)['O2'] for i in chems])
-    COD = (mol*iCOD).sum()*molecular_weight({'O': 2}) / stream.F_vol
-    return COD
-
+    F_vol = stream.F_vol
+    if F_vol == 0: return 0
+    iCOD = _get_digestion_cache(stream.chemicals)['iCOD']
+    return stream.mol.dot(iCOD) / F_vol
+
+
+def _get_digestion_rxns_by_reactant(chemicals, biomass_ID):
+    cache = _get_digestion_cache(chemicals)
+    rxns = cache['rxns']
+    if biomass_ID in rxns: return rxns[biomass_ID]
+    biomass_index = chemicals.index(biomass_ID)
+    biomass_MW = chemicals.MW[biomass_index]
+    IDs = chemicals.IDs
+    MW = chemicals.MW
+    rxns[biomass_ID] = rxns_by_reactant = []
+    for i, biogas_rxn in zip(cache['index'], cache['biogas_rxns']):
+        if i == biomass_index: continue
+        ID = IDs[i]
+        # Cannot check atom balance since the substrate may not have the atom
+        growth_rxn = Rxn(reaction={ID: -1., biomass_ID: MW[i] / biomass_MW},
+                         reactant=ID, X=1., chemicals=chemicals,
+                         check_atomic_balance=False)
+        rxns_by_reactant.append((ID, biogas_rxn, growth_rxn))
+    return rxns_by_reactant
+    
 
 def get_digestion_rxns(stream, BD, X_biogas, X_growth, biomass_ID):
-    biomass_MW = getattr(stream.chemicals, biomass_ID).MW
-    chems = [i for i in stream.chemicals if i.ID!=biomass_ID]
-    BD = 1. if not BD else BD
-    if isinstance(BD, float):
-        BD = dict.fromkeys([i.ID for i in chems], BD)
-
+    """
+    Return a :class:`~thermosteam.reaction.ParallelReaction` object for the 
+    conversion of biodegradable chemicals to biogas and/or biomass. If there
+    is less than two reactions, return an empty list.
+    
+    Parameters
+    ----------
+    stream : Stream
+        Defines the chemicals.
+    BD : float or dict[str, float]
+        Biodegradability of all chemicals or by chemical ID 
+        (no entry means not biodegradable).
+    X_biogas : float
+        Fraction of biodegradable chemicals converted to biogas.
+    X_growth : float
+        Fraction of biodegradable chemicals converted to biomass.
+    biomass_ID : str
+        ID of biomass chemical.
+    
+    Notes
+    -----
+    The stoichiometry of all reactions is cached for each set of chemicals,
+    so only conversions are computed from `BD`, `X_biogas`, and `X_growth`.
+    
+    """
     if X_biogas+X_growth > 1:
         raise ValueError('Sum of `X_biogas`/`X_decomp` and `X_biogas` is '
                          f'{X_biogas+X_growth}, larger than 100%.')
-
+    BD = 1. if not BD else BD
+    get = BD.get if isinstance(BD, dict) else lambda ID: BD
     biogas_rxns = []
     growth_rxns = []
-    for i in chems:
-        X = BD.get(i.ID)
-        if not X:
-            continue # assume no entry means not biodegradable
-
-        biogas_stoyk = get_BMP_stoichiometry(i)
-        if not biogas_stoyk.get(i.ID): # no conversion of this chemical
-            continue
-
+    biogas_X = []
+    growth_X = []
+    for ID, biogas_rxn, growth_rxn in _get_digestion_rxns_by_reactant(stream.chemicals, biomass_ID):
+        X = get(ID)
+        if not X: continue # assume no entry means not biodegradable
         iX_biogas = X * X_biogas # the amount of chemical used for biogas production
         iX_growth = X * X_growth # the amount of chemical used for cell growth
-
-        if iX_biogas: # do not check atomic balance as P will not be accounted for
-            biogas_rxn = Rxn(reaction=biogas_stoyk, reactant=i.ID, X=iX_biogas,
-                             check_atomic_balance=False)
-            biogas_rxns.append(biogas_rxn)
-
+        if iX_biogas:
+            biogas_rxns.append(biogas_rxn.copy())
+            biogas_X.append(iX_biogas)
         if iX_growth:
-        # Cannot check atom balance since the substrate may not have the atom
-            growth_rxn = Rxn(f'{i.ID} -> {i.MW/biomass_MW}{biomass_ID}',
-                             reactant=i.ID, X=iX_growth,
-                             check_atomic_balance=False)
-
-
-            growth_rxns.append(growth_rxn)
-
+            growth_rxns.append(growth_rxn.copy())
+            growth_X.append(iX_growth)
     if len(biogas_rxns)+len(growth_rxns)>1:
-        return PRxn(biogas_rxns+growth_rxns)
-
+        rxns = PRxn(biogas_rxns+growth_rxns)
+        rxns.X = biogas_X + growth_X
+        return rxns
     return []
 
 
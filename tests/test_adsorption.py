@@ -9,7 +9,82 @@
 """
 import pytest
 import biosteam as bst
+import numpy as np
 from numpy.testing import assert_allclose
+from biosteam.units import adsorption
+
+def test_banded_jacobian():
+    N_slices = 10
+    N = 2 * N_slices
+    y = np.random.default_rng(0).uniform(0.05, 1, N)
+    for isotherm, parameter in ((0, 2.), (1, 1 / 2.58)):
+        args = (N_slices, 0.3, 1 / (N_slices - 1), 50., isotherm, parameter, 1.)
+        J = adsorption.sparse_jacobian_banded(0, y, *args).toarray()
+        J_fd = np.zeros([N, N])
+        for j in range(N):
+            dy = np.zeros(N)
+            dy[j] = h = 1e-7
+            J_fd[:, j] = (
+                adsorption.dCdt_banded(0, y + dy, *args) 
+                - adsorption.dCdt_banded(0, y - dy, *args)
+            ) / (2 * h)
+        assert_allclose(J, J_fd, rtol=1e-5, atol=1e-5)
+
+def test_dimensionless_bed():
+    bst.settings.set_thermo([
+       'Water', 
+       bst.Chemical('Adsorbate', search_db=False, default=True, phase='l'),
+       bst.Chemical('ActivatedCarbon', search_db=False, default=True, phase='s')
+    ], cache=True)
+    feed = bst.Stream(phase='l', T=298, P=1.01e+06,
+                      Water=1000, Adsorbate=0.001, units='kg/hr')
+    A1 = bst.AdsorptionColumn(
+        ins=feed, cycle_time=1000, superficial_velocity=9.2,
+        isotherm_model='Langmuir', isotherm_args=(1e3, 7.), k=0.3,
+        void_fraction=0.525, C_final_scaled=0.05, adsorbate='Adsorbate',
+    )
+    A1.simulate()
+    assert_allclose(A1.get_design_result('Length', 'm'), 3.719569959973853, rtol=1e-3)
+    
+    # Breakthrough profiles are bounded by the feed concentration
+    t, CL, q = A1._simulate_dimensionless_bed(False, 0.24, 1205.26, 0, 0.997, 1000.)
+    assert t[-1] == 1000.
+    assert (CL > -1e-6).all() and (CL < 1 + 1e-6).all()
+    assert (q > -1e-6).all() and (q < 1 + 1e-6).all()
+    assert CL[0, -1] > CL[-1, -1]
+
+def test_regeneration():
+    bst.settings.set_thermo([
+       'Water', 
+       bst.Chemical('Adsorbate', search_db=False, default=True, phase='l'),
+       bst.Chemical('ActivatedCarbon', search_db=False, default=True, phase='s')
+    ], cache=True)
+    feed = bst.Stream(phase='l', T=298, P=1.01e+06,
+                      Water=1000, Adsorbate=0.001, units='kg/hr')
+    A1 = bst.AdsorptionColumn(
+        ins=feed, cycle_time=1000, superficial_velocity=9.2,
+        isotherm_model='Langmuir', isotherm_args=(1e3, 7.), k=0.3,
+        regeneration_fluid=dict(Water=1, T=350, phase='l'),
+        regeneration_isotherm_model='Langmuir', 
+        regeneration_isotherm_args=(300., 7.), k_regeneration=0.3,
+        void_fraction=0.525, C_final_scaled=0.05, adsorbate='Adsorbate',
+    )
+    A1.simulate()
+    u = A1.regeneration_velocity
+    assert 4 < u < 14.4
+    
+    # Clean regeneration fluid desorbs the saturated bed by the end of the cycle
+    assert_allclose(A1.rq_scaled[:, 0], 1)
+    assert_allclose(A1.rq_scaled[:, -1].max(), A1.regenerated_loading, rtol=0.05)
+    assert_allclose(A1.rt_scaled[-1] * A1.rt_scale, A1.cycle_time)
+    regeneration_fluid, spent_fluid = A1.heat_exchanger.outs[0], A1.outs[1]
+    assert_allclose(regeneration_fluid.F_vol, A1.area * u, rtol=1e-6)
+    assert_allclose(A1.ins[1].F_mol, regeneration_fluid.F_mol)
+    assert spent_fluid.T == 350
+    assert_allclose(spent_fluid.imol['Adsorbate'], feed.imol['Adsorbate'])
+    
+    # Regeneration is faster at higher velocities
+    assert A1._regeneration_loading_objective(2 * u) < 0 < A1._regeneration_loading_objective(u / 2)
 
 # def test_fit():
 #     import biosteam as bst
@@ -73,4 +148,8 @@ from numpy.testing import assert_allclose
 # def test_adsorption_bed_pressure_drop():
 #     f = lambda L, u: bst.unuts.adsorption.adsorption_bed_pressure_drop(u=u/3600, L=L)
 #     X, Y, Z = bst.plots.generate_contour_data(f, [1, 10], [4, 14], n=10)
-    
+
+if __name__ == '__main__':
+    test_banded_jacobian()
+    test_dimensionless_bed()
+    test_regeneration()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020-2023, Yoel Cortes-Pena <yoelcortes@gmail.com>
+# 
+# This module is under the UIUC open-source license. See 
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import biosteam as bst
+from numpy.testing import assert_allclose
+
+def test_aerated_bioreactor_power_model():
+    chemicals = bst.Chemicals(['Water', 'Glucose', 'O2', 'N2', 'CO2'])
+    chemicals.Glucose.at_state('l')
+    bst.settings.set_thermo(chemicals)
+    def create_bioreactor(optimize_power):
+        feed = bst.Stream(Water=1.20e+05, Glucose=2.5e+04, units='kg/hr', T=32+273.15)
+        rxn = bst.Rxn('Glucose + O2 -> H2O + CO2', reactant='Glucose', X=0.5, correct_atomic_balance=True)
+        return bst.AeratedBioreactor(
+            ins=[feed, bst.Stream(phase='g')], tau=12, V_max=500, reactions=rxn,
+            optimize_power=optimize_power,
+        )
+    
+    R1 = create_bioreactor(True)
+    R1.simulate()
+    assert_allclose(R1.air.imol['O2'], 1155.1, rtol=1e-3)
+    assert_allclose(R1.power_utility.rate, 9629.9, rtol=1e-3)
+    
+    # Compressor power is proportional to the air flow rate
+    compressor = R1.compressor
+    power = compressor.power_utility.consumption
+    compressor.ins[0].scale(2)
+    compressor.simulate()
+    assert_allclose(compressor.power_utility.consumption, 2 * power, rtol=1e-6)
+    
+    R1 = create_bioreactor(False)
+    R1.simulate()
+    assert_allclose(R1.air.imol['O2'], 3353.5, rtol=1e-3)
+
+def test_gas_fed_bioreactor_power_model():
+    bst.settings.set_thermo(['H2', 'CO2', 'N2', 'O2', 'H2O', 'AceticAcid'], cache=True)
+    media = bst.Stream(H2O=10000, units='kg/hr')
+    H2 = bst.Stream(H2=100, units='kg/hr', phase='g')
+    CO2 = bst.Stream(CO2=100, units='kg/hr', phase='g')
+    rxn = bst.Rxn('H2 + CO2 -> AceticAcid + H2O', reactant='H2', correct_atomic_balance=True) 
+    brxn = rxn.backwards(reactant='AceticAcid')
+    R1 = bst.GasFedBioreactor(
+        ins=[media, H2, CO2], tau=68, V_max=500,
+        reactions=rxn, backward_reactions=brxn, gas_substrates=('H2', 'CO2'),
+        titer={'AceticAcid': 5}, variable_gas_feeds=(1, 2), kW_per_m3=0.1,
+    )
+    R1.simulate()
+    assert_allclose([H2.F_mol, CO2.F_mol], [33.47, 1.690], rtol=1e-3)
+    assert_allclose(R1.power_utility.rate, 114.59, rtol=1e-3)
+    SURs = R1.get_SURs(R1.outs[1])[0]
+    compressor_power = R1._get_compressor_power_model()
+    assert_allclose(
+        R1._solve_total_power(SURs, compressor_power()),
+        R1._solve_total_power(SURs),
+    )
+    
+if __name__ == '__main__':
+    test_aerated_bioreactor_power_model()
+    test_gas_fed_bioreactor_power_model()
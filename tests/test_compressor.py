@@ -405,6 +405,87 @@ def test_multistage_setup_updates_after_changing_specifications():
     units_6 = (K.compressors, K.hxs)
     for i in units_6: assert len(i) == 6
 
+def test_fast_isentropic_path():
+    bst.settings.set_thermo(['H2', 'Methane', 'CO2'], cache=True)
+    def simulate_compressors():
+        results = []
+        for cls, kwargs in ((bst.IsentropicCompressor, {}),
+                            (bst.PolytropicCompressor, dict(method='schultz')),
+                            (bst.PolytropicCompressor, dict(method='hundseid'))):
+            feed = bst.Stream(H2=1, Methane=2, CO2=0.3, T=300, phase='g')
+            K = cls(ins=feed, P=20e5, eta=0.7, **kwargs)
+            K.simulate()
+            results.append((K.outs[0].T, K.outs[0].H, K.power_utility.rate))
+            if K._isentropic_path is not None: assert K._isentropic_path.valid
+        feed = bst.Stream(H2=1, Methane=2, CO2=0.3, T=300, phase='g')
+        K = bst.MultistageCompressor(ins=feed, pr=2, n_stages=4, eta=0.7)
+        K.simulate()
+        results.append((K.outs[0].T, K.outs[0].H, K.power_utility.rate))
+        return results
+    
+    Compressor = bst.units.compressor.Compressor
+    try:
+        Compressor.fast_isentropic_path = False
+        rigorous_results = simulate_compressors()
+    finally:
+        Compressor.fast_isentropic_path = True
+    fast_results = simulate_compressors()
+    assert_allclose(fast_results, rigorous_results, rtol=1e-5)
+    
+    # Path is checked against rigorous thermodynamics
+    feed = bst.Stream(H2=1, Methane=2, CO2=0.3, T=300, phase='g')
+    path = bst.units.compressor.IsentropicPath(feed)
+    out = feed.copy()
+    out.P = 20e5
+    T = path.isentropic_T(feed.T, feed.P, out.P)
+    path.set_T(out, T, S=feed.S)
+    assert path.valid
+    assert_allclose(out.S, feed.S, rtol=1e-8)
+    path.set_T(out, T + 5, S=feed.S) # Wrong estimate falls back to rigorous solution
+    assert not path.valid
+    assert_allclose(out.S, feed.S, rtol=1e-8)
+
+    
+    # Isentropic states of multistep paths are also checked
+    feed = bst.Stream(H2=1, Methane=2, CO2=0.3, T=300, phase='g')
+    K = bst.PolytropicCompressor(ins=feed, P=20e5, eta=0.7, method='hundseid')
+    K.simulate()
+    path = K._isentropic_path
+    path.C_nodes *= 1.05 # Corrupt heat capacities
+    K.simulate()
+    assert not path.valid
+    assert_allclose(K.outs[0].T, rigorous_results[2][0], rtol=1e-5)
+
+def test_compressors_with_equation_of_state():
+    chemicals = bst.Chemicals(['H2', 'Methane', 'CO2'])
+    thermo = bst.Thermo(chemicals, mixture=bst.PRMixture.from_chemicals(chemicals))
+    bst.settings.set_thermo(thermo)
+    def simulate_compressors():
+        results = []
+        for cls, kwargs in ((bst.IsentropicCompressor, {}),
+                            (bst.PolytropicCompressor, dict(method='schultz')),
+                            (bst.PolytropicCompressor, dict(method='hundseid'))):
+            feed = bst.Stream(H2=1, Methane=2, CO2=0.3, T=300, phase='g')
+            K = cls(ins=feed, P=50e5, eta=0.7, **kwargs)
+            K.simulate()
+            assert K._isentropic_path is None
+            results.append((K.outs[0].T, K.outs[0].H))
+        feed = bst.Stream(H2=1, Methane=2, CO2=0.3, T=300, phase='g')
+        K = bst.MultistageCompressor(ins=feed, pr=2, n_stages=4, eta=0.7)
+        K.simulate()
+        results.append((K.outs[0].T, K.outs[0].H))
+        return results
+    
+    # Equations of state are solved rigorously
+    fast_results = simulate_compressors()
+    Compressor = bst.units.compressor.Compressor
+    try:
+        Compressor.fast_isentropic_path = False
+        rigorous_results = simulate_compressors()
+    finally:
+        Compressor.fast_isentropic_path = True
+    assert_allclose(fast_results, rigorous_results)
+
 
 if __name__ == '__main__':
     test_compressor_design()
@@ -415,4 +496,5 @@ if __name__ == '__main__':
     test_multistage_hydrogen_compressor_simple()
     test_multistage_hydrogen_compressor_advanced()
     test_multistage_setup_does_not_recreate_subcomponents()
-    test_multistage_setup_updates_after_changing_specifications()
\ No newline at end of file
+    test_multistage_setup_updates_after_changing_specifications()
+    test_fast_isentropic_path()
\ No newline at end of file
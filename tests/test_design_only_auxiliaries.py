@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020-2023, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import biosteam as bst
+from numpy.testing import assert_allclose
+
+class FermentationTank(bst.StirredTankReactor):
+    _N_outs = 2
+
+    def _run(self):
+        vent, effluent = self.outs
+        effluent.mix_from(self.ins, energy_balance=False)
+        effluent.imol['Glucose'] *= 0.1
+        effluent.T = vent.T = self.T
+
+def test_stirred_tank_reactor_design_only_auxiliaries():
+    bst.settings.set_thermo(['Water', 'Glucose', 'CO2'], cache=True)
+    try:
+        for batch in (True, False):
+            for T in (290, 310): # Cooling and heating
+                feed = bst.Stream(Water=1e5, Glucose=1e4, units='kg/hr', T=305)
+                R1 = FermentationTank(ins=feed, tau=10, T=T, batch=batch)
+                # Raises error if design-only results differ from full simulation
+                bst.settings.validate_design_only_auxiliaries = True
+                R1.simulate()
+                bst.settings.validate_design_only_auxiliaries = False
+                results = []
+                for design_only in (True, False):
+                    bst.settings.design_only_auxiliaries = design_only
+                    R1.simulate()
+                    results.append(
+                        [R1.purchase_cost, R1.utility_cost,
+                         R1.recirculation_pump.design_results['Flow rate'],
+                         R1.heat_exchanger.design_results['Area']]
+                    )
+                assert_allclose(*results, rtol=1e-9)
+    finally:
+        bst.settings.design_only_auxiliaries = True
+        bst.settings.validate_design_only_auxiliaries = False
+
+def test_pump_design_inputs():
+    bst.settings.set_thermo(['Water'], cache=True)
+    feed = bst.Stream(Water=1e4, units='kg/hr')
+    P1 = bst.Pump(ins=feed, P=5e5)
+    P1.simulate()
+    design_results = P1.design_results.copy()
+    purchase_cost = P1.purchase_cost
+    P1.outs[0].empty() # Outlet is not used
+    P1.simulate_as_auxiliary_pump()
+    assert P1.design_results == design_results
+    assert_allclose(P1.purchase_cost, purchase_cost)
+
+    # Design inputs can be given directly
+    P1.simulate_as_auxiliary_pump(F_vol=2 * feed.F_vol, F_mass=2 * feed.F_mass)
+    assert_allclose(P1.design_results['Flow rate'], 2 * design_results['Flow rate'])
+
+if __name__ == '__main__':
+    test_stirred_tank_reactor_design_only_auxiliaries()
+    test_pump_design_inputs()
@@ -0,0 +1,504 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020-2024, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+Dynamic simulation tests with minimal dynamic unit operations that follow
+the same protocol as QSDsan (states are concentrations [kmol/m3] and flow
+rate [m3/hr]).
+"""
+import pytest
+import biosteam as bst
+import numpy as np
+from numpy.testing import assert_allclose
+from biosteam._system import group_columns
+
+class DynamicStream(bst.Stream):
+
+    def _init_state(self):
+        Q = self.F_vol
+        C = self.mol.to_array() / Q if Q else np.zeros(self.chemicals.size)
+        self.state = np.append(C, Q)
+        self.dstate = np.zeros_like(self.state)
+
+    def _state2flows(self):
+        self.mol[:] = self.state[:-1] * self.state[-1]
+
+    def reset_cache(self):
+        super().reset_cache()
+        # States are reinitialized from flow rates when loaded
+        self.state = np.zeros(self.chemicals.size + 1)
+        self.dstate = np.zeros(self.chemicals.size + 1)
+
+
+class DynamicUnit(bst.Unit, isabstract=True):
+
+    def _init_dynamic(self):
+        self._state = None
+        self._dstate = None
+        self._ODE = None
+        self._AE = None
+
+    def reset_cache(self, isdynamic=None):
+        super().reset_cache(isdynamic)
+        self._init_dynamic()
+
+    @property
+    def _state_header(self):
+        return [f'{i} [kmol/m3]' for i in self.chemicals.IDs] + ['Q [m3/hr]']
+
+    @property
+    def scope(self):
+        if not hasattr(self, '_scope'): 
+            header = [(self.ID, i) for i in self._state_header]
+            self._scope = bst.utils.Scope(self, ['_state'], header)
+        return self._scope
+
+    @property
+    def hasode(self):
+        return hasattr(self, '_compile_ODE')
+
+    @property
+    def _ins_QC(self):
+        return np.array([i.state for i in self.ins])
+
+    @property
+    def _ins_dQC(self):
+        return np.array([i.dstate for i in self.ins])
+
+    @property
+    def ODE(self):
+        if self._ODE is None: self._compile_ODE()
+        return self._ODE
+
+    @property
+    def AE(self):
+        if self._AE is None: self._compile_AE()
+        return self._AE
+
+    def _update_dstate(self):
+        for i in self.outs: i.dstate = self._dstate.copy()
+
+
+class Mixer(DynamicUnit):
+    _N_outs = 1
+    _ins_size_is_fixed = False
+
+    def _run(self):
+        self.outs[0].mix_from(self.ins)
+
+    def _init_state(self):
+        QC = self._ins_QC
+        Q = QC[:, -1]
+        self._state = np.append(Q @ QC[:, :-1] / Q.sum(), Q.sum())
+        self._dstate = self._state * 0.
+
+    def _update_state(self):
+        self.outs[0].state = self._state.copy()
+
+    def _compile_AE(self):
+        _state = self._state
+        _dstate = self._dstate
+        def yt(t, QC_ins, dQC_ins):
+            Q_ins = QC_ins[:, -1]
+            dQ_ins = dQC_ins[:, -1]
+            C_ins = QC_ins[:, :-1]
+            Q = Q_ins.sum()
+            C = Q_ins @ C_ins / Q
+            _state[-1] = Q
+            _state[:-1] = C
+            dQ = dQ_ins.sum()
+            _dstate[-1] = dQ
+            _dstate[:-1] = (dQ_ins @ C_ins + Q_ins @ dQC_ins[:, :-1] - dQ * C) / Q
+            self._update_state()
+            self._update_dstate()
+        self._AE = yt
+
+    def _compile_kernel(self):
+        def rhs(t, QC, dQC, X, dX, ins, outs, p):
+            Q_ins = X[ins, -1]
+            dQ_ins = dX[ins, -1]
+            C_ins = X[ins, :-1]
+            Q = Q_ins.sum()
+            C = Q_ins @ C_ins / Q
+            dQ = dQ_ins.sum()
+            out = outs[0]
+            X[out, :-1] = C
+            X[out, -1] = Q
+            dX[out, :-1] = (dQ_ins @ C_ins + Q_ins @ dX[ins, :-1] - dQ * C) / Q
+            dX[out, -1] = dQ
+        return None, rhs, ()
+
+
+class Splitter(DynamicUnit):
+    _N_ins = 1
+    _N_outs = 2
+
+    def _init(self, split):
+        self.split = split
+
+    def _run(self):
+        feed, = self.ins
+        top, bottom = self.outs
+        top.copy_like(feed)
+        top.mol[:] *= self.split
+        bottom.copy_like(feed)
+        bottom.mol[:] -= top.mol
+
+    def _init_state(self):
+        self._state = self._ins_QC[0].copy()
+        self._dstate = self._state * 0.
+
+    def _update_state(self):
+        for i, split in zip(self.outs, (self.split, 1 - self.split)):
+            i.state = self._state.copy()
+            i.state[-1] *= split
+
+    def _update_dstate(self):
+        for i, split in zip(self.outs, (self.split, 1 - self.split)):
+            i.dstate = self._dstate.copy()
+            i.dstate[-1] *= split
+
+    def _compile_AE(self):
+        _state = self._state
+        _dstate = self._dstate
+        def yt(t, QC_ins, dQC_ins):
+            _state[:] = QC_ins[0]
+            _dstate[:] = dQC_ins[0]
+            self._update_state()
+            self._update_dstate()
+        self._AE = yt
+
+    def _compile_kernel(self):
+        def rhs(t, QC, dQC, X, dX, ins, outs, p):
+            split = p[0]
+            inlet = ins[0]
+            top, bottom = outs
+            X[top] = X[inlet]
+            X[bottom] = X[inlet]
+            X[top, -1] *= split
+            X[bottom, -1] *= 1 - split
+            dX[top] = dX[inlet]
+            dX[bottom] = dX[inlet]
+            dX[top, -1] *= split
+            dX[bottom, -1] *= 1 - split
+        return None, rhs, (self.split,)
+
+
+class CSTR(DynamicUnit):
+    """Continuous stirred tank reactor with first-order reaction A -> B."""
+    _N_ins = 1
+    _N_outs = 1
+    
+    #: Number of ODE evaluations (for counting right-hand side evaluations).
+    evaluations = 0
+
+    def _init(self, V, k):
+        self.V = V
+        self.k = k
+
+    def _run(self):
+        self.outs[0].copy_like(self.ins[0])
+
+    def _init_state(self):
+        self._state = self._ins_QC[0].copy()
+        self._dstate = self._state * 0.
+
+    def _update_state(self):
+        self.outs[0].state = self._state.copy()
+
+    def _compile_ODE(self):
+        _dstate = self._dstate
+        V = self.V
+        k = self.k
+        def dy_dt(t, QC_ins, QC, dQC_ins):
+            CSTR.evaluations += 1
+            Q = QC_ins[0, -1]
+            C = QC[:-1]
+            _dstate[:-1] = Q / V * (QC_ins[0, :-1] - C)
+            r = k * C[0]
+            _dstate[0] -= r
+            _dstate[1] += r
+            _dstate[-1] = 0.
+            self._update_dstate()
+        self._ODE = dy_dt
+
+    def _compile_kernel(self):
+        def state(QC, X, outs, p):
+            X[outs[0]] = QC
+
+        def rhs(t, QC, dQC, X, dX, ins, outs, p):
+            V, k = p
+            inlet = ins[0]
+            Q = X[inlet, -1]
+            dQC[:-1] = Q / V * (X[inlet, :-1] - QC[:-1])
+            r = k * QC[0]
+            dQC[0] -= r
+            dQC[1] += r
+            dQC[-1] = 0.
+            dX[outs[0]] = dQC
+        return state, rhs, (self.V, self.k)
+
+
+class AnalyticCSTR(CSTR):
+
+    def _compile_jacobian(self):
+        V = self.V
+        k = self.k
+        def jacobian(t, QC_ins, QC, dQC_ins):
+            Q = QC_ins[0, -1]
+            J = np.zeros([QC.size, QC.size])
+            J[0, 0] = -Q / V - k
+            J[1, 1] = -Q / V
+            J[1, 0] = k
+            return J
+        self._jacobian = jacobian
+
+
+def create_system(reactor=CSTR):
+    bst.main_flowsheet.clear()
+    bst.settings.set_thermo(['Water', 'Ethanol'], cache=True)
+    feed = DynamicStream('feed', Water=50, Ethanol=1)
+    recycle = DynamicStream('recycle')
+    product = DynamicStream('product')
+    M1 = Mixer('M1', ins=(feed, recycle), outs=DynamicStream())
+    reactors = []
+    inlet = M1-0
+    for i, (V, k) in enumerate([(2, 0.5), (3, 0.2), (1, 1.), (2, 0.1), (1, 0.3), (3, 0.4)], 1):
+        R = reactor(f'R{i}', ins=inlet, outs=DynamicStream(), V=V, k=k)
+        inlet = R-0
+        reactors.append(R)
+    S1 = Splitter('S1', ins=inlet, outs=(recycle, product), split=0.5)
+    # Algebraic units are evaluated first so that their states are consistent 
+    # with the states of all units with ODEs
+    units = (S1, M1, *reactors)
+    for i in units: 
+        i._isdynamic = True
+        i._init_dynamic()
+    sys = bst.System('sys', path=units, recycle=inlet)
+    for i in sys.streams: i._init_state()
+    return sys
+
+def test_jacobian_sparsity():
+    sys = create_system()
+    sys.simulate(t_span=(0, 1))
+    sparsity = sys._get_jacobian_sparsity().toarray()
+    idx = sys._state_idx
+    expected = np.zeros_like(sparsity)
+    for i in range(1, 7):
+        rows = slice(*idx[f'R{i}'])
+        for j in (i, (i - 2) % 6 + 1): expected[rows, slice(*idx[f'R{j}'])] = True
+    assert (sparsity == expected).all()
+
+    # Finite difference Jacobian is within the structural sparsity pattern
+    y = sys._state.copy()
+    f0 = sys.DAE(1, y)
+    for j in range(y.size):
+        y_perturbed = y.copy()
+        y_perturbed[j] += 1e-6
+        nonzero = np.abs(sys.DAE(1, y_perturbed) - f0) > 0
+        assert not (nonzero & ~sparsity[:, j]).any()
+
+    # Fewer evaluations are needed to estimate the Jacobian
+    sys = create_system()
+    CSTR.evaluations = 0
+    sys.simulate(t_span=(0, 20), method='BDF', structural_sparsity=True)
+    sparse_evaluations = CSTR.evaluations
+    sparse_state = sys._state.copy()
+    sys = create_system()
+    CSTR.evaluations = 0
+    sys.simulate(t_span=(0, 20), method='BDF') # Sparsity is opt-in
+    dense_evaluations = CSTR.evaluations
+    assert_allclose(sparse_state, sys._state, rtol=1e-3)
+    assert sparse_evaluations < dense_evaluations
+
+def test_analytic_jacobian():
+    sys = create_system(AnalyticCSTR)
+    sys.simulate(t_span=(0, 1))
+    jacobian = sys._compile_jacobian()
+    y = sys._state.copy()
+    J = jacobian(1, y).toarray()
+    f0 = sys.DAE(1, y)
+    J_numerical = np.zeros_like(J)
+    for j in range(y.size):
+        y_perturbed = y.copy()
+        y_perturbed[j] += 1e-6
+        J_numerical[:, j] = (sys.DAE(1, y_perturbed) - f0) / 1e-6
+    assert_allclose(J, J_numerical, atol=1e-5)
+
+    # Analytic blocks reduce the number of perturbed evaluations
+    evaluations = []
+    def DAE(t, y):
+        evaluations.append(t)
+        return sys.DAE(t, y)
+    J = sys._compile_jacobian(DAE)(1, y).toarray()
+    assert_allclose(J, J_numerical, atol=1e-5)
+    sparsity = sys._get_jacobian_structure()[2]
+    full_groups = group_columns(sparsity).max() + 1
+    perturbed_evaluations = len(evaluations) - 2 # Excluding initial evaluation and reset
+    assert perturbed_evaluations < full_groups
+
+    sys = create_system(AnalyticCSTR)
+    sys.simulate(t_span=(0, 20), method='BDF', structural_sparsity=True)
+    analytic_state = sys._state.copy()
+    sys = create_system()
+    sys.simulate(t_span=(0, 20), method='BDF')
+    assert_allclose(analytic_state, sys._state, rtol=1e-3)
+
+def test_tracking_at_accepted_steps():
+    sys = create_system()
+    R1 = sys.flowsheet.unit.R1
+    sys.set_dynamic_tracker(R1)
+    CSTR.evaluations = 0
+    sys.simulate(t_span=(0, 20), method='BDF')
+    sol = sys.scope.sol
+    ts = R1.scope.time_series
+    # Data is only recorded at accepted steps, not at every ODE evaluation
+    assert_allclose(ts, sol.t)
+    assert (np.diff(ts) > 0).all()
+    assert len(ts) < CSTR.evaluations / 6
+    start, stop = sys._state_idx['R1']
+    assert_allclose(R1.scope.record, sol.y[start:stop].T)
+    # System is left at the final state
+    assert_allclose(sys._state, sol.y[:, -1])
+    
+    sys = create_system()
+    R1 = sys.flowsheet.unit.R1
+    sys.set_dynamic_tracker(R1)
+    t_eval = np.linspace(0, 20, 11)
+    sys.simulate(t_span=(0, 20), t_eval=t_eval, method='BDF')
+    sol = sys.scope.sol
+    assert_allclose(R1.scope.time_series, t_eval)
+    assert_allclose(R1.scope.record, sol.sol(t_eval)[start:stop].T)
+    df = sys.scope.export(t_eval=t_eval)
+    assert df.shape == (11, 4)
+
+def test_compiled_system_DAE():
+    sys = create_system()
+    sys.simulate(t_span=(0, 1))
+    fun = sys._compile_kernel_DAE()
+    y = sys._state.copy()
+    assert_allclose(fun(1, y), sys.DAE(1, y))
+    y *= 1.1
+    assert_allclose(fun(1, y), sys.DAE(1, y))
+    
+    sys = create_system()
+    sys.simulate(t_span=(0, 20), method='BDF', compiled=True)
+    compiled_state = sys._state.copy()
+    sys = create_system()
+    sys.simulate(t_span=(0, 20), method='BDF')
+    assert_allclose(compiled_state, sys._state, rtol=1e-4)
+    
+    class UncompiledCSTR(CSTR): _compile_kernel = None
+    sys = create_system(UncompiledCSTR)
+    assert sys._compile_kernel_DAE() is None
+    with pytest.warns(RuntimeWarning):
+        sys.simulate(t_span=(0, 1), compiled=True)
+
+def test_dynamic_events():
+    # Integration stops at steady state
+    sys = create_system()
+    sys.simulate(t_span=(0, 1e4), method='BDF', steady_state=True, 
+                 steady_state_rtol=1e-6, steady_state_window=10)
+    sol = sys.scope.sol
+    assert sol.status == 1
+    t_steady = sol.t[-1]
+    assert t_steady < 1e3
+    dy = sys.DAE(t_steady, sys._state)
+    assert (np.abs(dy / (np.abs(sys._state) + 1e-9)) < 1e-6).all()
+    steady_state = sys._state.copy()
+    sys = create_system()
+    sys.simulate(t_span=(0, 1e4), method='BDF')
+    assert_allclose(steady_state, sys._state, rtol=1e-4)
+    
+    # Integration stops when the ethanol concentration in R1 reaches 20 kmol/m3
+    sys = create_system()
+    R1 = sys.flowsheet.unit.R1
+    @sys.add_event(unit=R1, direction=1)
+    def ethanol_limit(t, QC): return QC[1] - 20
+    sys.simulate(t_span=(0, 100), method='RK45', rtol=1e-8)
+    sol = sys.scope.sol
+    assert sol.status == 1
+    t_event, = sol.t_events[0]
+    assert sol.t[-1] == t_event
+    assert_allclose(R1._state[1], 20)
+    with pytest.raises(ValueError):
+        sys.add_event(ethanol_limit, unit=sys.flowsheet.unit.M1)
+    
+    # Steady-state simulation starts from the final dynamic state
+    sys = create_system()
+    feed = sys.flowsheet.stream.feed
+    product = sys.flowsheet.stream.product
+    sys.simulate(t_span=(0, 10))
+    assert product.imol['Ethanol'] > 2 * feed.imol['Ethanol'] 
+    sys = create_system()
+    feed = sys.flowsheet.stream.feed
+    product = sys.flowsheet.stream.product
+    sys.simulate(t_span=(0, 10), converge_steady_state=True)
+    assert_allclose(product.mol, feed.mol, rtol=1e-2)
+
+def test_dynamic_ensemble():
+    sys = create_system()
+    R1 = sys.flowsheet.unit.R1
+    product = sys.flowsheet.stream.product
+    sys.set_dynamic_tracker(R1)
+    model = bst.Model(sys)
+    
+    @model.parameter(element=R1, bounds=(0.1, 1), baseline=0.5)
+    def set_rate_constant(k):
+        if k > 1: raise ValueError('rate constant out of bounds')
+        R1.k = k
+    
+    @model.indicator
+    def ethanol(): return product.imol['Ethanol']
+    
+    rate_constants = [0.2, 0.5, 2, 0.8]
+    model.load_samples(np.array([rate_constants]).T)
+    t_eval = np.linspace(0, 10, 11)
+    ensemble = model.evaluate_ensemble(t_eval, t_span=(0, 10), method='BDF')
+    assert ensemble.data.shape == (4, 11, 3)
+    assert list(ensemble.failed) == [2]
+    assert ensemble.status['status'][2] == 'error'
+    assert np.isnan(ensemble.data[2]).all()
+    ethanol = model.table.values[:, -1]
+    assert np.isnan(ethanol[2])
+    
+    # Members match independent simulations
+    for i in (0, 3):
+        other_sys = create_system()
+        other_R1 = other_sys.flowsheet.unit.R1
+        other_R1.k = rate_constants[i]
+        other_sys.set_dynamic_tracker(other_R1)
+        other_sys.simulate(t_span=(0, 10), t_eval=t_eval, method='BDF')
+        # Initial conditions are converged to within the tolerance of the system
+        assert_allclose(ensemble.data[i], other_R1.scope.record, rtol=0.02)
+        assert_allclose(ethanol[i], other_sys.flowsheet.stream.product.imol['Ethanol'], rtol=0.02)
+    
+    # Forked workers write to a shared array
+    parallel_ensemble = model.evaluate_ensemble(t_eval, pool=2, t_span=(0, 10), method='BDF')
+    assert_allclose(parallel_ensemble.data, ensemble.data, rtol=0.02)
+    assert (parallel_ensemble.status['status'] == ensemble.status['status']).all()
+    
+    # Members whose indicators fail are reported as failed
+    @model.indicator
+    def ethanol_per_rate_constant(): 
+        if R1.k > 0.6: raise RuntimeError('indicator failed')
+        return product.imol['Ethanol'] / R1.k
+    
+    ensemble = model.evaluate_ensemble(t_eval, t_span=(0, 10), method='BDF')
+    assert list(ensemble.failed) == [2, 3]
+    assert ensemble.status['status'][3] == 'error'
+    assert 'indicator failed' in ensemble.status['message'][3]
+    assert np.isnan(model.table.values[2:, -2:]).all()
+    assert not np.isnan(model.table.values[:2, -2:]).any()
+
+if __name__ == '__main__':
+    test_jacobian_sparsity()
+    test_analytic_jacobian()
+    test_tracking_at_accepted_steps()
+    test_compiled_system_DAE()
+    test_dynamic_events()
+    test_dynamic_ensemble()
@@ -339,6 +339,89 @@ def test_kolmogorov_smirnov_d():
     D, p = model.kolmogorov_smirnov_d(thresholds=[1, 1.5]) # Just make sure it works for now
     # TODO: Add tests that make sense for comparing statistics
     
+def test_parallel_evaluation():
+    import biosteam as bst
+    from chaospy import distributions as shape
+    bst.settings.set_thermo(['Water', 'Ethanol'], cache=True)
+    feed = bst.Stream('feed', Water=100, Ethanol=10)
+    H1 = bst.HXutility('H1', ins=feed, T=320)
+    M1 = bst.MixTank('M1', ins=H1-0)
+    sys = bst.System.from_units('sys', [H1, M1])
+    model = bst.Model(sys)
+    
+    @model.parameter(element=H1, distribution=shape.Uniform(310, 340), 
+                     units='K', baseline=320, coupled=True)
+    def set_temperature(T):
+        H1.T = T
+    
+    @model.parameter(element=M1, distribution=shape.Uniform(0.5, 2), 
+                     units='hr', baseline=1, coupled=True)
+    def set_tau(tau):
+        M1.tau = tau
+    
+    @model.indicator(units='USD')
+    def purchase_cost(): return sys.purchase_cost
+    
+    @model.indicator(units='kJ/hr')
+    def heating_duty(): return H1.duty
+    
+    baseline, lb, ub = model.single_point_sensitivity(array=True)
+    parallel_baseline, parallel_lb, parallel_ub = model.single_point_sensitivity(array=True, pool=2)
+    assert_allclose(baseline, parallel_baseline)
+    assert_allclose(lb, parallel_lb)
+    assert_allclose(ub, parallel_ub)
+    
+    np.random.seed(0)
+    model.load_samples(model.sample(6, 'L'))
+    coordinate = np.linspace(0.5, 1.5, 4)
+    def set_feed_flow(x): feed.F_mass = 1000 * x
+    for independent in (False, True):
+        data = model.evaluate_across_coordinate(
+            'Feed flow', set_feed_flow, coordinate, notify_coordinate=False,
+            simulation_independent_coordinate=independent,
+        )
+        parallel_data = model.evaluate_across_coordinate(
+            'Feed flow', set_feed_flow, coordinate, notify_coordinate=False,
+            simulation_independent_coordinate=independent, pool=3,
+        )
+        assert data.keys() == parallel_data.keys()
+        for key in data: assert_allclose(data[key], parallel_data[key], rtol=1e-3)
+    bst.default()
+    
+def test_grid_evaluation():
+    import multiprocessing as mp
+    from biosteam.evaluation.evaluation_tools import evaluate_on_grid, serpentine_order
+    points = serpentine_order([(i, j) for i in range(3) for j in range(2)])
+    assert points == [(0, 0), (1, 0), (2, 0), (2, 1), (1, 1), (0, 1)]
+    
+    evaluated = []
+    def f(x, y):
+        evaluated.append((x, y))
+        if x + y > 1.5: return np.nan, np.nan # Infeasible region
+        return x * y, x + y
+    
+    x = np.linspace(0, 1, 33)
+    y = np.linspace(0, 1, 33)
+    X, Y = np.meshgrid(x, y)
+    Z = evaluate_on_grid(f, x, y)
+    assert Z.shape == (33, 33, 2)
+    assert len(evaluated) == X.size
+    assert_allclose(Z[..., 0], np.where(X + Y > 1.5, np.nan, X * Y))
+    
+    # Adaptive refinement only evaluates a fraction of the grid points,
+    # focusing on the boundaries of the infeasible region
+    evaluated.clear()
+    Z_adaptive = evaluate_on_grid(f, x, y, adaptive=True, rtol=0.1)
+    assert len(evaluated) < 0.6 * X.size
+    assert len(set(evaluated)) == len(evaluated)
+    assert (np.isnan(Z_adaptive) == np.isnan(Z)).all()
+    assert_allclose(Z_adaptive, Z, atol=0.02)
+    
+    # Parallel evaluation gives the same results
+    if 'fork' in mp.get_all_start_methods():
+        Z_parallel = evaluate_on_grid(f, x, y, pool=2, adaptive=True, rtol=0.1)
+        assert_allclose(Z_parallel, Z_adaptive)
+    
 if __name__ == '__main__':
     test_parameter_hook()
     test_pearson_r()
@@ -349,4 +432,6 @@ if __name__ == '__main__':
     test_copy()
     test_model_exception_hook()
     test_parameters_from_df()
-    test_kolmogorov_smirnov_d()
\ No newline at end of file
+    test_kolmogorov_smirnov_d()
+    test_parallel_evaluation()
+    test_grid_evaluation()
\ No newline at end of file
@@ -65,7 +65,116 @@ def test_boiler_turbogenerator():
     assert_allclose(sys.power_utility.production, 0., atol=1e-6)
     assert sys.power_utility.consumption > 0
 
+def test_boiler_turbogenerator_fuel_balance(monkeypatch):
+    chemicals = cane.create_sugarcane_chemicals()
+    chemicals.define_group(
+        name='Fiber',
+        IDs=['Cellulose', 'Hemicellulose', 'Lignin'],
+        composition=[0.4704 , 0.2775, 0.2520],
+        wt=True, # Composition is given as weight
+    )
+    bst.settings.set_thermo(chemicals)
+    dilute_ethanol = bst.Stream('dilute_ethanol', Water=1390, Ethanol=590)
+    bagasse = bst.Stream('bagasse', Water=0.4, Fiber=0.6, total_flow=5e3, units='kg/hr')
+    with bst.System('sys') as sys:
+        D1 = bst.BinaryDistillation('D1', ins=dilute_ethanol, Lr=0.999, Hr=0.89, k=1.25, LHK=('Ethanol', 'Water'))
+        BT = bst.BoilerTurbogenerator('BT')
+        BT.ins[0] = bagasse
+    
+    # Count calls to the iterative solver within the boiler only
+    from types import SimpleNamespace
+    import flexsolve as flx
+    iterations = []
+    def IQ_interpolation(*args, **kwargs):
+        iterations.append(args)
+        return flx.IQ_interpolation(*args, **kwargs)
+    monkeypatch.setattr(
+        bst.facilities._boiler_turbogenerator, 'flx', 
+        SimpleNamespace(IQ_interpolation=IQ_interpolation)
+    )
+    for BT.satisfy_system_electricity_demand in (False, True):
+        # Natural gas makeup is solved in closed form
+        iterations.clear()
+        BT.closed_form_fuel_balance = True
+        sys.simulate()
+        assert not iterations
+        assert not BT.natural_gas.isempty()
+        closed_form = (BT.natural_gas.F_mol, BT.design_results['Work'], sys.power_utility.rate)
+        
+        # Fallback solves natural gas makeup iteratively
+        BT.closed_form_fuel_balance = False
+        sys.simulate()
+        assert iterations
+        iterative = (BT.natural_gas.F_mol, BT.design_results['Work'], sys.power_utility.rate)
+        assert_allclose(closed_form, iterative, rtol=1e-3, atol=1)
+        assert_allclose(
+            -BT.results().loc['Low pressure steam', 'Duty']['BT'],
+            D1.results().loc['Low pressure steam', 'Duty']['D1'],
+        )
+    assert_allclose(closed_form[-1], 0., atol=1e-6) # Electricity demand is satisfied
+
+def test_heat_exchanger_network_targeting():
+    from biosteam.facilities.hxn.hxn_synthesis import temperature_interval_pinch_analysis
+    bst.settings.set_thermo(['Water', 'Methanol', 'Glycerol'], cache=True)
+    feed1 = bst.Stream('feed1', flow=(8000, 100, 25))
+    feed2 = bst.Stream('feed2', flow=(10000, 1000, 10))
+    D1 = bst.ShortcutColumn('D1', ins=feed1,
+                            outs=('distillate', 'bottoms_product'),
+                            LHK=('Methanol', 'Water'),
+                            y_top=0.99, x_bot=0.01, k=2,
+                            is_divided=True)
+    D1_H1 = bst.HXutility('D1_H1', ins=D1.outs[1], T=300)
+    D1_H2 = bst.HXutility('D1_H2', ins=D1.outs[0], T=300)
+    F1 = bst.Flash('F1', ins=feed2, outs=('vapor', 'liquid'), V=0.9, P=101325)
+    HXN = bst.HeatExchangerNetwork('HXN', T_min_app=5.)
+    sys = bst.System.from_units('sys', units=[D1, D1_H1, D1_H2, F1, HXN])
+    sys.simulate()
+    heat_util_load = HXN.actual_heat_util_load
+    cool_util_load = HXN.actual_cool_util_load
+    installed_cost = HXN.installed_cost
+    
+    # Targets should be consistent with full synthesis
+    HXN.targeting = True
+    HXN.simulate()
+    assert HXN.new_HXs # Synthesized units are not replaced
+    assert HXN.actual_heat_util_load <= heat_util_load * (1 + 1e-6)
+    assert HXN.actual_cool_util_load <= cool_util_load * (1 + 1e-6)
+    assert_allclose(HXN.actual_heat_util_load, heat_util_load, rtol=0.01)
+    assert_allclose(HXN.actual_cool_util_load, cool_util_load, rtol=0.02)
+    assert_allclose(HXN.installed_cost, installed_cost, rtol=0.25)
+    assert HXN.target_area > 0
+    
+    # Targets are consistent with the temperature interval pinch analysis 
+    # used for synthesis
+    hus = HXN._get_original_heat_utilties()
+    pinch_analysis = temperature_interval_pinch_analysis(hus, HXN.T_min_app)
+    cool_util_load = pinch_analysis[2]
+    hus_cooling = [hu for hu in hus if hu.duty < 0]
+    original_cool_util_load = sum([abs(hu.duty) for hu in hus_cooling])
+    assert_allclose(
+        HXN.actual_cool_util_load / HXN.original_cool_util_load,
+        cool_util_load / original_cool_util_load,
+        rtol=0.01,
+    )
+    
+    # Utility savings are reported as negative utilities
+    heat_utilities = HXN.heat_utilities
+    assert all([hu.flow < 0 for hu in heat_utilities])
+    assert_allclose(
+        sum([hu.duty for hu in heat_utilities if hu.duty < 0]),
+        HXN.actual_heat_util_load - HXN.original_heat_util_load,
+    )
+    
+    # Profiles are cached until stream states change
+    profiles = {hx: profile for hx, (*_, profile) in HXN._enthalpy_profiles.items()}
+    HXN.simulate()
+    assert all([profiles[hx] is profile for hx, (*_, profile) in HXN._enthalpy_profiles.items()])
+    feed2.F_mol *= 2
+    sys.simulate()
+    assert any([profiles[hx] is not profile for hx, (*_, profile) in HXN._enthalpy_profiles.items()])
+
     
 if __name__ == '__main__':
     test_facility_inheritance()
-    test_boiler_turbogenerator()
\ No newline at end of file
+    test_boiler_turbogenerator()
+    test_heat_exchanger_network_targeting()
\ No newline at end of file
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020-2023, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import biosteam as bst
+from numpy.testing import assert_allclose
+
+def create_system_with_product_heater():
+    feed = bst.Stream(Water=100, Ethanol=20, T=300)
+    recycle = bst.Stream()
+    M1 = bst.Mixer(ins=[feed, recycle])
+    F1 = bst.Flash(ins=M1-0, V=0.5, P=101325)
+    H1 = bst.HXutility(ins=F1-0, T=360, rigorous=True)
+    S1 = bst.Splitter(ins=F1-1, outs=[recycle, ''], split=0.5)
+    sys = bst.System(None, path=[M1, F1, H1, S1], recycle=recycle)
+    sys.relative_molar_tolerance = 1e-6
+    return sys, H1
+
+def test_deferred_utility_flashes():
+    bst.settings.set_thermo(['Water', 'Ethanol'], cache=True)
+    scheduler = bst.flash_scheduler
+    results = []
+    try:
+        for defer in (False, True):
+            bst.settings.defer_utility_flashes = defer
+            scheduler.reset()
+            sys, H1 = create_system_with_product_heater()
+            sys.simulate()
+            product = H1.outs[0]
+            results.append(
+                [product.vapor_fraction, product.H, H1.Hnet,
+                 H1.design_results['Area']]
+            )
+            assert not scheduler.requests
+            if defer:
+                assert sys._iter > 1
+                assert scheduler.saved > 0
+            else:
+                assert scheduler.deferred == 0
+        assert_allclose(*results, rtol=1e-9)
+        assert 0 < results[0][0] < 1 # Product is partially condensed
+    finally:
+        bst.settings.defer_utility_flashes = False
+        scheduler.reset()
+
+if __name__ == '__main__':
+    test_deferred_utility_flashes()
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020-2023, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import biosteam as bst
+from numpy.testing import assert_allclose
+
+def create_fluidized_catalytic_cracking():
+    catalyst = bst.Chemical(
+        'Catalyst', search_db=False, default=True, phase='s',
+        MW=60.08, Cn=44.4, rho=2200,
+    )
+    octene = bst.Chemical('Octene', search_ID='1-Octene')
+    bst.settings.set_thermo(['Water', 'O2', 'N2', 'CO2', 'Hexadecane', 'Octane', octene, catalyst])
+    feed = bst.Stream(Hexadecane=100, units='kmol/hr', T=298.15)
+    reaction = bst.Rxn('Hexadecane -> Octane + Octene', reactant='Hexadecane', X=0.9)
+    return bst.FluidizedCatalyticCracking(
+        ins=[feed, 'catalyst', 'air', 'steam'], reaction=reaction
+    )
+
+def test_fcc_energy_balance():
+    FCC = create_fluidized_catalytic_cracking()
+    FCC.simulate()
+    product, discarded_catalyst, flue_gas = FCC.outs
+    regenerated_catalyst = FCC._regenerated_catalyst
+    spent_catalyst = FCC._spent_catalyst
+    regenerator_inlets = [FCC.air_compressor-0, FCC.makeup_catalyst, spent_catalyst]
+    regenerator_outlets = [flue_gas, regenerated_catalyst, discarded_catalyst]
+    reactor_inlets = [FCC.feed_preheater-0, FCC.steam, regenerated_catalyst]
+    reactor_outlets = [product, spent_catalyst]
+    for inlets, outlets in [(regenerator_inlets, regenerator_outlets),
+                            (reactor_inlets, reactor_outlets)]:
+        H_in = sum([i.Hnet for i in inlets])
+        H_out = sum([i.Hnet for i in outlets])
+        assert_allclose(H_in, H_out, rtol=1e-8)
+    T_reactor = product.T
+    T_regenerator = flue_gas.T
+    assert T_regenerator > T_reactor
+
+    # Warm started solution is the same as the cold solution
+    FCC.reaction.X = 0.85
+    FCC.simulate()
+    T_reactor_warm = product.T
+    FCC.reset_cache()
+    FCC.simulate()
+    assert_allclose(product.T, T_reactor_warm, atol=1e-3)
+    FCC.reaction.X = 0.9
+    FCC.simulate()
+    assert_allclose(product.T, T_reactor, atol=1e-3)
+    assert_allclose(flue_gas.T, T_regenerator, atol=1e-3)
+
+if __name__ == '__main__':
+    test_fcc_energy_balance()
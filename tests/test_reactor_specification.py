@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020-2023, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import biosteam as bst
+import thermosteam as tmo
+import flexsolve as flx
+import numpy as np
+from numpy.testing import assert_allclose
+
+class Fermentation(bst.Unit):
+    _N_ins = 1
+    _N_outs = 2
+
+    def _init(self):
+        self.reaction = tmo.Reaction('Glucose -> 2Ethanol + 2CO2', 'Glucose', 0.9)
+        self.N_runs = 0
+
+    def _run(self):
+        self.N_runs += 1
+        vent, effluent = self.outs
+        effluent.mix_from(self.ins)
+        self.reaction(effluent)
+        vent.phase = 'g'
+        vent.imol['CO2'] = effluent.imol['CO2']
+        effluent.imol['CO2'] = 0.
+
+def create_reactor_specification():
+    bst.settings.set_thermo(['Water', 'Glucose', 'Ethanol', 'CO2'], cache=True)
+    feed = bst.Stream('feed', Water=1000, Glucose=100, units='kg/hr')
+    R1 = Fermentation('R1', ins=feed)
+    return bst.process_tools.ReactorSpecification(
+        R1, 'reaction', ('Glucose',), ('Ethanol',), 0.9, 50., 1., 100.
+    )
+
+def test_closed_form_titer():
+    spec = create_reactor_specification()
+    R1 = spec.reactor
+    spec.load_titer(80.)
+    assert R1.N_runs == 3 # Two to fit the model and one to verify
+    assert_allclose(spec._calculate_titer(), 80., atol=1e-5)
+    assert_allclose(R1.tau, 80.)
+    substrates = spec.feed.imass['Glucose']
+
+    # Closed-form solution agrees with iterative solution
+    spec.feed.imass['Glucose'] = 100.
+    flx.aitken_secant(spec._titer_objective_function, 100., ytol=1e-8)
+    assert_allclose(spec.feed.imass['Glucose'], substrates, rtol=1e-6)
+
+    # Model is reused while yield remains unchanged
+    R1.N_runs = 0
+    for titer in (40., 60., 100.):
+        spec.load_titer(titer)
+        assert_allclose(spec._calculate_titer(), titer, atol=1e-5)
+    assert R1.N_runs == 6 # One to verify each titer and one to check it
+    R1.N_runs = 0
+    spec.load_titer(50.)
+    assert R1.N_runs == 1 # Only to verify
+    assert_allclose(spec._calculate_titer(), 50., atol=1e-5)
+
+    # Batched substrate loadings
+    titers = np.array([20., 50., 80., 1e6])
+    substrates = spec.substrate_loadings(titers)
+    assert np.isnan(substrates[-1])
+    for titer, substrate in zip(titers[:-1], substrates[:-1]):
+        spec.feed.imass['Glucose'] = substrate
+        assert_allclose(spec._calculate_titer(), titer, atol=1e-5)
+
+    # Scalar titers return scalar loadings
+    substrate = spec.substrate_loadings(50.)
+    assert isinstance(substrate, float)
+    assert np.isnan(spec.substrate_loadings(1e6))
+    
+    # Querying loadings does not change the flowsheet, even if the model is refitted
+    spec.load_titer(50.)
+    spec._titer_model = None
+    feed = spec.feed.copy()
+    effluent = spec.effluent.copy()
+    assert_allclose(spec.substrate_loadings(50.), spec.feed.imass['Glucose'], rtol=1e-6)
+    assert_allclose(spec.feed.mol, feed.mol)
+    assert_allclose(spec.effluent.mol, effluent.mol)
+
+    # Model is refitted when yield changes
+    spec.load_yield(0.8)
+    spec.load_titer(50.)
+    assert_allclose(spec._calculate_titer(), 50., atol=1e-5)
+
+def test_titer_model_across_TRY():
+    spec = create_reactor_specification()
+    R1 = spec.reactor
+    system = bst.System('sys', path=[R1])
+    titers = np.array([40., 60., 80.])
+    yields = np.array([0.8, 0.9])
+    T, Y = np.meshgrid(titers, yields)
+    metrics = [lambda: spec.effluent.imass['Ethanol'] / spec.effluent.F_vol]
+    R1.N_runs = 0
+    results = spec.evaluate_across_TRY(system, T, Y, metrics, [1.])
+    assert_allclose(results[..., 0, 0], T, atol=1e-5)
+    # Loading production does not invalidate the titer model, so each 
+    # point requires one run to verify the titer and one to simulate the 
+    # system; the model is only fitted (two runs) when the yield changes.
+    assert R1.N_runs == 2 * T.size + 2 * yields.size
+
+if __name__ == '__main__':
+    test_closed_form_titer()
+    test_titer_model_across_TRY()
@@ -87,6 +87,23 @@ def test_stream_table(system):
     assert list(df) == IDs
     assert list(df.index) == index
 
+def test_stream_data_table(system, tmp_path):
+    df = bst.report.stream_data_table(system.streams, T='K', F_mass='kg/hr')
+    assert list(df.index) == ['feed', 'product', 's1']
+    assert list(df) == ['Source', 'Sink', 'Phase', 'T (K)', 'F_mass (kg/hr)', 
+                        'flow (kg/hr)', 'MockChemical']
+    assert_allclose(df['F_mass (kg/hr)'], 1e6)
+    assert_allclose(df['T (K)'], [298.15, 325, 298.15])
+    assert_allclose(df['MockChemical'], 100.)
+    table = bst.report.stream_table(system.streams, T='K', F_mass='kg/hr')
+    for ID in df.index:
+        for name in df: assert table.loc[name, ID] == df.loc[ID, name]
+    file = str(tmp_path / 'streams.csv')
+    bst.report.save_stream_table(system.streams, file, T='K')
+    with open(file) as f: assert f.readline().startswith(',Source,Sink,Phase,T (K)')
+    with pytest.raises(ValueError):
+        bst.report.save_stream_table(system.streams, str(tmp_path / 'streams.txt'))
+
 # TODO: Figure out problem Workbook bug with xlsx writter that appears in CI
 # def test_save_report(system, tea):
 #     assert system.TEA is tea
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020-2023, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import biosteam as bst
+import numpy as np
+from numpy.testing import assert_allclose
+
+def test_steam_mixer_warm_start():
+    bst.settings.set_thermo(['Water', 'Glucose'], cache=True)
+    feed = bst.Stream(None, Water=10, Glucose=10)
+    M1 = bst.SteamMixer(None, ins=[feed, 'steam', 'process_water'], T=431.15, P=557287.5, solids_loading=0.3)
+    glucose = np.linspace(10, 12, 6)
+    warm = []
+    for i in glucose:
+        feed.imol['Glucose'] = i
+        M1.simulate()
+        warm.append(M1.steam.F_mol)
+    memory = bst.utils.get_solver_memory(M1, 'steam')
+    assert memory.solves == 6
+    assert memory.cold_solves == 1
+    assert memory.hit_rate > 0.8
+    assert memory.estimated_evaluations_saved > 0
+    cold = []
+    for i in glucose:
+        feed.imol['Glucose'] = i
+        M1.reset_cache()
+        M1.simulate()
+        cold.append(M1.steam.F_mol)
+    assert memory.cold_solves == 7
+    assert_allclose(warm, cold, rtol=1e-6)
+    report = bst.utils.solver_memory_report([M1])
+    assert report.loc[(M1.ID, 'steam'), 'Solves'] == 12
+
+def test_aerated_bioreactor_warm_start():
+    chemicals = bst.Chemicals(['Water', 'Glucose', 'O2', 'N2', 'CO2'])
+    chemicals.Glucose.at_state('l')
+    bst.settings.set_thermo(chemicals)
+    feed = bst.Stream(Water=1.20e+05, Glucose=2.5e+04, units='kg/hr', T=32+273.15)
+    rxn = bst.Rxn('Glucose + O2 -> H2O + CO2', reactant='Glucose', X=0.5, correct_atomic_balance=True)
+    R1 = bst.AeratedBioreactor(
+        ins=[feed, bst.Stream(phase='g')], tau=12, V_max=500, reactions=rxn,
+        optimize_power=False,
+    )
+    warm = []
+    for i in (0.50, 0.51, 0.52):
+        rxn.X = i
+        R1.simulate()
+        warm.append(R1.air.imol['O2'])
+    memory = bst.utils.get_solver_memory(R1, 'O2')
+    assert memory.solves == 3
+    assert memory.cold_solves == 1
+    cold = []
+    for i in (0.50, 0.51, 0.52):
+        rxn.X = i
+        bst.utils.clear_solver_memory(R1)
+        R1.simulate()
+        cold.append(R1.air.imol['O2'])
+    assert_allclose(warm, cold, rtol=1e-3)
+
+if __name__ == '__main__':
+    test_steam_mixer_warm_start()
+    test_aerated_bioreactor_warm_start()
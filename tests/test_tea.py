@@ -52,7 +52,7 @@ def test_depreciation_schedule():
     with pytest.raises(ValueError):
         tea.depreciation = 'bad'
 
-def test_cashflow_consistency():
+def create_mock_cellulosic_ethanol_tea():
     settings.set_thermo([
         Chemical('Dummy', default=True, phase='s', MW=1, search_db=False)
     ])
@@ -81,6 +81,10 @@ def test_cashflow_consistency():
     sys = System.from_units(units=[unit, osbl])
     sys.simulate()
     tea = create_cellulosic_ethanol_tea(sys, OSBL_units=[osbl])
+    return tea, ethanol
+
+def test_cashflow_consistency():
+    tea, ethanol = create_mock_cellulosic_ethanol_tea()
     table = tea.get_cashflow_table()
     assert_allclose(tea.NPV, 48964863.88462368)
     assert_allclose(tea.NPV, table['Cumulative NPV [MM$]'].iloc[-1]*1e6)
@@ -92,6 +96,70 @@ def test_cashflow_consistency():
     assert_allclose(ethanol.price, 0.6837971746118124)
     assert_allclose(tea.NPV, 0, atol=100)
 
+def test_evaluation_context():
+    tea, ethanol = create_mock_cellulosic_ethanol_tea()
+    sys = tea.system
+    def indicators():
+        return [tea.TDC, tea.FCI, tea.FOC, tea.AOC, tea.NPV, 
+                tea.solve_price(ethanol), *tea.cashflow_array]
+    reference = indicators()
+    with TEA.evaluation_context:
+        assert_allclose(indicators(), reference, rtol=1e-9)
+        cache = tea._get_evaluation_cache()
+        assert 'TDC' in cache and '_cashflow_decomposition' in cache
+        
+        # Breakeven solutions are reused while sales and costs are unchanged
+        solution = cache['solve_sales']
+        tea.solve_price(ethanol)
+        assert cache['solve_sales'] is solution
+        
+        # Price changes are reflected immediately
+        ethanol.price *= 1.1
+        NPV = tea.NPV
+        tea.solve_price(ethanol)
+        assert tea._get_evaluation_cache() is cache
+        
+        # Setting TEA parameters invalidates cached intermediates
+        tea.IRR = 0.12
+        assert tea._get_evaluation_cache() is not cache
+        IRR_NPV = tea.NPV
+        cache = tea._get_evaluation_cache()
+        
+        # Simulation invalidates cached intermediates
+        sys.simulate()
+        assert tea._get_evaluation_cache() is not cache
+    assert tea._get_evaluation_cache() is None
+    assert_allclose(tea.NPV, IRR_NPV, rtol=1e-9)
+    tea.IRR = 0.10
+    assert_allclose(tea.NPV, NPV, rtol=1e-9)
+
+def test_exact_breakeven():
+    tea, ethanol = create_mock_cellulosic_ethanol_tea()
+    class CustomTaxTEA(type(tea)):
+        __slots__ = ()
+        
+        def _fill_tax_and_incentives(self, incentives, taxable_cashflow, nontaxable_cashflow, tax, depreciation):
+            tax[:] = self.income_tax * taxable_cashflow
+            incentives[:] = np.minimum(0.05 * tax, 1e6) # Capped incentives
+    
+    custom_tea = tea.copy()
+    custom_tea.__class__ = CustomTaxTEA
+    try:
+        # Breakeven is exact with default taxes; custom taxes and incentives 
+        # are solved to the same tolerance as the iterative solver
+        for tea, NPV_tolerance in ((tea, 1), (custom_tea, 100)):
+            for price in (0.2, 0.7, 1.5): # Large losses are forwarded at low prices
+                ethanol.price = price
+                TEA.exact_breakeven = False
+                iterative_sales = tea.solve_sales()
+                TEA.exact_breakeven = True
+                sales = tea.solve_sales()
+                assert_allclose(sales, iterative_sales, atol=20)
+                ethanol.price = tea.solve_price(ethanol)
+                assert_allclose(tea.NPV, 0, atol=NPV_tolerance)
+    finally:
+        TEA.exact_breakeven = True
+
 def test_tea():   
     cost = bst.decorators.cost
     # Total installed equipment cost to be $1 MM
@@ -260,4 +328,6 @@ def test_tea():
 if __name__ == '__main__':
     test_depreciation_schedule()
     test_cashflow_consistency()
+    test_evaluation_context()
+    test_exact_breakeven()
     test_tea()
@@ -284,6 +284,99 @@ def test_cost_decorator():
     assert_allclose(A1.purchase_cost, 2 * 10 ** 0.6)
     assert_allclose(A1.installed_cost, 4 * 10 ** 0.6)
     
+def test_cost_items_at_design():
+    from biosteam.units.decorators import cost, cost_items_at_design
+    bst.settings.set_thermo(['Water'], cache=True)
+    @cost('Flow rate', CE=bst.settings.CEPCI, cost=1, n=0.6, lb=2, ub=10, units='kg/hr', BM=2.)
+    class A(bst.Unit): pass
+    
+    feed = bst.Stream('feed', Water=1, units='kg/hr')
+    A1 = A('A1', ins=feed)
+    flow_rates = np.array([1., 5., 20.])
+    purchase_costs, kW = cost_items_at_design(A1, {'Flow rate': flow_rates})
+    expected = []
+    for flow_rate in flow_rates:
+        feed.imass['Water'] = flow_rate
+        A1.simulate()
+        expected.append(A1.purchase_cost)
+    assert_allclose(purchase_costs['A'], expected)
+    
+    from biorefineries.cane import create_sugarcane_chemicals
+    bst.settings.set_thermo(create_sugarcane_chemicals())
+    feed = bst.Stream('feed',
+                      Water=1.20e+05,
+                      Glucose=1.89e+03,
+                      Sucrose=2.14e+04,
+                      DryYeast=1.03e+04,
+                      units='kg/hr',
+                      T=32+273.15)
+    F1 = bst.NRELFermentation('F1', ins=feed, outs=('CO2', 'product'), tau=8, N=8)
+    F1.simulate()
+    N, capital_cost = F1.capital_cost_curve(np.arange(2, 12))
+    expected = []
+    for i in N:
+        F1.N = None
+        F1.N = i
+        F1.simulate()
+        expected.append(F1.purchase_cost)
+    assert_allclose(capital_cost, expected)
+    F1.autoselect_N = True
+    F1.simulate()
+    assert F1.design_results['Number of reactors'] == N[np.argmin(capital_cost)]
+    
+def test_compiled_cost_items():
+    from biosteam.units.decorators import cost, evaluate_cost_items
+    bst.settings.set_thermo(['Water'], cache=True)
+    @cost('Flow rate', 'Bounded', CE=bst.settings.CEPCI, cost=1, n=0.6, lb=2, ub=10, kW=1)
+    @cost('Flow rate', 'Parallel', CE=500, cost=2, n=0.7, kW=0.5, N='Number of units')
+    @cost('Flow rate', 'Custom', CE=500, f=lambda S: 3 * S ** 0.5)
+    @cost('Flow rate', 'Conditional', CE=500, cost=4, n=0.5, condition=lambda: False, units='kg/hr')
+    class A(bst.Unit):
+        N_units = 3
+        
+        def _design(self):
+            self._decorated_design()
+            self.design_results['Number of units'] = self.N_units
+    
+    feed = bst.Stream('feed', Water=1, units='kg/hr')
+    A1 = A('A1', ins=feed)
+    A1.simulate()
+    flow_rates = np.array([1., 5., 20.])
+    purchase_costs, parallel, kW = evaluate_cost_items(A1, {'Flow rate': flow_rates})
+    for j, flow_rate in enumerate(flow_rates):
+        feed.imass['Water'] = flow_rate
+        A1.simulate()
+        for i, C in A1.baseline_purchase_costs.items():
+            N = A1.parallel.get(i, 1)
+            assert_allclose(purchase_costs[i][j] * N, C)
+            if i in A1.parallel: assert parallel[i][j] == N
+        assert_allclose(kW[j], A1.power_utility.rate)
+    assert 'Conditional' not in A1.baseline_purchase_costs
+    assert (purchase_costs['Conditional'] == 0).all()
+    
+    # Compiled cost items are only updated when their cost items change
+    from biosteam.units.decorators import compile_cost_items, CostItem
+    compiled = compile_cost_items(A1)
+    assert compile_cost_items(A1) is compiled
+    item = A.cost_items['Parallel']
+    item.copy()
+    CostItem('Flow rate', 'kg/hr', 1, None, None, 500, 1, 0.6, None, None, None, None, None)
+    assert compile_cost_items(A1) is compiled
+    item.cost = 4
+    assert compile_cost_items(A1) is not compiled
+    A1.simulate()
+    expected = 3 * 4 * bst.CE / 500 * 20 ** 0.7
+    assert_allclose(A1.baseline_purchase_costs['Parallel'], expected)
+    purchase_costs, parallel, kW = evaluate_cost_items(A1, {'Flow rate': 20.})
+    assert_allclose(purchase_costs['Parallel'] * parallel['Parallel'], expected)
+    
+    # Number of parallel units is not truncated
+    A1.N_units = 2.5
+    A1.simulate()
+    assert A1.parallel['Parallel'] == 2.5
+    purchase_costs, parallel, kW = evaluate_cost_items(A1, {'Flow rate': 20.})
+    assert parallel['Parallel'] == 2.5
+    
 def test_equipment_lifetimes():
     from biorefineries.sugarcane import create_tea
     bst.settings.set_thermo(['Water'], cache=True)
@@ -416,5 +509,7 @@ if __name__ == '__main__':
     test_unit_connections()
     test_unit_graphics()
     test_cost_decorator()
+    test_cost_items_at_design()
+    test_compiled_cost_items()
     test_equipment_lifetimes()
     test_skipping_unit_simulation_with_empty_inlet_streams()
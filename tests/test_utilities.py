@@ -53,6 +53,50 @@ def test_power_util_sum():
     )
     pass
 
+def test_cached_system_results():
+    bst.settings.set_thermo(['Water', 'Ethanol'], cache=True)
+    feed = bst.Stream('feed', Water=100, Ethanol=10, price=0.1)
+    P1 = bst.Pump('P1', ins=feed, P=5e5)
+    H1 = bst.HXutility('H1', ins=P1-0, T=350)
+    sys = bst.System.from_units('sys', [P1, H1], operating_hours=8000)
+    H1.outs[0].price = 0.5
+    sys.simulate()
+    results = sys.get_results()
+    assert sys.heat_utilities is sys.heat_utilities
+    assert isinstance(sys.heat_utilities, tuple) # Cached results are read-only
+    assert sys.get_results() is results
+    assert allclose(sys.material_cost, 8000 * feed.cost)
+    assert allclose(sys.sales, 8000 * H1.outs[0].cost)
+    assert allclose(sys.purchase_cost, P1.purchase_cost + H1.purchase_cost)
+    assert allclose(sys.power_utility.rate, P1.power_utility.rate)
+    assert allclose(sys.heat_utilities[0].duty, H1.heat_utilities[0].duty)
+    
+    # Prices are not cached
+    feed.price = 0.2
+    assert allclose(sys.material_cost, 8000 * feed.cost)
+    
+    # Flow rates are not cached
+    feed.F_mass *= 2
+    assert sys.get_results() is results
+    assert allclose(sys.material_cost, 8000 * feed.cost)
+    feed.F_mass /= 2
+    
+    # Results are invalidated after simulation
+    feed.F_mass *= 2
+    sys.simulate()
+    assert sys.get_results() is not results
+    assert allclose(sys.material_cost, 8000 * feed.cost)
+    assert allclose(sys.heat_utilities[0].duty, H1.heat_utilities[0].duty)
+    
+    # Results are invalidated after any unit is redesigned
+    results = sys.get_results()
+    H1.T = 360
+    H1.simulate()
+    assert sys.get_results() is not results
+    assert allclose(sys.heat_utilities[0].duty, H1.heat_utilities[0].duty)
+    bst.main_flowsheet.clear()
+
 if __name__ == '__main__':
     test_heat_util_sum()
-    test_power_util_sum()
\ No newline at end of file
+    test_power_util_sum()
+    test_cached_system_results()
\ No newline at end of file
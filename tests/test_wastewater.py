@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020-2023, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import pytest
+import biosteam as bst
+import thermosteam as tmo
+import numpy as np
+from numpy.testing import assert_allclose
+from biosteam.wastewater.high_rate import InternalCirculationRx, utils
+
+# Qi, Si, Xi, Qe, Se, Vliq, Y, mu_max, b, Fxb, Fxt
+feasible_ICRx_parameters = [
+    (481.2120248952555, 18.225693285247687, 0.33281979884326574, 449.32757117061635,
+     2.1645840730392383, 1875.2195765701817, 0.14603022366486101, 0.031890575105969515,
+     0.004952945521168898, 0.020828147770640706, 0.08306268989976665),
+    (324.2508028782937, 2.5644073172472015, 1.532500107477262, 308.7879472212956, 
+     1.135150602628306, 188.48991367137427, 0.11659497167790613, 0.0386036209258135,
+     0.008531377092702326, 0.0022213046707781014, 0.05104256289616074),
+    (144.28371042072195, 9.35080896390221, 2.1596313539927974, 138.41095543683113,
+     2.5355226488928864, 704.7821330255568, 0.12126296222080493, 0.01111192463861567,
+     0.0031867276993249403, 0.009892311276262633, 0.07458442441567521),
+]
+infeasible_ICRx_parameters = (
+    100., 1., 1., 90., 5., 100., 0.1, 0.01, 0.001, 0.01, 0.05 # Se > Si
+)
+
+def test_internal_circulation_rx_closed_form():
+    pytest.importorskip('sympy')
+    solve = InternalCirculationRx.solve_separate
+    solve_symbolically = InternalCirculationRx._solve_separate_symbolically
+    for parameters in feasible_ICRx_parameters:
+        expected = [float(i) for i in solve_symbolically(parameters)]
+        assert_allclose(solve(*parameters), expected, rtol=1e-8)
+    assert np.isnan(solve(*infeasible_ICRx_parameters)).all()
+    with pytest.raises(bst.exceptions.DesignError):
+        solve_symbolically(infeasible_ICRx_parameters)
+    
+    # Batches of parameters give the same results as single evaluations
+    parameters = np.array([*feasible_ICRx_parameters, infeasible_ICRx_parameters])
+    batch = np.array(solve(*parameters.T))
+    for i, row in enumerate(parameters):
+        assert_allclose(batch[:, i], solve(*row), rtol=1e-12)
+    
+def test_cached_digestion_stoichiometry():
+    chemicals = tmo.Chemicals(
+        ['Water', 'Glucose', 'Ethanol', 'AceticAcid', 'CO2', 'CH4', 'O2',
+         'NH3', 'H2S', 'H2SO4', 'N2'], cache=True
+    )
+    chemicals.append(
+        tmo.Chemical('P4O10', phase='s', default=True)
+    )
+    chemicals.append(
+        tmo.Chemical('WWTsludge', search_db=False, phase='s', default=True,
+                     formula='CH1.64O0.39N0.23S0.0035', Hf=-23200.01*4.184)
+    )
+    chemicals.compile()
+    bst.settings.set_thermo(chemicals)
+    stream = bst.Stream(Water=1e5, Glucose=800, Ethanol=50, AceticAcid=40,
+                        WWTsludge=20, units='kg/hr')
+    iCOD, index, BMP = utils.get_digestion_stoichiometry(chemicals)
+    assert utils.get_digestion_stoichiometry(chemicals)[0] is iCOD
+    COD = sum([-utils.get_COD_stoichiometry(i)['O2'] * stream.imol[i.ID]
+               for i in chemicals]) * 32 / stream.F_vol
+    assert_allclose(utils.compute_stream_COD(stream), COD, rtol=1e-3)
+    assert [chemicals.IDs[i] for i in index] == ['Glucose', 'Ethanol', 'AceticAcid']
+    assert_allclose(BMP[0, chemicals.indices(['Glucose', 'CH4', 'CO2'])], [-1, 3, 3])
+    
+    # Conversions are rescaled without recomputing stoichiometry
+    BD = {'Glucose': 1., 'Ethanol': 0.5}
+    biogas_rxns = utils.get_digestion_rxns(stream, BD, 0.86, 0., 'WWTsludge')
+    growth_rxns = utils.get_digestion_rxns(stream, BD, 0., 0.05, 'WWTsludge')
+    # Non-biodegradable chemicals are excluded
+    assert biogas_rxns.reactants == growth_rxns.reactants == ('Glucose', 'Ethanol')
+    assert_allclose(biogas_rxns.X, [0.86, 0.43])
+    assert_allclose(growth_rxns.X, [0.05, 0.025])
+    reacted = stream.copy()
+    biogas_rxns(reacted)
+    expected = stream.copy()
+    glucose = tmo.Reaction('Glucose -> 3CH4 + 3CO2', 'Glucose', 0.86)
+    ethanol = tmo.Reaction('Ethanol -> 1.5CH4 + 0.5CO2', 'Ethanol', 0.43,
+                           check_atomic_balance=False)
+    tmo.ParallelReaction([glucose, ethanol])(expected)
+    assert_allclose(reacted.mol, expected.mol)
+    reacted = stream.copy()
+    growth_rxns(reacted)
+    assert_allclose(
+        reacted.imass['WWTsludge'] - stream.imass['WWTsludge'],
+        stream.imass['Glucose'] * 0.05 + stream.imass['Ethanol'] * 0.025
+    )
+    assert utils.get_digestion_rxns(stream, 1., 0.5, 0.5, 'WWTsludge').X.size == 6
+    
+    # No reactions are returned unless there is more than one
+    assert utils.get_digestion_rxns(stream, {'Glucose': 1.}, 0.86, 0., 'WWTsludge') == []
+    
+    # Cached reactions are not modified
+    assert_allclose(utils.get_digestion_rxns(stream, BD, 0.86, 0., 'WWTsludge').X, [0.86, 0.43])
+    
+if __name__ == '__main__':
+    test_internal_circulation_rx_closed_form()
+    test_cached_digestion_stoichiometry()